@@ -0,0 +1,170 @@
+"""Full-size PokeAPI payloads for benchmarks.
+
+The documents are generated deterministically rather than downloaded, with the
+same structure and roughly the same size as real PokeAPI v2 responses for a
+Pokemon with a long move list (e.g. pikachu): every move lists its details in
+most version groups, and the sprite tree includes every generation and game.
+"""
+
+import random
+from typing import Any, Dict, List
+
+API = "https://pokeapi.co/api/v2"
+SPRITES = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon"
+
+VERSION_GROUPS = [
+    "red-blue",
+    "yellow",
+    "gold-silver",
+    "crystal",
+    "ruby-sapphire",
+    "emerald",
+    "firered-leafgreen",
+    "diamond-pearl",
+    "platinum",
+    "heartgold-soulsilver",
+    "black-white",
+    "black-2-white-2",
+    "x-y",
+    "omega-ruby-alpha-sapphire",
+    "sun-moon",
+    "ultra-sun-ultra-moon",
+    "lets-go-pikachu-lets-go-eevee",
+    "sword-shield",
+    "brilliant-diamond-and-shining-pearl",
+    "scarlet-violet",
+]
+
+SPRITE_VERSIONS = {
+    "generation-i": ["red-blue", "yellow"],
+    "generation-ii": ["crystal", "gold", "silver"],
+    "generation-iii": ["emerald", "firered-leafgreen", "ruby-sapphire"],
+    "generation-iv": ["diamond-pearl", "heartgold-soulsilver", "platinum"],
+    "generation-v": ["black-white"],
+    "generation-vi": ["omegaruby-alphasapphire", "x-y"],
+    "generation-vii": ["icons", "ultra-sun-ultra-moon"],
+    "generation-viii": ["icons"],
+}
+
+LEARN_METHODS = ["level-up", "machine", "tutor", "egg"]
+TYPES = ["normal", "fire", "water", "grass", "electric", "ice", "fighting"]
+LANGUAGES = ["en", "ja", "fr", "de", "es", "it", "ko", "zh-Hans"]
+STATS = ["hp", "attack", "defense", "special-attack", "special-defense", "speed"]
+
+
+def _resource(kind: str, name: str, index: int) -> Dict[str, str]:
+    return {"name": name, "url": f"{API}/{kind}/{index}/"}
+
+
+def _sprite_set(dex: int, variant: str) -> Dict[str, Any]:
+    return {
+        f"{direction}_{kind}": f"{SPRITES}/{variant}/{dex}.png"
+        for direction in ("back", "front")
+        for kind in ("default", "female", "shiny", "shiny_female")
+    }
+
+
+def pokemon_payload(dex: int, moves: int = 100) -> Dict[str, Any]:
+    """Returns a pokemon document shaped like PokeAPI's /pokemon/{dex}."""
+    rng = random.Random(dex)
+
+    move_list: List[Dict[str, Any]] = []
+    for move_index in rng.sample(range(1, 900), moves):
+        details = []
+        for group_index, group in enumerate(VERSION_GROUPS):
+            if rng.random() < 0.3:
+                continue
+            method = rng.choice(LEARN_METHODS)
+            details.append(
+                {
+                    "level_learned_at": (
+                        rng.randint(1, 60) if method == "level-up" else 0
+                    ),
+                    "move_learn_method": _resource(
+                        "move-learn-method", method, LEARN_METHODS.index(method) + 1
+                    ),
+                    "version_group": _resource("version-group", group, group_index + 1),
+                }
+            )
+        move_list.append(
+            {
+                "move": _resource("move", f"move-{move_index}", move_index),
+                "version_group_details": details,
+            }
+        )
+
+    sprites: Dict[str, Any] = _sprite_set(dex, "")
+    sprites["other"] = {
+        group: _sprite_set(dex, f"other/{group}")
+        for group in ("dream_world", "home", "official-artwork", "showdown")
+    }
+    sprites["versions"] = {
+        generation: {
+            game: _sprite_set(dex, f"versions/{generation}/{game}") for game in games
+        }
+        for generation, games in SPRITE_VERSIONS.items()
+    }
+    sprites["versions"]["generation-v"]["black-white"]["animated"] = _sprite_set(
+        dex, "versions/generation-v/black-white/animated"
+    )
+
+    types = rng.sample(TYPES, 2)
+
+    return {
+        "id": dex,
+        "name": f"pokemon-{dex}",
+        "base_experience": rng.randint(50, 300),
+        "height": rng.randint(1, 30),
+        "weight": rng.randint(10, 1000),
+        "is_default": True,
+        "order": dex,
+        "location_area_encounters": f"{API}/pokemon/{dex}/encounters",
+        "abilities": [
+            {
+                "ability": _resource("ability", f"ability-{dex}-{slot}", slot),
+                "is_hidden": slot == 3,
+                "slot": slot,
+            }
+            for slot in (1, 3)
+        ],
+        "forms": [_resource("pokemon-form", f"pokemon-{dex}", dex)],
+        "game_indices": [
+            {"game_index": dex, "version": _resource("version", group, index + 1)}
+            for index, group in enumerate(VERSION_GROUPS)
+        ],
+        "held_items": [],
+        "moves": move_list,
+        "species": _resource("pokemon-species", f"pokemon-{dex}", dex),
+        "sprites": sprites,
+        "stats": [
+            {
+                "base_stat": rng.randint(20, 160),
+                "effort": 0,
+                "stat": _resource("stat", stat, index + 1),
+            }
+            for index, stat in enumerate(STATS)
+        ],
+        "types": [
+            {"slot": slot + 1, "type": _resource("type", type_, TYPES.index(type_))}
+            for slot, type_ in enumerate(types)
+        ],
+        "past_types": [],
+    }
+
+
+def species_payload(dex: int) -> Dict[str, Any]:
+    """Returns a species document shaped like PokeAPI's
+    /pokemon-species/{dex}."""
+    return {
+        "id": dex,
+        "name": f"pokemon-{dex}",
+        "flavor_text_entries": [
+            {
+                "flavor_text": f"Description of pokemon {dex} in {group} ({language}).",
+                "language": _resource("language", language, index + 1),
+                "version": _resource("version", group, group_index + 1),
+            }
+            for group_index, group in enumerate(VERSION_GROUPS)
+            for index, language in enumerate(LANGUAGES)
+        ],
+    }
@@ -0,0 +1,211 @@
+"""Benchmarks for pypokedex's fetch, parse and query hot paths.
+
+Run from the repository root with:
+
+    python -m benchmarks.run [--output results.json] [--repeat N]
+
+Results are printed (or written) as JSON so they can be compared across
+releases. Network benchmarks run against a local server (see server.py), so
+they measure pypokedex's own overhead rather than PokeAPI's latency.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import pypokedex
+from pypokedex.cache import deep_getsizeof
+from pypokedex.client import Client, get_client, set_client
+from pypokedex.parsing import dumps, loads, prune_pokemon
+from pypokedex.pokemon import Pokemon
+
+from benchmarks.payloads import pokemon_payload
+from benchmarks.server import MockPokeAPI
+
+
+def _timings(function: Callable[[], Any], repeat: int, number: int = 1) -> Dict:
+    """Times `number` calls of function, `repeat` times, and returns per-call
+    statistics in seconds."""
+    runs: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        runs.append((time.perf_counter() - start) / number)
+
+    return {
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "mean": statistics.mean(runs),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def bench_import(repeat: int) -> Dict[str, Dict]:
+    """Times cold imports in fresh interpreters, net of the interpreter's own
+    startup time."""
+
+    def run(code: str) -> Callable[[], Any]:
+        return lambda: subprocess.run([sys.executable, "-c", code], check=True)
+
+    startup = _timings(run("pass"), repeat)["median"]
+    results = {}
+    for name, code in [
+        ("import_pypokedex", "import pypokedex"),
+        ("import_get", "import pypokedex; pypokedex.get"),
+    ]:
+        timings = _timings(run(code), repeat)
+        timings["net_median"] = max(0.0, timings["median"] - startup)
+        results[name] = timings
+
+    return results
+
+
+def bench_parse(repeat: int) -> Dict[str, Dict]:
+    payload = pokemon_payload(25)
+    body = dumps(payload)
+    sprites = {
+        key: value
+        for key, value in payload["sprites"].items()
+        if key not in ("other", "versions")
+    }
+
+    def construct() -> Pokemon:
+        return Pokemon(prune_pokemon(loads(body)))
+
+    def construct_and_parse() -> None:
+        pokemon = construct()
+        pokemon.moves  # pylint: disable=pointless-statement
+        pokemon.version_sprites  # pylint: disable=pointless-statement
+
+    pokemon = construct()
+    game = next(iter(pokemon.moves))
+    move = pokemon.moves[game][-1].name
+
+    return {
+        "decode": _timings(lambda: loads(body), repeat, 20),
+        "construct_lazy": _timings(construct, repeat, 20),
+        "construct_and_parse": _timings(construct_and_parse, repeat, 20),
+        "extract_sprites": _timings(
+            lambda: Pokemon._extract_sprites(sprites),  # pylint: disable=W0212
+            repeat,
+            1000,
+        ),
+        "learns": _timings(lambda: pokemon.learns(move, game), repeat, 10000),
+        "learnable_in": _timings(lambda: pokemon.learnable_in(move), repeat, 10000),
+    }
+
+
+def bench_serialization(repeat: int) -> Dict[str, Dict]:
+    body = dumps(pokemon_payload(25))
+    pokemon = Pokemon(prune_pokemon(loads(body)))
+    serialized = pokemon.to_bytes()
+
+    return {
+        "to_bytes": _timings(pokemon.to_bytes, repeat, 20),
+        "from_bytes": _timings(lambda: Pokemon.from_bytes(serialized), repeat, 20),
+        "sizes": {"json_bytes": len(body), "serialized_bytes": len(serialized)},
+    }
+
+
+def bench_memory() -> Dict[str, Dict]:
+    count = 50
+    bodies = [dumps(pokemon_payload(dex)) for dex in range(1, count + 1)]
+
+    results = {}
+    for name, parse in [("lazy", False), ("parsed", True)]:
+        gc.collect()
+        tracemalloc.start()
+        pokemon = [Pokemon(prune_pokemon(loads(body))) for body in bodies]
+        if parse:
+            for current in pokemon:
+                current.moves  # pylint: disable=pointless-statement
+                current.sprites  # pylint: disable=pointless-statement
+        gc.collect()
+        allocated, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[name] = {
+            "traced_bytes_per_pokemon": allocated // count,
+            "deep_getsizeof_per_pokemon": sum(map(deep_getsizeof, pokemon)) // count,
+        }
+
+    return results
+
+
+def bench_network(repeat: int, batch_size: int, workers: int) -> Dict[str, Dict]:
+    previous_client = get_client()
+
+    with MockPokeAPI() as server:
+        set_client(Client(session=server.session(pool_size=workers)))
+        try:
+
+            def cold_fetch() -> None:
+                pypokedex.get.cache_clear()
+                pypokedex.get(dex=25)
+
+            pypokedex.get.cache_clear()
+            pypokedex.get(dex=25)
+            warm_hit = _timings(lambda: pypokedex.get(dex=25), repeat, 10000)
+
+            cold = _timings(cold_fetch, repeat, 5)
+
+            def batch() -> None:
+                pypokedex.get.cache_clear()
+                results = pypokedex.get_many(
+                    dex=range(1, batch_size + 1), workers=workers
+                )
+                assert all(result.error is None for result in results)
+
+            batch_timings = _timings(batch, max(1, repeat // 2))
+            batch_timings["pokemon_per_second"] = batch_size / batch_timings["median"]
+            batch_timings["batch_size"] = batch_size
+            batch_timings["workers"] = workers
+        finally:
+            set_client(previous_client)
+            pypokedex.get.cache_clear()
+
+    return {"cold_fetch": cold, "warm_cache_hit": warm_hit, "batch": batch_timings}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").partition("\n")[0])
+    parser.add_argument("--output", help="file to write results to (default: stdout)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=16)
+    args = parser.parse_args(argv)
+
+    results = {
+        "pypokedex_version": pypokedex.__version__,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "benchmarks": {
+            "import": bench_import(args.repeat),
+            "parse": bench_parse(args.repeat),
+            "serialization": bench_serialization(args.repeat),
+            "memory": bench_memory(),
+            "network": bench_network(args.repeat, args.batch_size, args.workers),
+        },
+    }
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
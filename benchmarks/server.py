@@ -0,0 +1,81 @@
+"""A local HTTP server standing in for PokeAPI during benchmarks."""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from benchmarks.payloads import pokemon_payload, species_payload
+
+_ROUTE = re.compile(r"^/api/v2/(pokemon|pokemon-species)/(\d+)/?$")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    bodies: Dict[Tuple[str, int], bytes] = {}
+
+    def do_GET(self) -> None:  # noqa: N802
+        match = _ROUTE.match(self.path)
+        if match is None:
+            self.send_error(404)
+            return
+
+        kind, dex = match.group(1), int(match.group(2))
+        body = self.bodies.get((kind, dex))
+        if body is None:
+            payload = (
+                pokemon_payload(dex) if kind == "pokemon" else species_payload(dex)
+            )
+            body = self.bodies[(kind, dex)] = json.dumps(payload).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:  # pylint: disable=redefined-builtin
+        pass
+
+
+class _RedirectAdapter(HTTPAdapter):
+    """Sends requests meant for PokeAPI to the local server instead."""
+
+    def __init__(self, base_url: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._base_url = base_url
+
+    def send(self, request, *args, **kwargs):  # pylint: disable=arguments-differ
+        request.url = request.url.replace("https://pokeapi.co", self._base_url, 1)
+        return super().send(request, *args, **kwargs)
+
+
+class MockPokeAPI:
+    """Serves generated payloads on localhost for as long as it is open."""
+
+    def __init__(self) -> None:
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        host, port = self._server.server_address[:2]
+        self.base_url = f"http://{host}:{port}"
+
+    def __enter__(self) -> "MockPokeAPI":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def session(self, pool_size: int = 16) -> requests.Session:
+        session = requests.Session()
+        adapter = _RedirectAdapter(
+            self.base_url, pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        session.mount("https://pokeapi.co", adapter)
+        return session
@@ -1,5 +1,58 @@
-from pypokedex.api import get
-from pypokedex.pokemon import Ability, BaseStats, Move, Pokemon, Sprites
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
 
 __version__ = "1.6.0"
-__all__ = ["get", "Pokemon", "BaseStats", "Ability", "Sprites", "Move"]
+__all__ = [
+    "get",
+    "get_many",
+    "iter_many",
+    "BatchResult",
+    "Pokemon",
+    "BaseStats",
+    "Ability",
+    "Sprites",
+    "Move",
+]
+
+# The public API (and submodules like pypokedex.api) are only imported when
+# they are first accessed, so that importing pypokedex stays fast for tools
+# that only use part of it (see benchmarks.run's import benchmark)
+_EXPORTS = {
+    "get": "pypokedex.api",
+    "get_many": "pypokedex.batch",
+    "iter_many": "pypokedex.batch",
+    "BatchResult": "pypokedex.batch",
+    "Pokemon": "pypokedex.pokemon",
+    "BaseStats": "pypokedex.pokemon",
+    "Ability": "pypokedex.pokemon",
+    "Sprites": "pypokedex.pokemon",
+    "Move": "pypokedex.pokemon",
+}
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypokedex.api import get
+    from pypokedex.batch import BatchResult, get_many, iter_many
+    from pypokedex.pokemon import Ability, BaseStats, Move, Pokemon, Sprites
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name]), name)
+    elif not name.startswith("_"):
+        try:
+            value = import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,5 @@
+import sys
+
+from pypokedex.cli import main
+
+sys.exit(main())
@@ -0,0 +1,26 @@
+"""Optional NumPy support shared by the modules with a NumPy backend.
+
+numpy is None at runtime when NumPy isn't installed; code using it must first
+check use_numpy, which resolve_use_numpy only makes True when it is installed.
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+from pypokedex.exceptions import PyPokedexError
+
+if TYPE_CHECKING:
+    import numpy
+else:
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        numpy = None
+
+
+def resolve_use_numpy(use_numpy: Optional[bool]) -> bool:
+    """Returns whether to use NumPy, defaulting to whether it is installed."""
+    if use_numpy is None:
+        return numpy is not None
+    if use_numpy and numpy is None:  # pragma: no cover
+        raise PyPokedexError("NumPy is not installed!")
+    return use_numpy
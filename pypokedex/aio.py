@@ -0,0 +1,272 @@
+"""Asynchronous counterparts of pypokedex.get() and Pokemon.get_descriptions().
+
+Requires the optional httpx dependency (pip install pypokedex[async]).
+"""
+
+import asyncio
+import functools
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    TypeVar,
+)
+from weakref import WeakKeyDictionary
+
+from pypokedex import api, instrumentation
+from pypokedex.client import (
+    decode_json,
+    emit_error,
+    endpoint_of,
+    http_error,
+    get_disk_cache,
+    lookup_disk_cache,
+    revalidated_body,
+    store_response,
+)
+from pypokedex.constants import POKEAPI_BASE_URL, POKEAPI_SPECIES_URL
+from pypokedex.exceptions import PyPokedexError, PyPokedexHTTPError
+from pypokedex.parsing import prune_pokemon
+from pypokedex.pokemon import Pokemon
+from pypokedex.ratelimit import TokenBucket
+from pypokedex.retry import RetryPolicy
+from pypokedex.snapshot import get_snapshot
+
+if TYPE_CHECKING:
+    import httpx
+else:
+    try:
+        import httpx
+    except ImportError:  # pragma: no cover
+        httpx = None
+
+T = TypeVar("T")
+
+
+class AsyncClient:
+    """The asynchronous HTTP client every pypokedex.aio request goes through.
+
+    By default, a pooled httpx.AsyncClient is created. A preconfigured one can
+    be passed in instead, in which case pool_size is ignored. Retries and rate
+    limiting work as in pypokedex.client.Client, and a rate_limiter can be
+    shared between both.
+    """
+
+    def __init__(
+        self,
+        client: "Optional[httpx.AsyncClient]" = None,
+        timeout: Optional[float] = 3,
+        pool_size: int = 10,
+        retries: int = 2,
+        backoff_factor: float = 0.5,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ) -> None:
+        if httpx is None:  # pragma: no cover
+            raise PyPokedexError(
+                "pypokedex.aio requires httpx (pip install pypokedex[async])!"
+            )
+
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy(retries, backoff_factor)
+        self.rate_limiter = rate_limiter
+
+        if client is None:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=pool_size, max_keepalive_connections=pool_size
+                )
+            )
+
+        self.client = client
+
+    async def get(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> "httpx.Response":
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+
+            try:
+                response = await self.client.get(
+                    url, headers=headers, timeout=self.timeout
+                )
+            except httpx.TransportError as error:
+                if not self.retry_policy.should_retry(attempt):
+                    raise
+                _emit_retry(url, error=type(error).__name__)
+                await asyncio.sleep(self.retry_policy.delay(attempt))
+            else:
+                if not self.retry_policy.should_retry(attempt, response.status_code):
+                    return response
+                _emit_retry(url, status_code=response.status_code)
+                await asyncio.sleep(
+                    self.retry_policy.delay(
+                        attempt, response.headers.get("Retry-After")
+                    )
+                )
+
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+def _emit_retry(url: str, **attributes: Any) -> None:
+    instrumentation.emit(
+        "retry", attributes={"endpoint": endpoint_of(url), **attributes}
+    )
+
+
+_client: Optional[AsyncClient] = None
+
+# In-flight requests are tracked per event loop, since futures can't be shared
+# between loops
+InFlight = Dict[Hashable, "asyncio.Future[Any]"]
+_in_flight: "WeakKeyDictionary[asyncio.AbstractEventLoop, InFlight]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_client() -> AsyncClient:
+    """Returns the client used for every asynchronous request to PokeAPI,
+    creating a default one on first use."""
+    global _client  # pylint: disable=global-statement
+    if _client is None:
+        _client = AsyncClient()
+    return _client
+
+
+def set_client(client: AsyncClient) -> None:
+    """Replaces the client used for every asynchronous request to PokeAPI."""
+    global _client  # pylint: disable=global-statement
+    _client = client
+
+
+async def _single_flight(key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Runs fetch() once for any number of concurrent callers sharing a key."""
+    in_flight = _in_flight.setdefault(asyncio.get_running_loop(), {})
+
+    if key in in_flight:
+        return await asyncio.shield(in_flight[key])
+
+    future = asyncio.ensure_future(fetch())
+    in_flight[key] = future
+    try:
+        return await asyncio.shield(future)
+    finally:
+        if in_flight.get(key) is future:
+            del in_flight[key]
+
+
+async def _in_thread(function: Callable[..., T], *args: Any) -> T:
+    """Runs a blocking function (e.g. an on-disk cache lookup) in the event
+    loop's default executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(function, *args))
+
+
+async def _with_disk_cache(function: Callable[..., T], *args: Any) -> T:
+    """Runs one of pypokedex.client's on-disk cache helpers, in a thread only
+    when an on-disk cache is enabled (otherwise it returns right away)."""
+    if get_disk_cache() is None:
+        return function(*args)
+    return await _in_thread(function, *args)
+
+
+async def fetch_json(url: str, not_found_message: Optional[str] = None) -> Any:
+    """Fetches and decodes the JSON document at url, going through the on-disk
+    cache (see pypokedex.client.set_disk_cache) if one is enabled."""
+    endpoint = endpoint_of(url)
+    lookup = await _with_disk_cache(lookup_disk_cache, url, endpoint)
+    if lookup.fresh_body is not None:
+        return decode_json(lookup.fresh_body, endpoint)
+
+    try:
+        with instrumentation.timed("request", endpoint=endpoint, url=url) as request:
+            response = await get_client().get(url, headers=lookup.headers)
+            request["status_code"] = response.status_code
+    except httpx.HTTPError as error:
+        emit_error(endpoint, error=type(error).__name__)
+        raise PyPokedexError("An internal httpx exception occurred!") from error
+
+    body = await _with_disk_cache(
+        revalidated_body, url, lookup.stale, response.status_code
+    )
+    if body is not None:
+        return decode_json(body, endpoint)
+
+    if response.is_error:
+        emit_error(endpoint, status_code=response.status_code)
+        raise http_error(response.status_code, not_found_message)
+
+    await _with_disk_cache(store_response, url, response.content, response.headers)
+    return decode_json(response.content, endpoint)
+
+
+async def get(**kwargs) -> Pokemon:
+    """Asynchronous version of pypokedex.get(), sharing the same cache."""
+    subpage = api.subpage_for(kwargs)
+
+    cached = api.get_cache().get(subpage)
+    instrumentation.cache_lookup("memory", "pokemon", cached is not None)
+    if cached is not None:
+        return cached
+
+    api.raise_if_not_found(subpage)
+
+    async def fetch() -> Pokemon:
+        snapshot = get_snapshot()
+        json_data = None
+        if snapshot is not None:
+            json_data = snapshot.pokemon_json(subpage)
+            instrumentation.cache_lookup("snapshot", "pokemon", json_data is not None)
+
+        if json_data is None:
+            try:
+                json_data = prune_pokemon(
+                    await fetch_json(
+                        f"{POKEAPI_BASE_URL}/{subpage}",
+                        "The requested pokemon was not found!",
+                    )
+                )
+            except PyPokedexHTTPError as error:
+                api.remember_not_found(subpage, error)
+                raise
+
+        with instrumentation.timed("parse", endpoint="pokemon"):
+            pokemon = Pokemon(json_data)
+
+        api.get_cache().set(pokemon.dex, pokemon, aliases=[pokemon.name, subpage])
+        return pokemon
+
+    return await _single_flight(("pokemon", subpage), fetch)
+
+
+async def get_descriptions(pokemon: Pokemon, language="en") -> Dict[str, str]:
+    """Asynchronous version of Pokemon.get_descriptions(). The species data is
+    stored on the Pokemon, so later calls (async or not) don't fetch it
+    again."""
+    # pylint: disable=protected-access
+    if pokemon._descriptions is None:
+        snapshot = get_snapshot()
+        species = None
+        if snapshot is not None:
+            species = snapshot.species_json(pokemon.dex)
+            instrumentation.cache_lookup(
+                "snapshot", "pokemon-species", species is not None
+            )
+
+        if species is None:
+            url = f"{POKEAPI_SPECIES_URL}/{pokemon.dex}"
+            species = await _single_flight(("species", url), lambda: fetch_json(url))
+
+        with instrumentation.timed("parse", endpoint="pokemon-species"):
+            pokemon._load_descriptions(species)
+
+    return pokemon.get_descriptions(language)
@@ -1,44 +1,156 @@
-# pyright: reportUnboundVariable=false
+import functools
+from typing import Any, Callable, Dict, Optional, Union
 
-from functools import lru_cache
-from typing import Union
+from pypokedex import instrumentation
+from pypokedex.cache import Cache, CacheInfo, SingleFlight
+from pypokedex.client import fetch_json
+from pypokedex.constants import POKEAPI_BASE_URL
+from pypokedex.exceptions import PyPokedexHTTPError
+from pypokedex.names import get_name_index
+from pypokedex.parsing import prune_pokemon
+from pypokedex.pokemon import Pokemon, set_parse_listener
+from pypokedex.snapshot import get_snapshot
 
-import requests
+_cache = Cache()
 
-from pypokedex.constants import POKEAPI_BASE_URL
-from pypokedex.exceptions import PyPokedexError, PyPokedexHTTPError
-from pypokedex.pokemon import Pokemon
+# Names and dex numbers PokeAPI returned a 404 for, mapped to the error message
+_not_found = Cache(maxsize=1024)
+_not_found_ttl: Optional[float] = 60
 
+# Fetches in progress, so that concurrent calls for the same Pokemon share one
+_in_flight = SingleFlight()
 
-@lru_cache(maxsize=None)
-def get(**kwargs) -> Pokemon:
+
+def _resize_cached(pokemon: Pokemon) -> None:
+    # Parsing a Pokemon's moves or sprites makes it larger than it was when it
+    # was cached
+    _cache.resize(pokemon.dex)
+
+
+set_parse_listener(_resize_cached)
+
+
+def get_cache() -> Cache:
+    """Returns the cache currently used by get()."""
+    return _cache
+
+
+def set_cache(cache: Cache) -> None:
+    """Replaces the cache used by get() (e.g. with a different size, memory or
+    TTL limit)."""
+    global _cache  # pylint: disable=global-statement
+    _cache = cache
+
+
+def get_not_found_ttl() -> Optional[float]:
+    return _not_found_ttl
+
+
+def set_not_found_ttl(ttl: Optional[float]) -> None:
+    """Sets for how many seconds names and dex numbers that weren't found are
+    remembered, during which get() raises without making a request (None or 0
+    disables this)."""
+    global _not_found_ttl  # pylint: disable=global-statement
+    _not_found_ttl = ttl
+    if not ttl:
+        _not_found.clear()
+
+
+def raise_if_not_found(subpage: Union[int, str]) -> None:
+    """Raises the 404 error recently returned for subpage, if any."""
+    message = _not_found.get(subpage)
+    if message is not None:
+        instrumentation.cache_lookup("not_found", "pokemon", True)
+        raise PyPokedexHTTPError(message, 404)
+
+
+def remember_not_found(subpage: Union[int, str], error: PyPokedexHTTPError) -> None:
+    if _not_found_ttl and error.http_code == 404:
+        _not_found.set(subpage, str(error), ttl=_not_found_ttl)
+
+
+def subpage_for(kwargs: Dict[str, Any]) -> Union[int, str]:
+    """Validates the arguments passed to get() and returns the canonical
+    PokeAPI subpage for them (the dex number, for names resolved through the
+    name index)."""
     if len(kwargs) != 1:
         raise TypeError("pypokedex.get() expects expects only 1 argument!")
 
-    subpage: Union[int, str]
-
     if "dex" in kwargs and isinstance(kwargs["dex"], int):
-        subpage = kwargs["dex"]
-    elif "name" in kwargs and isinstance(kwargs["name"], str):
-        subpage = kwargs["name"].lower()
-    else:
-        raise TypeError("Arguments were either of an incorrect type or value!")
-
-    try:
-        response = requests.get(f"{POKEAPI_BASE_URL}/{subpage}", timeout=3)
-        response.raise_for_status()
-
-    except requests.exceptions.HTTPError as error:
-        if response.status_code == 404:
-            raise PyPokedexHTTPError(
-                "The requested pokemon was not found!", 404
-            ) from error
-        raise PyPokedexHTTPError(
-            f"An HTTP error occurred! (Status code: {response.status_code})",
-            response.status_code,
-        ) from error
-
-    except requests.exceptions.RequestException as error:
-        raise PyPokedexError("An internal requests exception occurred!") from error
-
-    return Pokemon(response.json())
+        return kwargs["dex"]
+    if "name" in kwargs and isinstance(kwargs["name"], str):
+        name_index = get_name_index()
+        if name_index is not None:
+            return name_index.resolve(kwargs["name"])
+        return kwargs["name"].lower()
+    raise TypeError("Arguments were either of an incorrect type or value!")
+
+
+class CachedGet:
+    """Wraps get() with the cache_clear() and cache_info() methods of the
+    functools.lru_cache based cache it previously used, kept for
+    compatibility."""
+
+    def __init__(self, function: Callable[..., Pokemon]) -> None:
+        self._function = function
+        functools.update_wrapper(self, function)
+
+    def __call__(self, **kwargs: Any) -> Pokemon:
+        return self._function(**kwargs)
+
+    def cache_clear(self) -> None:
+        _cache.clear()
+        _not_found.clear()
+
+    def cache_info(self) -> CacheInfo:
+        return _cache.info()
+
+
+@CachedGet
+def get(**kwargs) -> Pokemon:
+    subpage = subpage_for(kwargs)
+
+    # Pokemon are always stored under their dex number, with their name as an
+    # alias, so that name and dex lookups share a single entry
+    cached = _cache.get(subpage)
+    instrumentation.cache_lookup("memory", "pokemon", cached is not None)
+    if cached is not None:
+        return cached
+
+    raise_if_not_found(subpage)
+
+    def fetch() -> Pokemon:
+        # Another fetch may have completed since the cache was checked
+        if subpage in _cache:
+            return _cache.get(subpage)
+        return _load(subpage)
+
+    # The first caller for a Pokemon fetches it, while any concurrent callers
+    # wait for that fetch instead of making requests of their own
+    return _in_flight.run(subpage, fetch, endpoint="pokemon")
+
+
+def _load(subpage: Union[int, str]) -> Pokemon:
+    snapshot = get_snapshot()
+    json_data = None
+    if snapshot is not None:
+        json_data = snapshot.pokemon_json(subpage)
+        instrumentation.cache_lookup("snapshot", "pokemon", json_data is not None)
+
+    if json_data is None:
+        try:
+            json_data = prune_pokemon(
+                fetch_json(
+                    f"{POKEAPI_BASE_URL}/{subpage}",
+                    "The requested pokemon was not found!",
+                )
+            )
+        except PyPokedexHTTPError as error:
+            remember_not_found(subpage, error)
+            raise
+
+    with instrumentation.timed("parse", endpoint="pokemon"):
+        pokemon = Pokemon(json_data)
+
+    _cache.set(pokemon.dex, pokemon, aliases=[pokemon.name, subpage])
+    return pokemon
@@ -0,0 +1,86 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Union
+
+from pypokedex import api
+from pypokedex.exceptions import PyPokedexError
+from pypokedex.pokemon import Pokemon
+from pypokedex.ratelimit import TokenBucket
+
+Query = Union[int, str]
+
+
+class BatchResult(NamedTuple):
+    query: Query
+    pokemon: Optional[Pokemon]
+    error: Optional[PyPokedexError]
+
+
+def _queries(
+    dex: Optional[Sequence[int]], names: Optional[Sequence[str]]
+) -> List[Query]:
+    if (dex is None) == (names is None):
+        raise TypeError("Exactly one of dex or names must be passed!")
+
+    queries: List[Query] = list(dex) if dex is not None else list(names or [])
+    expected_type = int if dex is not None else str
+
+    if not all(isinstance(query, expected_type) for query in queries):
+        raise TypeError("Arguments were either of an incorrect type or value!")
+
+    return queries
+
+
+def _fetch(query: Query, rate_limiter: Optional[TokenBucket]) -> BatchResult:
+    cache_key = query.lower() if isinstance(query, str) else query
+
+    # Only requests that actually go to the network count against the limit
+    if rate_limiter is not None and cache_key not in api.get_cache():
+        rate_limiter.acquire()
+
+    try:
+        if isinstance(query, str):
+            return BatchResult(query, api.get(name=query), None)
+        return BatchResult(query, api.get(dex=query), None)
+    except PyPokedexError as error:
+        return BatchResult(query, None, error)
+
+
+def iter_many(
+    *,
+    dex: Optional[Sequence[int]] = None,
+    names: Optional[Sequence[str]] = None,
+    workers: int = 8,
+    rate_limit: Optional[float] = None,
+) -> Iterator[BatchResult]:
+    """Fetches several Pokemon concurrently, yielding results as they complete.
+
+    Failed lookups are reported through BatchResult.error instead of aborting
+    the batch. rate_limit caps the number of network requests per second.
+    """
+    queries = _queries(dex, names)
+    rate_limiter = TokenBucket(rate_limit) if rate_limit else None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_fetch, query, rate_limiter) for query in queries]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def get_many(
+    *,
+    dex: Optional[Sequence[int]] = None,
+    names: Optional[Sequence[str]] = None,
+    workers: int = 8,
+    rate_limit: Optional[float] = None,
+) -> List[BatchResult]:
+    """Fetches several Pokemon concurrently, returning results in the same order
+    as the requested dex numbers or names.
+
+    Failed lookups are reported through BatchResult.error instead of aborting
+    the batch. rate_limit caps the number of network requests per second.
+    """
+    queries = _queries(dex, names)
+    rate_limiter = TokenBucket(rate_limit) if rate_limit else None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda query: _fetch(query, rate_limiter), queries))
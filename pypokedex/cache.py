@@ -0,0 +1,234 @@
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock, RLock
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional, TypeVar
+
+from pypokedex import instrumentation
+
+T = TypeVar("T")
+
+
+class CacheInfo(NamedTuple):
+    # The first four fields are functools.lru_cache's, in the same order
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+    evictions: int
+    currbytes: int
+    max_bytes: Optional[int]
+
+
+class _Entry(NamedTuple):
+    value: Any
+    expires_at: Optional[float]
+    size: int
+    aliases: List[Hashable]
+
+
+def deep_getsizeof(obj: Any) -> int:
+    """Estimates the memory used by an object and everything it references."""
+    seen = set()
+    stack = [obj]
+    total = 0
+
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif not isinstance(current, (str, bytes, int, float, bool, type(None))):
+            if hasattr(current, "__dict__"):
+                stack.append(vars(current))
+            for slot in getattr(type(current), "__slots__", ()):
+                if hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+
+    return total
+
+
+class Cache:
+    """A thread-safe LRU cache with optional size, memory and TTL limits.
+
+    Entries are stored under a canonical key, and any number of aliases can
+    point at the same entry (e.g. a Pokemon's name aliasing its dex number).
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 256,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        sizeof: Callable[[Any], int] = deep_getsizeof,
+    ) -> None:
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be a non-negative integer or None!")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max_bytes must be a non-negative integer or None!")
+
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizeof = sizeof
+
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._aliases: Dict[Hashable, Hashable] = {}
+        self._lock = RLock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value stored under key (or one of its aliases), or
+        default if there is no live entry."""
+        with self._lock:
+            key = self._aliases.get(key, key)
+            entry = self._entries.get(key)
+
+            if entry is not None and entry.expires_at is not None:
+                if entry.expires_at <= time.monotonic():
+                    self._remove(key)
+                    entry = None
+
+            if entry is None:
+                self._misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        aliases: Optional[List[Hashable]] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Stores value under key, replacing any previous entry, and points
+        every alias at it."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+        aliases = [alias for alias in aliases or [] if alias != key]
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _Entry(value, expires_at, size, aliases)
+            self._bytes += size
+            for alias in aliases:
+                self._aliases[alias] = key
+
+            self._evict()
+
+    def resize(self, key: Hashable) -> None:
+        """Measures the value stored under key (or one of its aliases) again,
+        after it changed in place, and evicts entries if it no longer fits."""
+        if self.max_bytes is None:
+            return
+
+        with self._lock:
+            key = self._aliases.get(key, key)
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+
+            size = self._sizeof(entry.value)
+            self._entries[key] = entry._replace(size=size)
+            self._bytes += size - entry.size
+            self._evict()
+
+    def remove(self, key: Hashable) -> None:
+        with self._lock:
+            key = self._aliases.get(key, key)
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+            self._bytes = self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self.maxsize,
+                len(self._entries),
+                self._evictions,
+                self._bytes,
+                self.max_bytes,
+            )
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            key = self._aliases.get(key, key)
+            entry = self._entries.get(key)
+            return entry is not None and (
+                entry.expires_at is None or entry.expires_at > time.monotonic()
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        for alias in entry.aliases:
+            if self._aliases.get(alias) == key:
+                del self._aliases[alias]
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.maxsize is not None and len(self._entries) > self.maxsize)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+
+class SingleFlight:
+    """Runs fetch() once for any number of concurrent callers (from any thread)
+    sharing a key. Callers arriving while it runs wait for it, and get the same
+    result or exception."""
+
+    def __init__(self) -> None:
+        self._in_flight: "Dict[Hashable, Future[Any]]" = {}
+        self._lock = Lock()
+
+    def run(self, key: Hashable, fetch: Callable[[], T], **attributes: Any) -> T:
+        """Runs fetch() (or waits for it). attributes are reported with the
+        "coalesced" instrumentation event emitted for waiting callers."""
+        future: "Future[Any]" = Future()
+        with self._lock:
+            in_flight = self._in_flight.setdefault(key, future)
+
+        if in_flight is not future:
+            instrumentation.emit("coalesced", attributes=attributes)
+            return in_flight.result()
+
+        try:
+            result = fetch()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
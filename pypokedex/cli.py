@@ -0,0 +1,99 @@
+"""Command line interface, run with python -m pypokedex.
+
+Commands:
+
+- warm: prefetches Pokemon into an on-disk cache, e.g.
+  python -m pypokedex warm --range 1-1025 --workers 16 --disk-cache dex.sqlite3
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from pypokedex.client import Client, set_client, set_disk_cache
+from pypokedex.disk_cache import DiskCache
+from pypokedex.ratelimit import TokenBucket
+from pypokedex.warm import Checkpoint, parse_range, warm
+
+
+def _progress_printer(every: int):
+    interactive = sys.stderr.isatty()
+
+    def progress(succeeded: int, failed: int, total: int) -> None:
+        done = succeeded + failed
+        if interactive or done % every == 0 or done == total:
+            end = "" if interactive and done < total else "\n"
+            start = "\r" if interactive else ""
+            print(f"{start}{done}/{total} ({failed} failed)", end=end, file=sys.stderr)
+
+    return progress
+
+
+def _warm(args: argparse.Namespace) -> int:
+    try:
+        dex = parse_range(args.range)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    set_disk_cache(DiskCache(args.disk_cache, max_size=None))
+    if args.rate_limit:
+        set_client(Client(rate_limiter=TokenBucket(args.rate_limit)))
+
+    checkpoint = Checkpoint(args.checkpoint or f"{args.disk_cache}.checkpoint")
+    if args.restart:
+        checkpoint.completed.clear()
+
+    summary = warm(
+        dex,
+        species=args.species,
+        workers=args.workers,
+        checkpoint=checkpoint,
+        progress=_progress_printer(50),
+    )
+
+    print(
+        f"Warmed {summary.succeeded} Pokemon in {summary.elapsed:.1f}s "
+        f"({summary.per_second:.1f}/s), skipped {summary.skipped} already warm, "
+        f"{len(summary.failed)} failed"
+    )
+    for number, error in sorted(summary.failed.items()):
+        print(f"  {number}: {error}")
+
+    return 1 if summary.failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pypokedex")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    warm_parser = commands.add_parser(
+        "warm", help="prefetch Pokemon into an on-disk cache"
+    )
+    warm_parser.add_argument(
+        "--range", default="1-1025", help="dex numbers, e.g. 1-151,251 (1-1025)"
+    )
+    warm_parser.add_argument("--workers", type=int, default=8)
+    warm_parser.add_argument(
+        "--disk-cache", required=True, help="the on-disk cache file to fill"
+    )
+    warm_parser.add_argument(
+        "--checkpoint",
+        help="file recording completed dex numbers (<disk cache>.checkpoint)",
+    )
+    warm_parser.add_argument(
+        "--restart", action="store_true", help="ignore the existing checkpoint"
+    )
+    warm_parser.add_argument(
+        "--no-species",
+        dest="species",
+        action="store_false",
+        help="don't prefetch species data (used for descriptions)",
+    )
+    warm_parser.add_argument(
+        "--rate-limit", type=float, help="maximum requests per second"
+    )
+    warm_parser.set_defaults(handler=_warm)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
@@ -0,0 +1,257 @@
+# pyright: reportUnboundVariable=false
+
+import time
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, Mapping, NamedTuple, Optional
+
+from pypokedex import instrumentation
+from pypokedex.exceptions import PyPokedexError, PyPokedexHTTPError
+from pypokedex.parsing import loads
+from pypokedex.retry import RetryPolicy
+
+# requests is slow to import, so it is only imported once a request is made
+# (which keeps importing pypokedex fast for tools that never make one)
+if TYPE_CHECKING:  # pragma: no cover
+    import requests
+
+    from pypokedex.disk_cache import CachedResponse, DiskCache
+    from pypokedex.ratelimit import TokenBucket
+
+
+class Client:
+    """The HTTP client every request to PokeAPI goes through.
+
+    By default, a pooled requests.Session is created that keeps connections
+    alive between calls. A preconfigured session can be passed in instead, in
+    which case pool_size and keep_alive are ignored.
+
+    Transient failures (429 and 5xx responses, and connection errors) are
+    retried according to retry_policy, which defaults to a RetryPolicy with the
+    specified retries and backoff_factor. A rate_limiter (which can be shared
+    with other clients, including pypokedex.aio ones) caps the number of
+    requests per second, retries included.
+    """
+
+    def __init__(
+        self,
+        session: "Optional[requests.Session]" = None,
+        timeout: Optional[float] = 3,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        retries: int = 2,
+        backoff_factor: float = 0.5,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: "Optional[TokenBucket]" = None,
+    ) -> None:
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy(retries, backoff_factor)
+        self.rate_limiter = rate_limiter
+
+        if session is None:
+            import requests  # pylint: disable=import-outside-toplevel
+            from requests.adapters import (  # pylint: disable=import-outside-toplevel
+                HTTPAdapter,
+            )
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+            if not keep_alive:
+                session.headers["Connection"] = "close"
+
+        self.session = session
+
+    def get(
+        self, url: str, headers: Optional[Dict[str, str]] = None, stream: bool = False
+    ) -> "requests.Response":
+        """Sends a GET request, retrying transient failures. With stream, the
+        body is only downloaded as it is read (see Response.iter_content)."""
+        import requests  # pylint: disable=import-outside-toplevel
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            try:
+                response = self.session.get(
+                    url, headers=headers, timeout=self.timeout, stream=stream
+                )
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ) as error:
+                if not self.retry_policy.should_retry(attempt):
+                    raise
+                _emit_retry(url, error=type(error).__name__)
+                time.sleep(self.retry_policy.delay(attempt))
+            else:
+                if not self.retry_policy.should_retry(attempt, response.status_code):
+                    return response
+                _emit_retry(url, status_code=response.status_code)
+                time.sleep(
+                    self.retry_policy.delay(
+                        attempt, response.headers.get("Retry-After")
+                    )
+                )
+                response.close()
+
+            attempt += 1
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_client: Optional[Client] = None
+_client_lock = Lock()
+_disk_cache: "Optional[DiskCache]" = None
+
+
+def get_client() -> Client:
+    """Returns the client used for every request to PokeAPI, creating a default
+    one on first use."""
+    global _client  # pylint: disable=global-statement
+    with _client_lock:
+        if _client is None:
+            _client = Client()
+        return _client
+
+
+def set_client(client: Client) -> None:
+    """Replaces the client used for every request to PokeAPI."""
+    global _client  # pylint: disable=global-statement
+    with _client_lock:
+        _client = client
+
+
+def get_disk_cache() -> "Optional[DiskCache]":
+    """Returns the on-disk response cache, if one is enabled."""
+    return _disk_cache
+
+
+def set_disk_cache(disk_cache: "Optional[DiskCache]") -> None:
+    """Enables (or with None, disables) the on-disk cache used for every request
+    made to PokeAPI."""
+    global _disk_cache  # pylint: disable=global-statement
+    _disk_cache = disk_cache
+
+
+def http_error(
+    status_code: int, not_found_message: Optional[str] = None
+) -> PyPokedexHTTPError:
+    """Builds the appropriate PyPokedexHTTPError for an unsuccessful status
+    code."""
+    if status_code == 404 and not_found_message is not None:
+        return PyPokedexHTTPError(not_found_message, 404)
+    return PyPokedexHTTPError(
+        f"An HTTP error occurred! (Status code: {status_code})", status_code
+    )
+
+
+def endpoint_of(url: str) -> str:
+    """Returns the PokeAPI endpoint a URL belongs to (e.g. "pokemon")."""
+    path = url.split("?", 1)[0].rstrip("/")
+    if "/api/v2/" in path:
+        return path.split("/api/v2/", 1)[1].split("/", 1)[0]
+    return path.rsplit("/", 2)[-2]
+
+
+def decode_json(body: bytes, endpoint: str) -> Any:
+    """Decodes a response body from the specified endpoint."""
+    with instrumentation.timed("decode", endpoint=endpoint):
+        return loads(body)
+
+
+def _emit_retry(url: str, **attributes: Any) -> None:
+    instrumentation.emit(
+        "retry", attributes={"endpoint": endpoint_of(url), **attributes}
+    )
+
+
+class DiskCacheLookup(NamedTuple):
+    # The cached body, if it is fresh enough to be used without a request
+    fresh_body: Optional[bytes]
+    # A stale cached response, revalidated with the conditional headers
+    stale: "Optional[CachedResponse]"
+    headers: Dict[str, str]
+
+
+def lookup_disk_cache(url: str, endpoint: str) -> DiskCacheLookup:
+    """Looks url up in the on-disk cache (if one is enabled) before requesting
+    it."""
+    disk_cache = _disk_cache
+    if disk_cache is None:
+        return DiskCacheLookup(None, None, {})
+
+    cached = disk_cache.get(url)
+    instrumentation.cache_lookup("disk", endpoint, cached is not None)
+    if cached is None:
+        return DiskCacheLookup(None, None, {})
+    if disk_cache.is_fresh(cached):
+        return DiskCacheLookup(cached.body, None, {})
+
+    headers = {}
+    if cached.etag is not None:
+        headers["If-None-Match"] = cached.etag
+    if cached.last_modified is not None:
+        headers["If-Modified-Since"] = cached.last_modified
+    return DiskCacheLookup(None, cached, headers)
+
+
+def revalidated_body(
+    url: str, stale: "Optional[CachedResponse]", status_code: int
+) -> Optional[bytes]:
+    """Returns the body of a stale cached response if PokeAPI answered that it
+    is not modified (and marks it fresh again), or None otherwise."""
+    disk_cache = _disk_cache
+    if status_code != 304 or disk_cache is None or stale is None:
+        return None
+    disk_cache.revalidated(url)
+    return stale.body
+
+
+def store_response(url: str, body: bytes, headers: Mapping[str, str]) -> None:
+    """Stores a successful response in the on-disk cache, if one is enabled."""
+    disk_cache = _disk_cache
+    if disk_cache is not None:
+        disk_cache.set(url, body, headers.get("ETag"), headers.get("Last-Modified"))
+
+
+def emit_error(endpoint: str, **attributes: Any) -> None:
+    """Reports a failed request to the instrumentation listeners."""
+    instrumentation.emit("error", attributes={"endpoint": endpoint, **attributes})
+
+
+def fetch_json(url: str, not_found_message: Optional[str] = None) -> Any:
+    """Fetches and decodes the JSON document at url, going through the on-disk
+    cache if one is enabled."""
+    import requests  # pylint: disable=import-outside-toplevel
+
+    endpoint = endpoint_of(url)
+    lookup = lookup_disk_cache(url, endpoint)
+    if lookup.fresh_body is not None:
+        return decode_json(lookup.fresh_body, endpoint)
+
+    try:
+        with instrumentation.timed("request", endpoint=endpoint, url=url) as request:
+            response = get_client().get(url, headers=lookup.headers)
+            request["status_code"] = response.status_code
+
+        body = revalidated_body(url, lookup.stale, response.status_code)
+        if body is not None:
+            return decode_json(body, endpoint)
+
+        response.raise_for_status()
+
+    except requests.exceptions.HTTPError as error:
+        emit_error(endpoint, status_code=response.status_code)
+        raise http_error(response.status_code, not_found_message) from error
+
+    except requests.exceptions.RequestException as error:
+        emit_error(endpoint, error=type(error).__name__)
+        raise PyPokedexError("An internal requests exception occurred!") from error
+
+    store_response(url, response.content, response.headers)
+    return decode_json(response.content, endpoint)
@@ -1,2 +1,3 @@
 POKEAPI_BASE_URL = "https://pokeapi.co/api/v2/pokemon"
 POKEAPI_SPECIES_URL = "https://pokeapi.co/api/v2/pokemon-species"
+POKEAPI_API_URL = "https://pokeapi.co/api/v2"
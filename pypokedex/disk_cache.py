@@ -0,0 +1,182 @@
+import os
+import sqlite3
+import time
+from threading import Lock
+from typing import Dict, NamedTuple, Optional, Union
+
+# Reads don't write access times to the database right away, which would take
+# SQLite's write lock on every cache hit. They are written at most this often
+# (in seconds), and always before evicting.
+ACCESS_FLUSH_INTERVAL = 30
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+
+class DiskCache:
+    """A persistent cache of raw PokeAPI responses backed by a SQLite database.
+
+    Responses younger than max_age seconds (or any response, if max_age is
+    None) are served without touching the network. Older responses are
+    revalidated with their ETag/Last-Modified headers. Once the stored bodies
+    exceed max_size bytes, the least recently used responses are evicted.
+
+    The database is in WAL mode, so several processes can share one cache file,
+    with reads never waiting for writes.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        max_size: Optional[int] = 256 * 1024 * 1024,
+        max_age: Optional[float] = None,
+    ) -> None:
+        self.path = os.fspath(path)
+        self.max_size = max_size
+        self.max_age = max_age
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = Lock()
+        self._pending_accesses: Dict[str, float] = {}
+        self._last_flush = time.monotonic()
+        self._connection = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "url TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, "
+                "last_modified TEXT, stored_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL, size INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                "ON responses (accessed_at)"
+            )
+            self._last_access = self._connection.execute(
+                "SELECT COALESCE(MAX(accessed_at), 0) FROM responses"
+            ).fetchone()[0]
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses "
+                "WHERE url = ?",
+                (url,),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            self._pending_accesses[url] = self._tick()
+            if time.monotonic() - self._last_flush >= ACCESS_FLUSH_INTERVAL:
+                with self._connection:
+                    self._flush_accesses()
+
+        return CachedResponse(bytes(row[0]), row[1], row[2], row[3])
+
+    def set(
+        self,
+        url: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        with self._lock, self._connection:
+            now = self._tick()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, body, etag, last_modified, now, now, len(body)),
+            )
+            self._pending_accesses.pop(url, None)
+            self._evict()
+
+    def revalidated(self, url: str) -> None:
+        """Marks the response stored for url as fresh again (e.g. after the
+        server answered 304 Not Modified)."""
+        with self._lock, self._connection:
+            now = self._tick()
+            self._connection.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, url),
+            )
+
+    def is_fresh(self, response: CachedResponse) -> bool:
+        return self.max_age is None or time.time() - response.stored_at < self.max_age
+
+    def size(self) -> int:
+        """Returns the total size in bytes of all stored response bodies."""
+        with self._lock:
+            return self._total_size()
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+            self._pending_accesses.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            with self._connection:
+                self._flush_accesses()
+            self._connection.close()
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return (
+                self._connection.execute(
+                    "SELECT 1 FROM responses WHERE url = ?", (url,)
+                ).fetchone()
+                is not None
+            )
+
+    def _tick(self) -> float:
+        # Access times must be strictly increasing for LRU eviction to be
+        # deterministic on platforms with a coarse clock
+        self._last_access = max(time.time(), self._last_access + 1e-6)
+        return self._last_access
+
+    def _flush_accesses(self) -> None:
+        if self._pending_accesses:
+            self._connection.executemany(
+                "UPDATE responses SET accessed_at = ? WHERE url = ?",
+                [
+                    (accessed_at, url)
+                    for url, accessed_at in self._pending_accesses.items()
+                ],
+            )
+            self._pending_accesses.clear()
+        self._last_flush = time.monotonic()
+
+    def _total_size(self) -> int:
+        return self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def _evict(self) -> None:
+        if self.max_size is None:
+            return
+
+        excess = self._total_size() - self.max_size
+        if excess <= 0:
+            return
+
+        self._flush_accesses()
+
+        evicted = []
+        for url, size in self._connection.execute(
+            "SELECT url, size FROM responses ORDER BY accessed_at, stored_at"
+        ):
+            if excess <= 0:
+                break
+            evicted.append((url,))
+            excess -= size
+
+        self._connection.executemany("DELETE FROM responses WHERE url = ?", evicted)
@@ -0,0 +1,199 @@
+"""Instrumentation hooks for everything pypokedex does on the way to a Pokemon.
+
+Hooks are called with an Event for:
+
+- request: an HTTP round-trip to PokeAPI (including connecting and DNS
+  resolution, which requests doesn't expose separately)
+- decode: decoding a JSON response
+- parse: building a Pokemon, or indexing species data for descriptions
+- cache_hit / cache_miss: lookups in the memory, disk or snapshot caches (and
+  hits on recently not found Pokemon)
+- coalesced: a get() call that waited for an identical call already in progress
+- retry: a request retried after a transient failure
+- error: a request that failed, with its status code or exception type
+
+Events are only built when at least one hook is registered, so instrumentation
+costs nothing otherwise.
+"""
+
+import time
+from contextlib import contextmanager
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+
+class Event(NamedTuple):
+    name: str
+    duration: Optional[float]
+    attributes: Dict[str, Any]
+
+
+Hook = Callable[[Event], None]
+
+_hooks: List[Hook] = []
+
+
+def add_hook(hook: Hook) -> None:
+    """Registers a callable to be called with every Event."""
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    _hooks.remove(hook)
+
+
+def enabled() -> bool:
+    return bool(_hooks)
+
+
+def emit(
+    name: str, duration: Optional[float] = None, attributes: Optional[Dict] = None
+) -> None:
+    if not _hooks:
+        return
+
+    event = Event(name, duration, attributes or {})
+    for hook in list(_hooks):
+        hook(event)
+
+
+def cache_lookup(cache: str, endpoint: str, hit: bool) -> None:
+    if _hooks:
+        emit(
+            "cache_hit" if hit else "cache_miss",
+            attributes={"cache": cache, "endpoint": endpoint},
+        )
+
+
+@contextmanager
+def timed(name: str, **attributes: Any) -> Iterator[Dict[str, Any]]:
+    """Emits an event with the duration of the enclosed block. The yielded
+    attributes can be updated from inside the block, and the name of any
+    exception raised is recorded under "error"."""
+    if not _hooks:
+        yield attributes
+        return
+
+    start = time.perf_counter()
+    try:
+        yield attributes
+    except BaseException as error:
+        attributes.setdefault("error", type(error).__name__)
+        raise
+    finally:
+        emit(name, time.perf_counter() - start, attributes)
+
+
+# Only these attributes become metric labels, since others (like URLs) would
+# create a separate series for every Pokemon
+LABELS = ("endpoint", "cache", "source", "status_code", "error")
+
+Series = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class Metrics:
+    """A hook aggregating events into counters and timing totals.
+
+    Register it with add_hook(metrics), then read the totals with counters()
+    and timings(), or export them with PrometheusExporter.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._counts: Dict[Series, int] = {}
+        self._durations: Dict[Series, float] = {}
+
+    def __call__(self, event: Event) -> None:
+        labels = tuple(
+            (label, str(event.attributes[label]))
+            for label in LABELS
+            if event.attributes.get(label) is not None
+        )
+        series = (event.name, labels)
+
+        with self._lock:
+            self._counts[series] = self._counts.get(series, 0) + 1
+            if event.duration is not None:
+                self._durations[series] = (
+                    self._durations.get(series, 0.0) + event.duration
+                )
+
+    def count(self, name: str, **labels: Any) -> int:
+        """Returns the number of events with the specified name, and at least
+        the specified labels."""
+        expected = {label: str(value) for label, value in labels.items()}
+
+        with self._lock:
+            return sum(
+                count
+                for (event_name, event_labels), count in self._counts.items()
+                if event_name == name and expected.items() <= dict(event_labels).items()
+            )
+
+    def counters(self) -> Dict[Series, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def timings(self) -> Dict[Series, float]:
+        """Returns the total duration in seconds of every timed series."""
+        with self._lock:
+            return dict(self._durations)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._durations.clear()
+
+
+class PrometheusExporter:
+    """Renders Metrics in the Prometheus text exposition format.
+
+    Timed events become summaries (<namespace>_<event>_seconds_count and
+    _sum), and other events become counters (<namespace>_<event>_total).
+    """
+
+    def __init__(self, metrics: Metrics, namespace: str = "pypokedex") -> None:
+        self.metrics = metrics
+        self.namespace = namespace
+
+    def render(self) -> str:
+        counts = self.metrics.counters()
+        durations = self.metrics.timings()
+        lines: List[str] = []
+        declared = set()
+
+        for series in sorted(counts):
+            name, labels = series
+            label_text = ",".join(
+                f'{label}="{_escape(value)}"' for label, value in labels
+            )
+            label_text = f"{{{label_text}}}" if label_text else ""
+
+            if series in durations:
+                metric = f"{self.namespace}_{name}_seconds"
+                if metric not in declared:
+                    lines.append(f"# TYPE {metric} summary")
+                    declared.add(metric)
+                lines.append(f"{metric}_count{label_text} {counts[series]}")
+                lines.append(f"{metric}_sum{label_text} {durations[series]!r}")
+            else:
+                metric = f"{self.namespace}_{name}_total"
+                if metric not in declared:
+                    lines.append(f"# TYPE {metric} counter")
+                    declared.add(metric)
+                lines.append(f"{metric}{label_text} {counts[series]}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,197 @@
+"""A dex-wide index of which Pokemon learn which moves.
+
+Each (move, version group) pair maps to a bitset of the Pokemon learning it,
+stored as a Python int with one bit per Pokemon, so intersections and unions
+over the whole dex are single integer operations.
+"""
+
+from bisect import bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from pypokedex.batch import get_many
+from pypokedex.pokemon import Pokemon
+
+LEVEL_UP = "level-up"
+
+
+def _popcount(bits: int) -> int:
+    return bin(bits).count("1")
+
+
+class DexSet:
+    """An immutable set of Pokemon from a LearnsetIndex, which supports &, |
+    and - with other sets from the same index."""
+
+    __slots__ = ("_dex", "bits")
+
+    def __init__(self, dex: Sequence[int], bits: int) -> None:
+        self._dex = dex
+        self.bits = bits
+
+    def __and__(self, other: "DexSet") -> "DexSet":
+        return DexSet(self._dex, self.bits & other.bits)
+
+    def __or__(self, other: "DexSet") -> "DexSet":
+        return DexSet(self._dex, self.bits | other.bits)
+
+    def __sub__(self, other: "DexSet") -> "DexSet":
+        return DexSet(self._dex, self.bits & ~other.bits)
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __len__(self) -> int:
+        return _popcount(self.bits)
+
+    def __iter__(self) -> Iterator[int]:
+        """Yields the dex numbers in the set, in increasing order."""
+        bits = self.bits
+        while bits:
+            lowest = bits & -bits
+            yield self._dex[lowest.bit_length() - 1]
+            bits ^= lowest
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, DexSet) and self.bits == other.bits
+
+    def __repr__(self) -> str:
+        return f"DexSet({list(self)})"
+
+    def dex_numbers(self) -> List[int]:
+        return list(self)
+
+
+class _Learners:
+    """The Pokemon learning one move in one version group."""
+
+    __slots__ = ("any", "by_method", "levels", "by_level")
+
+    def __init__(self) -> None:
+        self.any = 0
+        self.by_method: Dict[str, int] = {}
+        # Distinct level-up levels, sorted, along with the Pokemon learning the
+        # move by level-up at or below each of them
+        self.levels: List[int] = []
+        self.by_level: List[int] = []
+
+
+class LearnsetIndex:
+    """An inverted index from (move, version group) to the Pokemon that learn
+    the move in that version group, built from a collection of Pokemon."""
+
+    def __init__(
+        self, dex: Sequence[int], learners: Dict[Tuple[str, str], _Learners]
+    ) -> None:
+        self._dex = dex
+        self._learners = learners
+
+    @classmethod
+    def from_pokemon(cls, pokemon: Iterable[Pokemon]) -> "LearnsetIndex":
+        # Bit i stands for the i-th Pokemon by dex number
+        ordered = sorted(pokemon, key=lambda current: current.dex)
+        dex = [current.dex for current in ordered]
+        learners: Dict[Tuple[str, str], _Learners] = {}
+        levels: Dict[Tuple[str, str], Dict[int, int]] = {}
+
+        for position, current in enumerate(ordered):
+            bit = 1 << position
+            for game, moves in current.moves.items():
+                for move in moves:
+                    key = (move.name, game)
+                    entry = learners.get(key)
+                    if entry is None:
+                        entry = learners[key] = _Learners()
+
+                    entry.any |= bit
+                    entry.by_method[move.learn_method] = (
+                        entry.by_method.get(move.learn_method, 0) | bit
+                    )
+                    if move.learn_method == LEVEL_UP and move.level is not None:
+                        by_level = levels.setdefault(key, {})
+                        by_level[move.level] = by_level.get(move.level, 0) | bit
+
+        # Levels are made cumulative, so "by level n" is a single lookup
+        for key, by_level in levels.items():
+            entry = learners[key]
+            cumulative = 0
+            for level in sorted(by_level):
+                cumulative |= by_level[level]
+                entry.levels.append(level)
+                entry.by_level.append(cumulative)
+
+        return cls(dex, learners)
+
+    @classmethod
+    def fetch(
+        cls, dex: Sequence[int] = range(1, 1026), workers: int = 8
+    ) -> "LearnsetIndex":
+        """Fetches the specified Pokemon concurrently (through the same cache as
+        pypokedex.get) and builds an index from them."""
+        pokemon = []
+        for result in get_many(dex=dex, workers=workers):
+            if result.error is not None:
+                raise result.error
+            pokemon.append(result.pokemon)
+
+        return cls.from_pokemon(pokemon)
+
+    def __len__(self) -> int:
+        return len(self._dex)
+
+    def all(self) -> DexSet:
+        return DexSet(self._dex, (1 << len(self._dex)) - 1)
+
+    def learners(
+        self,
+        move: str,
+        game: str,
+        method: Optional[str] = None,
+        max_level: Optional[int] = None,
+    ) -> DexSet:
+        """Returns the Pokemon that learn a move in a version group, optionally
+        only by a specific learn method, or by level-up at or below
+        max_level."""
+        entry = self._learners.get((move, game))
+        if entry is None:
+            return DexSet(self._dex, 0)
+
+        if max_level is not None:
+            if method not in (None, LEVEL_UP):
+                return DexSet(self._dex, 0)
+            index = bisect_right(entry.levels, max_level)
+            return DexSet(self._dex, entry.by_level[index - 1] if index else 0)
+
+        if method is not None:
+            return DexSet(self._dex, entry.by_method.get(method, 0))
+
+        return DexSet(self._dex, entry.any)
+
+    def learners_of_all(
+        self,
+        moves: Iterable[str],
+        game: str,
+        method: Optional[str] = None,
+        max_level: Optional[int] = None,
+    ) -> DexSet:
+        """Returns the Pokemon that learn every one of the moves (with the same
+        filters as learners)."""
+        result = self.all()
+        for move in moves:
+            result &= self.learners(move, game, method, max_level)
+            if not result:
+                break
+        return result
+
+    def learners_of_any(
+        self,
+        moves: Iterable[str],
+        game: str,
+        method: Optional[str] = None,
+        max_level: Optional[int] = None,
+    ) -> DexSet:
+        """Returns the Pokemon that learn at least one of the moves (with the
+        same filters as learners)."""
+        result = DexSet(self._dex, 0)
+        for move in moves:
+            result |= self.learners(move, game, method, max_level)
+        return result
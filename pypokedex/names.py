@@ -0,0 +1,127 @@
+"""An index of every Pokemon name, for resolving and searching names locally.
+
+Once enabled (with enable_name_index() or set_name_index()), get() resolves
+names to dex numbers through it, so names that don't exist are rejected without
+a request to PokeAPI, and name and dex lookups share the same cache key.
+"""
+
+import difflib
+from bisect import bisect_left
+from sys import intern
+from threading import Lock
+from typing import Dict, List, Mapping, Optional
+
+from pypokedex.client import fetch_json
+from pypokedex.constants import POKEAPI_BASE_URL
+from pypokedex.exceptions import PyPokedexError, PyPokedexHTTPError
+
+# Large enough for the list endpoint to return every Pokemon in one page
+_LIST_LIMIT = 100000
+
+
+class NameIndex:
+    """A mapping of Pokemon names to dex numbers, with prefix and fuzzy search."""
+
+    def __init__(self, names: Mapping[str, int]) -> None:
+        self._dex: Dict[str, int] = {
+            intern(name.lower()): dex for name, dex in names.items()
+        }
+        self._names: Dict[int, str] = {dex: name for name, dex in self._dex.items()}
+        # Sorted, so that names sharing a prefix are contiguous
+        self._sorted: List[str] = sorted(self._dex)
+
+    @classmethod
+    def fetch(cls) -> "NameIndex":
+        """Builds an index from PokeAPI's list of every Pokemon."""
+        document = fetch_json(f"{POKEAPI_BASE_URL}?limit={_LIST_LIMIT}")
+
+        try:
+            return cls(
+                {
+                    result["name"]: int(result["url"].rstrip("/").rsplit("/", 1)[-1])
+                    for result in document["results"]
+                }
+            )
+        except (KeyError, ValueError) as error:
+            raise PyPokedexError(
+                "A required piece of data was not found for the list of Pokemon!"
+            ) from error
+
+    def __len__(self) -> int:
+        return len(self._dex)
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._dex
+
+    def dex_of(self, name: str) -> Optional[int]:
+        """Returns the dex number of a Pokemon name (in any case), or None if
+        there is no such Pokemon."""
+        return self._dex.get(name.lower())
+
+    def name_of(self, dex: int) -> Optional[str]:
+        return self._names.get(dex)
+
+    def resolve(self, name: str) -> int:
+        """Returns the dex number of a Pokemon name, raising the same
+        PyPokedexHTTPError PokeAPI would (with suggestions) if there is no
+        such Pokemon."""
+        dex = self.dex_of(name)
+        if dex is not None:
+            return dex
+
+        message = "The requested pokemon was not found!"
+        suggestions = self.fuzzy(name)
+        if suggestions:
+            message += f" Did you mean {', '.join(suggestions)}?"
+        raise PyPokedexHTTPError(message, 404)
+
+    def prefix(self, prefix: str, limit: Optional[int] = 10) -> List[str]:
+        """Returns the names starting with prefix, in alphabetical order."""
+        prefix = prefix.lower()
+        matches = []
+
+        for index in range(bisect_left(self._sorted, prefix), len(self._sorted)):
+            name = self._sorted[index]
+            if not name.startswith(prefix) or len(matches) == limit:
+                break
+            matches.append(name)
+
+        return matches
+
+    def fuzzy(self, name: str, limit: int = 3, cutoff: float = 0.6) -> List[str]:
+        """Returns the names most similar to name (e.g. with a typo), best
+        match first."""
+        return difflib.get_close_matches(name.lower(), self._sorted, limit, cutoff)
+
+
+_name_index: Optional[NameIndex] = None
+_name_index_lock = Lock()
+
+
+def get_name_index() -> Optional[NameIndex]:
+    """Returns the index get() resolves names through, if one is enabled."""
+    return _name_index
+
+
+def set_name_index(index: Optional[NameIndex]) -> None:
+    """Enables (or with None, disables) the index get() resolves names
+    through."""
+    global _name_index  # pylint: disable=global-statement
+    _name_index = index
+
+
+def enable_name_index() -> NameIndex:
+    """Builds an index from PokeAPI's list of every Pokemon and enables it. Does
+    nothing if an index is already enabled.
+
+    The list is fetched even if a snapshot is loaded, since a snapshot may only
+    hold some Pokemon, and the others must still resolve (and be fetched from
+    PokeAPI). Like any other request, it is served from the on-disk cache if
+    one is enabled. For an index of only the snapshot's Pokemon, use
+    set_name_index(NameIndex(get_snapshot().names())) instead."""
+    global _name_index  # pylint: disable=global-statement
+
+    with _name_index_lock:
+        if _name_index is None:
+            _name_index = NameIndex.fetch()
+        return _name_index
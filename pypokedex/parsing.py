@@ -0,0 +1,110 @@
+"""Decoding and trimming of PokeAPI JSON documents.
+
+orjson is used for decoding and encoding when it is installed
+(pip install pypokedex[fast]), and the standard library's json module
+otherwise.
+"""
+
+import json
+from typing import Any, Dict, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+# The only top-level keys of a pokemon document that Pokemon reads. Everything
+# else (game_indices, held_items, forms, cries, ...) is dropped as soon as a
+# document is decoded, so it isn't kept alive alongside the Pokemon.
+POKEMON_KEYS = (
+    "id",
+    "name",
+    "height",
+    "weight",
+    "base_experience",
+    "stats",
+    "abilities",
+    "types",
+    "moves",
+    "sprites",
+)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(document: Any) -> bytes:
+    """Encodes a document as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(document)
+    return json.dumps(document, separators=(",", ":")).encode("utf-8")
+
+
+def prune_pokemon(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns a pokemon document without the top-level keys Pokemon doesn't
+    read. Unlike trim_pokemon, nested data is left as is, so this is cheap
+    enough to do on every fetch."""
+    return {key: document[key] for key in POKEMON_KEYS if key in document}
+
+
+def trim_pokemon(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns a copy of a pokemon document with only the data Pokemon reads,
+    down to nested URLs."""
+    return {
+        "id": document["id"],
+        "name": document["name"],
+        "height": document["height"],
+        "weight": document["weight"],
+        "base_experience": document["base_experience"],
+        "stats": [
+            {"base_stat": stat["base_stat"], "stat": {"name": stat["stat"]["name"]}}
+            for stat in document["stats"]
+        ],
+        "abilities": [
+            {
+                "ability": {"name": ability["ability"]["name"]},
+                "is_hidden": ability["is_hidden"],
+            }
+            for ability in document["abilities"]
+        ],
+        "types": [
+            {"type": {"name": type_["type"]["name"]}} for type_ in document["types"]
+        ],
+        "moves": [
+            {
+                "move": {"name": move["move"]["name"]},
+                "version_group_details": [
+                    {
+                        "level_learned_at": details["level_learned_at"],
+                        "move_learn_method": {
+                            "name": details["move_learn_method"]["name"]
+                        },
+                        "version_group": {"name": details["version_group"]["name"]},
+                    }
+                    for details in move["version_group_details"]
+                ],
+            }
+            for move in document["moves"]
+        ],
+        "sprites": document["sprites"],
+    }
+
+
+def trim_species(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns a copy of a pokemon-species document with only the data used
+    for descriptions."""
+    return {
+        "flavor_text_entries": [
+            {
+                "flavor_text": entry["flavor_text"],
+                "language": {"name": entry["language"]["name"]},
+                "version": {"name": entry["version"]["name"]},
+            }
+            for entry in document["flavor_text_entries"]
+        ]
+    }
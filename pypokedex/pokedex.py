@@ -0,0 +1,232 @@
+"""Columnar storage and vectorized queries over many Pokemon.
+
+NumPy is used when it is installed; otherwise columns fall back to the standard
+library's array module.
+"""
+
+import heapq
+import math
+import operator
+from array import array
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+from pypokedex import api
+from pypokedex._numpy import numpy, resolve_use_numpy
+from pypokedex.batch import get_many
+from pypokedex.pokemon import Pokemon
+
+STAT_COLUMNS = ("hp", "attack", "defense", "sp_atk", "sp_def", "speed")
+INTEGER_COLUMNS = ("dex",) + STAT_COLUMNS
+# base_experience is null for some Pokemon in PokeAPI, which is stored as NaN
+FLOAT_COLUMNS = ("height", "weight", "base_experience")
+COLUMNS = INTEGER_COLUMNS + FLOAT_COLUMNS
+
+_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
+class _Table(NamedTuple):
+    columns: Dict[str, Any]
+    names: List[str]
+    # Each Pokemon's types are stored as a bitmask, with one bit per type
+    types: Any
+    type_bits: Dict[str, int]
+    use_numpy: bool
+
+
+class Pokedex:
+    """An immutable collection of Pokemon stored column by column.
+
+    Queries (where, with_type, sort_by, top) return new Pokedex views over the
+    same columns without copying them. Full Pokemon objects are only fetched
+    (through pypokedex.get) when iterating over a Pokedex.
+    """
+
+    def __init__(self, table: _Table, indices: Any) -> None:
+        self._table = table
+        self._indices = indices
+
+    @classmethod
+    def from_pokemon(
+        cls, pokemon: Iterable[Pokemon], use_numpy: Optional[bool] = None
+    ) -> "Pokedex":
+        """Builds a Pokedex from Pokemon objects. use_numpy defaults to whether
+        NumPy is installed."""
+        use_numpy = resolve_use_numpy(use_numpy)
+
+        rows: Dict[str, List[Any]] = {column: [] for column in COLUMNS}
+        names = []
+        types = []
+        type_bits: Dict[str, int] = {}
+
+        for current in pokemon:
+            rows["dex"].append(current.dex)
+            rows["height"].append(current.height)
+            rows["weight"].append(current.weight)
+            rows["base_experience"].append(
+                math.nan if current.base_experience is None else current.base_experience
+            )
+            for stat in STAT_COLUMNS:
+                rows[stat].append(getattr(current.base_stats, stat))
+
+            names.append(current.name)
+            mask = 0
+            for type_ in current.types:
+                mask |= type_bits.setdefault(type_, 1 << len(type_bits))
+            types.append(mask)
+
+        if use_numpy:
+            columns = {
+                column: numpy.array(
+                    values,
+                    dtype=numpy.int64 if column in INTEGER_COLUMNS else numpy.float64,
+                )
+                for column, values in rows.items()
+            }
+            table = _Table(
+                columns, names, numpy.array(types, numpy.int64), type_bits, True
+            )
+            return cls(table, numpy.arange(len(names)))
+
+        columns = {
+            column: array("q" if column in INTEGER_COLUMNS else "d", values)
+            for column, values in rows.items()
+        }
+        table = _Table(columns, names, array("q", types), type_bits, False)
+        return cls(table, list(range(len(names))))
+
+    @classmethod
+    def fetch(
+        cls,
+        dex: Sequence[int] = range(1, 1026),
+        workers: int = 8,
+        use_numpy: Optional[bool] = None,
+    ) -> "Pokedex":
+        """Fetches the specified Pokemon concurrently (through the same cache as
+        pypokedex.get) and builds a Pokedex from them."""
+        pokemon = []
+        for result in get_many(dex=dex, workers=workers):
+            if result.error is not None:
+                raise result.error
+            pokemon.append(result.pokemon)
+
+        return cls.from_pokemon(pokemon, use_numpy)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __iter__(self) -> Iterator[Pokemon]:
+        for dex in self.dex_numbers():
+            yield api.get(dex=dex)
+
+    def column(self, name: str) -> Sequence[Any]:
+        """Returns the values of a column (see COLUMNS) for the current
+        selection, as a NumPy array or a list."""
+        values = self._column(name)
+        if self._table.use_numpy:
+            return values[self._indices]
+        return [values[index] for index in self._indices]
+
+    def dex_numbers(self) -> List[int]:
+        return [int(dex) for dex in self.column("dex")]
+
+    def names(self) -> List[str]:
+        return [self._table.names[index] for index in self._indices]
+
+    def where(self, column: str, op: str, value: float) -> "Pokedex":
+        """Selects the Pokemon for which `column op value` holds, e.g.
+        where("speed", ">", 100)."""
+        if op not in _OPERATORS:
+            raise ValueError(f"Unknown operator {op}!")
+
+        compare = _OPERATORS[op]
+        values = self._column(column)
+
+        if self._table.use_numpy:
+            return self._select(self._indices[compare(values[self._indices], value)])
+        return self._select(
+            [index for index in self._indices if compare(values[index], value)]
+        )
+
+    def with_type(self, *types: str) -> "Pokedex":
+        """Selects the Pokemon that have all the specified types."""
+        if any(type_ not in self._table.type_bits for type_ in types):
+            return self._select(self._indices[:0])
+
+        mask = 0
+        for type_ in types:
+            mask |= self._table.type_bits[type_]
+
+        masks = self._table.types
+        if self._table.use_numpy:
+            return self._select(self._indices[(masks[self._indices] & mask) == mask])
+        return self._select(
+            [index for index in self._indices if masks[index] & mask == mask]
+        )
+
+    def sort_by(self, column: str, descending: bool = False) -> "Pokedex":
+        """Sorts the current selection by a column. Ties keep their current
+        order."""
+        values = self._column(column)
+
+        if self._table.use_numpy:
+            keys = values[self._indices]
+            order = numpy.argsort(-keys if descending else keys, kind="stable")
+            return self._select(self._indices[order])
+
+        # NaN (a missing value) doesn't compare with anything, so it is sorted
+        # last explicitly, like NumPy does
+        sign = -1 if descending else 1
+
+        def key(index: int) -> Any:
+            value = values[index]
+            return (math.isnan(value), sign * value)
+
+        return self._select(sorted(self._indices, key=key))
+
+    def top(self, column: str, k: int) -> "Pokedex":
+        """Selects the k Pokemon with the highest values in a column, sorted in
+        descending order. Pokemon missing a value (NaN) are never selected."""
+        values = self._column(column)
+
+        if self._table.use_numpy:
+            indices = self._indices[~numpy.isnan(values[self._indices])]
+            keys = values[indices]
+            if k < len(keys):
+                candidates = numpy.argpartition(-keys, k)[:k]
+            else:
+                candidates = numpy.arange(len(keys))
+            order = candidates[numpy.argsort(-keys[candidates], kind="stable")]
+            return self._select(indices[order])
+
+        return self._select(
+            heapq.nlargest(
+                k,
+                (index for index in self._indices if not math.isnan(values[index])),
+                key=values.__getitem__,
+            )
+        )
+
+    def _column(self, name: str) -> Any:
+        if name not in self._table.columns:
+            raise ValueError(f"Unknown column {name}!")
+        return self._table.columns[name]
+
+    def _select(self, indices: Any) -> "Pokedex":
+        return Pokedex(self._table, indices)
@@ -1,12 +1,30 @@
-# pyright: reportUnboundVariable=false
-
+import struct
+import zlib
+from bisect import bisect_right
 from collections import defaultdict
-from typing import DefaultDict, Dict, List, NamedTuple, Optional
-
-import requests
-
+from sys import intern
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from pypokedex import resources
+from pypokedex.cache import SingleFlight
+from pypokedex.client import fetch_json
 from pypokedex.constants import POKEAPI_SPECIES_URL
-from pypokedex.exceptions import PyPokedexError, PyPokedexHTTPError
+from pypokedex.exceptions import PyPokedexError
+from pypokedex.instrumentation import cache_lookup, timed
+from pypokedex.parsing import dumps, loads
+from pypokedex.snapshot import get_snapshot
 
 SpriteKeys = Dict[str, str]
 
@@ -15,6 +33,10 @@ class Ability(NamedTuple):
     name: str
     is_hidden: bool
 
+    def details(self) -> resources.AbilityDetails:
+        """Fetches (once) the details of the ability from PokeAPI."""
+        return resources.get_ability(self.name)
+
 
 class BaseStats(NamedTuple):
     hp: int
@@ -30,13 +52,110 @@ class Move(NamedTuple):
     learn_method: str
     level: Optional[int]
 
+    def details(self) -> resources.MoveDetails:
+        """Fetches (once) the details of the move, like its type and power,
+        from PokeAPI."""
+        return resources.get_move(self.name)
+
 
 class Sprites(NamedTuple):
     front: Dict[str, Optional[str]]
     back: Dict[str, Optional[str]]
 
 
+ParsedSprites = Tuple[Sprites, Dict[str, Sprites], Dict[str, Dict[str, Sprites]]]
+
+# Header of the format written by Pokemon.to_bytes(): magic and format version
+_SERIALIZED_HEADER = struct.Struct("<4sB")
+_SERIALIZED_MAGIC = b"PKMN"
+_SERIALIZED_VERSION = 1
+
+# Guards the lazy parsing of moves and sprites, which only happens once per
+# Pokemon, so a single lock is plenty
+_parse_lock = Lock()
+
+# Species documents being fetched (for descriptions), by URL
+_species_in_flight = SingleFlight()
+
+# Identical moves (e.g. tackle learned by level-up at level 1) are shared by
+# every Pokemon and game instead of being stored once per occurrence. The
+# number of distinct moves is bounded by PokeAPI, so this never grows large.
+_shared_moves: Dict[Move, Move] = {}
+
+
+def _ignore_parsed(pokemon: "Pokemon") -> None:
+    pass
+
+
+# Called with a Pokemon whenever its moves or sprites have just been parsed,
+# since that changes how much memory it takes (see set_parse_listener)
+_on_parsed: Callable[["Pokemon"], None] = _ignore_parsed
+
+
+def set_parse_listener(listener: Optional[Callable[["Pokemon"], None]]) -> None:
+    """Sets the function called with a Pokemon right after its moves or sprites
+    are parsed (used by pypokedex.get() to keep its cache's memory accounting
+    up to date)."""
+    global _on_parsed  # pylint: disable=global-statement
+    _on_parsed = listener or _ignore_parsed
+
+
+def _shared_move(name: str, learn_method: str, level: Optional[int]) -> Move:
+    move = Move(intern(name), intern(learn_method), level)
+    return _shared_moves.setdefault(move, move)
+
+
+class _MoveIndex(NamedTuple):
+    move_names: Dict[str, FrozenSet[str]]
+    by_move: Dict[str, Dict[str, List[Move]]]
+    level_up: Dict[str, Tuple[List[int], List[Move]]]
+
+    @staticmethod
+    def build(moves: Dict[str, List[Move]]) -> "_MoveIndex":
+        by_move: Dict[str, Dict[str, List[Move]]] = {}
+        level_up = {}
+
+        for game, game_moves in moves.items():
+            for move in game_moves:
+                by_move.setdefault(move.name, {}).setdefault(game, []).append(move)
+
+            leveled = sorted(
+                (move for move in game_moves if move.level is not None),
+                key=lambda move: move.level or 0,
+            )
+            level_up[game] = ([move.level or 0 for move in leveled], leveled)
+
+        return _MoveIndex(
+            {
+                game: frozenset(move.name for move in game_moves)
+                for game, game_moves in moves.items()
+            },
+            by_move,
+            level_up,
+        )
+
+
 class Pokemon:
+    # Pokemon are often cached by the thousand, so they avoid a per-instance
+    # __dict__, and all repeated strings (names, types, games, learn methods)
+    # are interned
+    __slots__ = (
+        "dex",
+        "name",
+        "height",
+        "weight",
+        "base_experience",
+        "base_stats",
+        "abilities",
+        "types",
+        "_raw_moves",
+        "_raw_sprites",
+        "_moves",
+        "_parsed_sprites",
+        "_move_index",
+        "_descriptions",
+    )
+
     dex: int
     name: str
     height: int
@@ -45,19 +164,16 @@ class Pokemon:
     base_stats: BaseStats
     abilities: List[Ability]
     types: List[str]
-    moves: DefaultDict[str, List[Move]]
-    sprites: Sprites
-    other_sprites: Dict[str, Sprites]
-    version_sprites: Dict[str, Dict[str, Sprites]]
 
     def __init__(self, json_data) -> None:
         """Loads and stores required pokemon data"""
 
-        # pylint: disable=too-many-locals, too-many-branches
         try:
             self.dex = json_data["id"]
 
-            for pokemon_info in ["name", "height", "weight", "base_experience"]:
+            self.name = intern(json_data["name"])
+
+            for pokemon_info in ["height", "weight", "base_experience"]:
                 setattr(self, pokemon_info, json_data[pokemon_info])
 
             stat_dict = {}
@@ -76,66 +192,137 @@ class Pokemon:
             self.base_stats = BaseStats(**stat_dict)
 
             self.abilities = [
-                Ability(ability["ability"]["name"], ability["is_hidden"])
+                Ability(intern(ability["ability"]["name"]), ability["is_hidden"])
                 for ability in json_data["abilities"]
             ]
 
-            self.types = [type_["type"]["name"] for type_ in json_data["types"]]
+            self.types = [intern(type_["type"]["name"]) for type_ in json_data["types"]]
+
+            # Moves and sprites make up most of the data, so their raw JSON is
+            # kept as is and only parsed the first time they are accessed (and
+            # then dropped)
+            self._raw_moves: Any = json_data["moves"]
+            self._raw_sprites: Any = json_data["sprites"]
+
+        except KeyError as error:
+            raise PyPokedexError(
+                "A required piece of data was not found for the current Pokemon!"
+            ) from error
 
-            self.moves = defaultdict(list)
+        self._moves: Optional[DefaultDict[str, List[Move]]] = None
+        self._parsed_sprites: Optional[ParsedSprites] = None
+        self._move_index: Optional[_MoveIndex] = None
+        self._descriptions: Optional[Dict[str, Dict[str, str]]] = None
+
+    @property
+    def moves(self) -> DefaultDict[str, List[Move]]:
+        parsed = False
+        if self._moves is None:
+            with _parse_lock:
+                if self._moves is None:
+                    self._moves = self._parse_moves()
+                    self._raw_moves = None
+                    parsed = True
+        if parsed:
+            _on_parsed(self)
+        return self._moves
+
+    @property
+    def sprites(self) -> Sprites:
+        return self._sprite_data()[0]
+
+    @property
+    def other_sprites(self) -> Dict[str, Sprites]:
+        return self._sprite_data()[1]
+
+    @property
+    def version_sprites(self) -> Dict[str, Dict[str, Sprites]]:
+        return self._sprite_data()[2]
+
+    def _sprite_data(self) -> ParsedSprites:
+        parsed = False
+        if self._parsed_sprites is None:
+            with _parse_lock:
+                if self._parsed_sprites is None:
+                    self._parsed_sprites = self._parse_sprites()
+                    self._raw_sprites = None
+                    parsed = True
+        if parsed:
+            _on_parsed(self)
+        return self._parsed_sprites
+
+    def _parse_moves(self) -> DefaultDict[str, List[Move]]:
+        moves: DefaultDict[str, List[Move]] = defaultdict(list)
 
-            for move in json_data["moves"]:
+        try:
+            for move in self._raw_moves:
                 move_name = move["move"]["name"]
 
                 for game_details in move["version_group_details"]:
                     learn_level = game_details["level_learned_at"]
                     learn_method = game_details["move_learn_method"]["name"]
-                    game_name = game_details["version_group"]["name"]
+                    game_name = intern(game_details["version_group"]["name"])
                     if learn_level == 0:  # Move not learned by level-up
                         learn_level = None
 
-                    self.moves[game_name].append(
-                        Move(move_name, learn_method, learn_level)
+                    moves[game_name].append(
+                        _shared_move(move_name, learn_method, learn_level)
                     )
 
-            # Regular sprites are currently handled separately because they are at
-            # the same level as other sprites. A better solution might be possible.
-            regular_sprite_keys: SpriteKeys = {}
+        except (KeyError, TypeError) as error:
+            raise PyPokedexError(
+                "A required piece of data was not found for the current Pokemon!"
+            ) from error
+
+        return moves
 
-            self.other_sprites = {}
-            self.version_sprites = {}
+    def _parse_sprites(self) -> ParsedSprites:
+        # Regular sprites are currently handled separately because they are at
+        # the same level as other sprites. A better solution might be possible.
+        regular_sprite_keys: SpriteKeys = {}
 
-            for sprite_key, associated_data in json_data["sprites"].items():
+        other_sprites: Dict[str, Sprites] = {}
+        version_sprites: Dict[str, Dict[str, Sprites]] = {}
+
+        try:
+            for sprite_key, associated_data in self._raw_sprites.items():
                 if sprite_key == "other":
                     for sprite_group, sprites in associated_data.items():
-                        self.other_sprites[sprite_group] = Pokemon._extract_sprites(
+                        other_sprites[intern(sprite_group)] = Pokemon._extract_sprites(
                             sprites
                         )
 
                 elif sprite_key == "versions":
                     for generation, games in associated_data.items():
-                        self.version_sprites[generation] = {}
+                        generation = intern(generation)
+                        version_sprites[generation] = {}
 
                         for game, sprites in games.items():
                             if game == "black-white":
                                 # TODO: Temporarily ignore animated sprites for Gen 5
                                 # (see #19)
-                                del sprites["animated"]
-
-                            self.version_sprites[generation][
-                                game
+                                sprites = {
+                                    key: value
+                                    for key, value in sprites.items()
+                                    if key != "animated"
+                                }
+
+                            version_sprites[generation][
+                                intern(game)
                             ] = Pokemon._extract_sprites(sprites)
 
                 else:
                     regular_sprite_keys[sprite_key] = associated_data
 
-            self.sprites = Pokemon._extract_sprites(regular_sprite_keys)
+            regular_sprites = Pokemon._extract_sprites(regular_sprite_keys)
 
-        except KeyError as error:
+        except (AttributeError, ValueError) as error:
             raise PyPokedexError(
-                "A required piece of data was not found for the current Pokemon!"
+                "The sprite data for the current Pokemon is malformed!"
             ) from error
 
+        return regular_sprites, other_sprites, version_sprites
+
     @staticmethod
     def _extract_sprites(all_sprites: SpriteKeys) -> Sprites:
         result = Sprites(front={}, back={})
@@ -144,9 +331,9 @@ class Pokemon:
             sprite_direction, sprite_type = sprite.split("_", 1)
 
             if sprite_direction == "front":
-                result.front[sprite_type] = url
+                result.front[intern(sprite_type)] = url
             else:
-                result.back[sprite_type] = url
+                result.back[intern(sprite_type)] = url
 
         return result
 
@@ -160,34 +347,290 @@ class Pokemon:
         if not self.exists_in(game):
             raise PyPokedexError(f"{self.name} is not obtainable in {game}!")
 
-        for move in self.moves[game]:
-            if move.name == move_name:
-                return True
+        return move_name in self._index().move_names.get(game, frozenset())
+
+    def learnable_in(self, move_name: str) -> Dict[str, List[Move]]:
+        """Returns the games in which the current Pokemon learns the specified
+        move, along with how it learns the move in each of them."""
+        return {
+            game: list(moves)
+            for game, moves in self._index().by_move.get(move_name, {}).items()
+        }
+
+    def moves_learned_by_level(self, game: str, max_level: int) -> List[Move]:
+        """Returns the moves the current Pokemon learns by level-up at or below
+        the specified level in the specified game, sorted by level."""
+        if not self.exists_in(game):
+            raise PyPokedexError(f"{self.name} is not obtainable in {game}!")
+
+        levels, moves = self._index().level_up.get(game, ([], []))
+        return moves[: bisect_right(levels, max_level)]
+
+    def _index(self) -> "_MoveIndex":
+        if self._move_index is None:
+            moves = self.moves
+
+            with _parse_lock:
+                if self._move_index is None:
+                    self._move_index = _MoveIndex.build(moves)
+        return self._move_index
 
-        return False
+    def type_details(self) -> List[resources.TypeDetails]:
+        """Fetches (once per type) the details of the current Pokemon's types,
+        like their damage relations, from PokeAPI."""
+        return [resources.get_type(type_) for type_ in self.types]
 
     def get_descriptions(self, language="en") -> Dict[str, str]:
         """Returns all the descriptions of the current Pokemon for the specified
         language (en by default)"""
-        try:
-            response = requests.get(f"{POKEAPI_SPECIES_URL}/{self.dex}", timeout=3)
-            response.raise_for_status()
-        except requests.exceptions.HTTPError as error:
-            raise PyPokedexHTTPError(
-                f"An HTTP error occurred! (Status code: {response.status_code})",
-                response.status_code,
-            ) from error
-        except requests.exceptions.RequestException as error:
-            raise PyPokedexError("An internal requests exception occurred!") from error
-
-        flavor_text_entries: List[dict] = response.json()["flavor_text_entries"]
-
-        result = {}
+        return dict(self._descriptions_index().get(language, {}))
+
+    def get_all_descriptions(
+        self, languages: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, str]]:
+        """Returns the descriptions of the current Pokemon for each of the
+        specified languages (all available languages by default)"""
+        descriptions = self._descriptions_index()
+
+        if languages is None:
+            languages = descriptions.keys()
+
+        return {
+            language: dict(descriptions.get(language, {})) for language in languages
+        }
+
+    def _descriptions_index(self) -> Dict[str, Dict[str, str]]:
+        # The species document is only fetched once per Pokemon, then kept as
+        # an index of language -> version -> description
+        descriptions = self._descriptions
+        if descriptions is not None:
+            return descriptions
+
+        snapshot = get_snapshot()
+        if snapshot is not None:
+            species = snapshot.species_json(self.dex)
+            cache_lookup("snapshot", "pokemon-species", species is not None)
+            if species is not None:
+                with timed("parse", endpoint="pokemon-species"):
+                    return self._load_descriptions(species)
+
+        url = f"{POKEAPI_SPECIES_URL}/{self.dex}"
+
+        def fetch() -> Dict[str, Dict[str, str]]:
+            # Another thread may have loaded them since they were checked
+            if self._descriptions is not None:
+                return self._descriptions
+
+            species = fetch_json(url)
+            with timed("parse", endpoint="pokemon-species"):
+                return self._load_descriptions(species)
+
+        # Concurrent calls (from any thread) share a single request
+        self._descriptions = _species_in_flight.run(
+            url, fetch, endpoint="pokemon-species"
+        )
+        return self._descriptions
+
+    def _load_descriptions(self, species) -> Dict[str, Dict[str, str]]:
+        flavor_text_entries: List[dict] = species["flavor_text_entries"]
+
+        descriptions: Dict[str, Dict[str, str]] = {}
         for entry in flavor_text_entries:
-            if entry["language"]["name"] == language:
-                result[entry["version"]["name"]] = entry["flavor_text"]
+            language = intern(entry["language"]["name"])
+            version = intern(entry["version"]["name"])
+            descriptions.setdefault(language, {})[version] = entry["flavor_text"]
+
+        self._descriptions = descriptions
+        return descriptions
+
+    def to_bytes(self) -> bytes:
+        """Serializes the current Pokemon (including its descriptions, if they
+        were fetched) into a compact binary format, for pickling or external
+        caches. from_bytes() rebuilds it without the original JSON."""
+        # Every string is stored once in a table and referred to by index, and
+        # the whole document is then compressed (sprite URLs mostly share long
+        # prefixes)
+        strings: Dict[str, int] = {}
+
+        def ref(string: str) -> int:
+            return strings.setdefault(string, len(strings))
+
+        def sprite_refs(sprites: Sprites) -> List[List[Optional[int]]]:
+            return [
+                [
+                    item
+                    for key, url in directory.items()
+                    for item in (ref(key), None if url is None else ref(url))
+                ]
+                for directory in (sprites.front, sprites.back)
+            ]
 
-        return result
+        regular_sprites, other_sprites, version_sprites = self._sprite_data()
+
+        document = [
+            self.dex,
+            ref(self.name),
+            self.height,
+            self.weight,
+            self.base_experience,
+            list(self.base_stats),
+            [
+                item
+                for ability in self.abilities
+                for item in (ref(ability.name), int(ability.is_hidden))
+            ],
+            [ref(type_) for type_ in self.types],
+            [
+                [
+                    ref(game),
+                    [
+                        item
+                        for move in moves
+                        for item in (
+                            ref(move.name),
+                            ref(move.learn_method),
+                            move.level or 0,
+                        )
+                    ],
+                ]
+                for game, moves in self.moves.items()
+            ],
+            sprite_refs(regular_sprites),
+            [
+                [ref(group), sprite_refs(sprites)]
+                for group, sprites in other_sprites.items()
+            ],
+            [
+                [
+                    ref(generation),
+                    [
+                        [ref(game), sprite_refs(sprites)]
+                        for game, sprites in games.items()
+                    ],
+                ]
+                for generation, games in version_sprites.items()
+            ],
+            None
+            if self._descriptions is None
+            else [
+                [
+                    ref(language),
+                    [
+                        item
+                        for version, text in versions.items()
+                        for item in (ref(version), ref(text))
+                    ],
+                ]
+                for language, versions in self._descriptions.items()
+            ],
+        ]
+
+        return _SERIALIZED_HEADER.pack(
+            _SERIALIZED_MAGIC, _SERIALIZED_VERSION
+        ) + zlib.compress(dumps([list(strings), document]))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Pokemon":
+        """Rebuilds a Pokemon serialized with to_bytes()."""
+        try:
+            magic, version = _SERIALIZED_HEADER.unpack_from(data)
+            if magic != _SERIALIZED_MAGIC or version != _SERIALIZED_VERSION:
+                raise ValueError("Unsupported header")
+
+            strings, document = loads(
+                zlib.decompress(memoryview(data)[_SERIALIZED_HEADER.size :])
+            )
+            (
+                dex,
+                name,
+                height,
+                weight,
+                base_experience,
+                base_stats,
+                abilities,
+                types,
+                moves,
+                regular_sprites,
+                other_sprites,
+                version_sprites,
+                descriptions,
+            ) = document
+
+            def sprites_from(refs: List[List[Optional[int]]]) -> Sprites:
+                front, back = (
+                    {
+                        intern(strings[directory[index]]): (
+                            None
+                            if directory[index + 1] is None
+                            else strings[directory[index + 1]]
+                        )
+                        for index in range(0, len(directory), 2)
+                    }
+                    for directory in refs
+                )
+                return Sprites(front=front, back=back)
+
+            pokemon = cls.__new__(cls)
+            pokemon.dex = dex
+            pokemon.name = intern(strings[name])
+            pokemon.height = height
+            pokemon.weight = weight
+            pokemon.base_experience = base_experience
+            pokemon.base_stats = BaseStats(*base_stats)
+            pokemon.abilities = [
+                Ability(intern(strings[abilities[index]]), bool(abilities[index + 1]))
+                for index in range(0, len(abilities), 2)
+            ]
+            pokemon.types = [intern(strings[type_]) for type_ in types]
+
+            pokemon._moves = defaultdict(list)
+            for game, game_moves in moves:
+                pokemon._moves[intern(strings[game])] = [
+                    _shared_move(
+                        strings[game_moves[index]],
+                        strings[game_moves[index + 1]],
+                        game_moves[index + 2] or None,
+                    )
+                    for index in range(0, len(game_moves), 3)
+                ]
+
+            pokemon._parsed_sprites = (
+                sprites_from(regular_sprites),
+                {
+                    intern(strings[group]): sprites_from(sprites)
+                    for group, sprites in other_sprites
+                },
+                {
+                    intern(strings[generation]): {
+                        intern(strings[game]): sprites_from(sprites)
+                        for game, sprites in games
+                    }
+                    for generation, games in version_sprites
+                },
+            )
+
+            pokemon._descriptions = (
+                None
+                if descriptions is None
+                else {
+                    intern(strings[language]): {
+                        intern(strings[versions[index]]): strings[versions[index + 1]]
+                        for index in range(0, len(versions), 2)
+                    }
+                    for language, versions in descriptions
+                }
+            )
+
+        except (struct.error, zlib.error, ValueError, TypeError, IndexError) as error:
+            raise PyPokedexError("The serialized Pokemon data is malformed!") from error
+
+        pokemon._raw_moves = None
+        pokemon._raw_sprites = None
+        pokemon._move_index = None
+        return pokemon
+
+    def __reduce__(self):
+        return Pokemon.from_bytes, (self.to_bytes(),)
 
     def __str__(self) -> str:
         """Returns a human-readable representation of the current Pokemon."""
@@ -0,0 +1,52 @@
+"""A token-bucket rate limiter shared by threads and asyncio tasks alike."""
+
+import time
+from threading import Lock
+
+
+class TokenBucket:
+    """Allows rate requests per second on average, with bursts of up to burst
+    requests.
+
+    Tokens are reserved under a lock without waiting for them, so the same
+    bucket can be shared by any number of threads (acquire) and asyncio tasks,
+    even on different event loops (acquire_async).
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive!")
+        if burst < 1:
+            raise ValueError("burst must be at least 1!")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = Lock()
+
+    def reserve(self) -> float:
+        """Takes a token, returning how many seconds to wait before it can be
+        used."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            # The balance can go negative, which queues up later callers
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        # asyncio is slow to import, and only needed by asyncio code
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,222 @@
+"""Moves, types, abilities and version groups from PokeAPI.
+
+Resources are fetched on first use, through the same HTTP client (and on-disk
+cache, if enabled) as Pokemon, then kept in memory. Each one is only fetched
+once, however many Pokemon refer to it and however many threads ask for it at
+the same time.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from sys import intern
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pypokedex import instrumentation
+from pypokedex.cache import Cache, SingleFlight
+from pypokedex.client import fetch_json
+from pypokedex.constants import POKEAPI_API_URL
+from pypokedex.exceptions import PyPokedexError
+
+MOVE = "move"
+TYPE = "type"
+ABILITY = "ability"
+VERSION_GROUP = "version-group"
+
+Key = Union[int, str]
+
+
+def _names(resources: List[Dict[str, Any]]) -> Tuple[str, ...]:
+    return tuple(intern(resource["name"]) for resource in resources)
+
+
+def _english_effects(document: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    for entry in document.get("effect_entries", []):
+        if entry["language"]["name"] == "en":
+            return entry["effect"], entry["short_effect"]
+    return None, None
+
+
+class MoveDetails(NamedTuple):
+    id: int
+    name: str
+    type: str
+    damage_class: Optional[str]
+    power: Optional[int]
+    accuracy: Optional[int]
+    pp: Optional[int]
+    priority: int
+    effect: Optional[str]
+    short_effect: Optional[str]
+
+    @staticmethod
+    def from_json(document: Dict[str, Any]) -> "MoveDetails":
+        damage_class = document["damage_class"]
+        return MoveDetails(
+            document["id"],
+            intern(document["name"]),
+            intern(document["type"]["name"]),
+            intern(damage_class["name"]) if damage_class else None,
+            document["power"],
+            document["accuracy"],
+            document["pp"],
+            document["priority"],
+            *_english_effects(document),
+        )
+
+
+class TypeDetails(NamedTuple):
+    id: int
+    name: str
+    double_damage_to: Tuple[str, ...]
+    half_damage_to: Tuple[str, ...]
+    no_damage_to: Tuple[str, ...]
+    double_damage_from: Tuple[str, ...]
+    half_damage_from: Tuple[str, ...]
+    no_damage_from: Tuple[str, ...]
+
+    @staticmethod
+    def from_json(document: Dict[str, Any]) -> "TypeDetails":
+        relations = document["damage_relations"]
+        return TypeDetails(
+            document["id"],
+            intern(document["name"]),
+            _names(relations["double_damage_to"]),
+            _names(relations["half_damage_to"]),
+            _names(relations["no_damage_to"]),
+            _names(relations["double_damage_from"]),
+            _names(relations["half_damage_from"]),
+            _names(relations["no_damage_from"]),
+        )
+
+
+class AbilityDetails(NamedTuple):
+    id: int
+    name: str
+    is_main_series: bool
+    effect: Optional[str]
+    short_effect: Optional[str]
+
+    @staticmethod
+    def from_json(document: Dict[str, Any]) -> "AbilityDetails":
+        return AbilityDetails(
+            document["id"],
+            intern(document["name"]),
+            document["is_main_series"],
+            *_english_effects(document),
+        )
+
+
+class VersionGroupDetails(NamedTuple):
+    id: int
+    name: str
+    order: int
+    generation: str
+    versions: Tuple[str, ...]
+
+    @staticmethod
+    def from_json(document: Dict[str, Any]) -> "VersionGroupDetails":
+        return VersionGroupDetails(
+            document["id"],
+            intern(document["name"]),
+            document["order"],
+            intern(document["generation"]["name"]),
+            _names(document["versions"]),
+        )
+
+
+_PARSERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    MOVE: MoveDetails.from_json,
+    TYPE: TypeDetails.from_json,
+    ABILITY: AbilityDetails.from_json,
+    VERSION_GROUP: VersionGroupDetails.from_json,
+}
+
+# There are only a few thousand resources in total, so none are evicted by
+# default
+_cache = Cache(maxsize=None)
+_in_flight = SingleFlight()
+
+
+def get_cache() -> Cache:
+    """Returns the cache currently used for resources."""
+    return _cache
+
+
+def set_cache(cache: Cache) -> None:
+    """Replaces the cache used for resources."""
+    global _cache  # pylint: disable=global-statement
+    _cache = cache
+
+
+def get_resource(endpoint: str, key: Key) -> Any:
+    """Returns the resource of an endpoint (MOVE, TYPE, ABILITY or
+    VERSION_GROUP) with the specified name or id."""
+    if endpoint not in _PARSERS:
+        raise ValueError(f"Unknown endpoint {endpoint}!")
+    if isinstance(key, str):
+        key = key.lower()
+
+    # Resources are stored under their id, with their name as an alias
+    cache_key = (endpoint, key)
+    cached = _cache.get(cache_key)
+    instrumentation.cache_lookup("memory", endpoint, cached is not None)
+    if cached is not None:
+        return cached
+
+    def fetch() -> Any:
+        if cache_key in _cache:
+            return _cache.get(cache_key)
+
+        document = fetch_json(
+            f"{POKEAPI_API_URL}/{endpoint}/{key}",
+            f"The requested {endpoint} was not found!",
+        )
+
+        try:
+            with instrumentation.timed("parse", endpoint=endpoint):
+                resource = _PARSERS[endpoint](document)
+        except (KeyError, TypeError) as error:
+            raise PyPokedexError(
+                f"A required piece of data was not found for the current {endpoint}!"
+            ) from error
+
+        _cache.set(
+            (endpoint, resource.id),
+            resource,
+            aliases=[(endpoint, resource.name), cache_key],
+        )
+        return resource
+
+    return _in_flight.run(cache_key, fetch, endpoint=endpoint)
+
+
+def get_many(endpoint: str, keys: Iterable[Key], workers: int = 8) -> List[Any]:
+    """Fetches several resources of an endpoint concurrently, returning them in
+    the same order as keys. Resources already cached aren't fetched again."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda key: get_resource(endpoint, key), keys))
+
+
+def get_move(key: Key) -> MoveDetails:
+    return get_resource(MOVE, key)
+
+
+def get_type(key: Key) -> TypeDetails:
+    return get_resource(TYPE, key)
+
+
+def get_ability(key: Key) -> AbilityDetails:
+    return get_resource(ABILITY, key)
+
+
+def get_version_group(key: Key) -> VersionGroupDetails:
+    return get_resource(VERSION_GROUP, key)
@@ -0,0 +1,88 @@
+"""Retrying transient PokeAPI failures with exponential backoff."""
+
+import math
+import random
+import time
+from datetime import timezone
+from typing import Optional, Sequence
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is retried.
+
+    Retries wait backoff_factor * 2 ** attempt seconds (capped at max_backoff),
+    of which a random fraction of up to jitter is shaved off so that many
+    clients don't retry in lockstep. A Retry-After header, when present and
+    respect_retry_after is set, takes precedence, but is capped at
+    max_retry_after seconds.
+    """
+
+    def __init__(
+        self,
+        retries: int = 2,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        jitter: float = 0.5,
+        statuses: Sequence[int] = RETRY_STATUSES,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60,
+    ) -> None:
+        if retries < 0:
+            raise ValueError("retries must be a non-negative integer!")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1!")
+
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def should_retry(self, attempt: int, status_code: Optional[int] = None) -> bool:
+        """Checks whether a request is retried after its attempt-th failure
+        (counting from 0), either with status_code or with a connection error
+        if status_code is None."""
+        if attempt >= self.retries:
+            return False
+        return status_code is None or status_code in self.statuses
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Returns how many seconds to wait before retrying after the
+        attempt-th failure."""
+        if retry_after is not None and self.respect_retry_after:
+            seconds = parse_retry_after(retry_after)
+            if seconds is not None:
+                return min(seconds, self.max_retry_after)
+
+        backoff = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        return backoff * (1 - self.jitter * random.random())
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """Parses a Retry-After header, which is either a number of seconds or an
+    HTTP date. Returns None if it is malformed."""
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        # float() also accepts inf and nan, which no server means
+        return max(0.0, seconds) if math.isfinite(seconds) else None
+
+    # email.utils is slow to import, and dates are rarely used in Retry-After
+    from email.utils import (  # pylint: disable=import-outside-toplevel
+        parsedate_to_datetime,
+    )
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, retry_at.timestamp() - time.time())
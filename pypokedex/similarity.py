@@ -0,0 +1,211 @@
+"""Nearest-neighbor search over base stats (and optionally height and weight).
+
+Distances from a query to every Pokemon are computed in one vectorized pass
+with NumPy when it is installed, and with plain lists otherwise.
+"""
+
+import heapq
+import math
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Union
+
+from pypokedex._numpy import numpy, resolve_use_numpy
+from pypokedex.pokedex import STAT_COLUMNS, Pokedex
+from pypokedex.pokemon import BaseStats, Pokemon
+
+SIZE_COLUMNS = ("height", "weight")
+METRICS = ("euclidean", "manhattan", "chebyshev", "cosine")
+
+Target = Union[Pokemon, BaseStats, Sequence[float]]
+
+
+class Neighbor(NamedTuple):
+    dex: int
+    name: str
+    distance: float
+
+
+def _cosine_distance(first: Sequence[float], second: Sequence[float]) -> float:
+    norms = math.sqrt(sum(a * a for a in first)) * math.sqrt(sum(b * b for b in second))
+    if norms == 0:
+        return 1.0
+    return 1 - sum(a * b for a, b in zip(first, second)) / norms
+
+
+_DISTANCES: Dict[str, Callable[[Sequence[float], Sequence[float]], float]] = {
+    "euclidean": lambda first, second: math.sqrt(
+        sum((a - b) ** 2 for a, b in zip(first, second))
+    ),
+    "manhattan": lambda first, second: sum(abs(a - b) for a, b in zip(first, second)),
+    "chebyshev": lambda first, second: max(abs(a - b) for a, b in zip(first, second)),
+    "cosine": _cosine_distance,
+}
+
+
+class StatIndex:
+    """An index of Pokemon by their base stats, for finding the Pokemon with the
+    most similar stats to a Pokemon or a target stat spread.
+
+    With include_size, height and weight are features too. Features can be
+    standardized (to zero mean and unit variance across the indexed Pokemon) so
+    that they weigh equally, which is the default with include_size since
+    weights are much larger numbers than stats.
+    """
+
+    def __init__(
+        self,
+        dex: Sequence[int],
+        names: Sequence[str],
+        rows: Sequence[Sequence[float]],
+        include_size: bool = False,
+        standardize: Optional[bool] = None,
+        use_numpy: Optional[bool] = None,
+    ) -> None:
+        use_numpy = resolve_use_numpy(use_numpy)
+
+        self.include_size = include_size
+        self.features = STAT_COLUMNS + (SIZE_COLUMNS if include_size else ())
+        self.use_numpy = use_numpy
+        self._dex = list(dex)
+        self._names = list(names)
+        self._positions = {number: index for index, number in enumerate(self._dex)}
+
+        count = len(self._dex)
+        means = [0.0] * len(self.features)
+        scales = [1.0] * len(self.features)
+        if (include_size if standardize is None else standardize) and count:
+            for column in range(len(self.features)):
+                values = [row[column] for row in rows]
+                means[column] = sum(values) / count
+                variance = sum((value - means[column]) ** 2 for value in values)
+                scales[column] = math.sqrt(variance / count) or 1.0
+
+        self._means = means
+        self._scales = scales
+        scaled = [self._scale(row) for row in rows]
+        self._rows: Any = (
+            numpy.array(scaled, dtype=numpy.float64) if use_numpy else scaled
+        )
+
+    @classmethod
+    def from_pokemon(
+        cls,
+        pokemon: Sequence[Pokemon],
+        include_size: bool = False,
+        standardize: Optional[bool] = None,
+        use_numpy: Optional[bool] = None,
+    ) -> "StatIndex":
+        return cls(
+            [current.dex for current in pokemon],
+            [current.name for current in pokemon],
+            [cls._features_of(current, include_size) for current in pokemon],
+            include_size,
+            standardize,
+            use_numpy,
+        )
+
+    @classmethod
+    def from_pokedex(
+        cls,
+        pokedex: Pokedex,
+        include_size: bool = False,
+        standardize: Optional[bool] = None,
+        use_numpy: Optional[bool] = None,
+    ) -> "StatIndex":
+        """Builds an index from the columns of a Pokedex, without fetching any
+        Pokemon."""
+        columns = STAT_COLUMNS + (SIZE_COLUMNS if include_size else ())
+        values = [list(pokedex.column(column)) for column in columns]
+        return cls(
+            pokedex.dex_numbers(),
+            pokedex.names(),
+            [[float(value) for value in row] for row in zip(*values)],
+            include_size,
+            standardize,
+            use_numpy,
+        )
+
+    def __len__(self) -> int:
+        return len(self._dex)
+
+    def nearest(
+        self, target: Target, k: int = 5, metric: str = "euclidean"
+    ) -> List[Neighbor]:
+        """Returns the k Pokemon closest to target (a Pokemon, BaseStats, or one
+        value per feature), closest first. A Pokemon isn't its own neighbor."""
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric}!")
+
+        query = self._scale(self._target_features(target))
+        excluded = (
+            self._positions.get(target.dex) if isinstance(target, Pokemon) else None
+        )
+
+        if self.use_numpy:
+            distances = self._numpy_distances(numpy.array(query), metric)
+            if excluded is not None:
+                distances[excluded] = numpy.inf
+
+            count = min(k, len(self._dex) - (excluded is not None))
+            if count <= 0:
+                return []
+            candidates = numpy.argpartition(distances, count - 1)[:count]
+            order = candidates[numpy.argsort(distances[candidates], kind="stable")]
+            return [self._neighbor(int(index), distances[index]) for index in order]
+
+        distance = _DISTANCES[metric]
+        return [
+            self._neighbor(index, value)
+            for value, index in heapq.nsmallest(
+                k,
+                (
+                    (distance(row, query), index)
+                    for index, row in enumerate(self._rows)
+                    if index != excluded
+                ),
+            )
+        ]
+
+    def _numpy_distances(self, query: Any, metric: str) -> Any:
+        if metric == "cosine":
+            norms = numpy.linalg.norm(self._rows, axis=1) * numpy.linalg.norm(query)
+            similarity = numpy.divide(
+                self._rows @ query,
+                norms,
+                out=numpy.zeros(len(self._rows)),
+                where=norms != 0,
+            )
+            return 1 - similarity
+
+        differences = numpy.abs(self._rows - query)
+        if metric == "euclidean":
+            return numpy.sqrt((differences * differences).sum(axis=1))
+        if metric == "manhattan":
+            return differences.sum(axis=1)
+        return differences.max(axis=1)
+
+    def _neighbor(self, index: int, distance: float) -> Neighbor:
+        return Neighbor(self._dex[index], self._names[index], float(distance))
+
+    def _scale(self, row: Sequence[float]) -> List[float]:
+        return [
+            (value - mean) / scale
+            for value, mean, scale in zip(row, self._means, self._scales)
+        ]
+
+    def _target_features(self, target: Target) -> List[float]:
+        if isinstance(target, Pokemon):
+            return self._features_of(target, self.include_size)
+
+        features = [float(value) for value in target]
+        if len(features) != len(self.features):
+            raise ValueError(
+                f"Expected {len(self.features)} values ({', '.join(self.features)})!"
+            )
+        return features
+
+    @staticmethod
+    def _features_of(pokemon: Pokemon, include_size: bool) -> List[float]:
+        features = [float(value) for value in pokemon.base_stats]
+        if include_size:
+            features += [float(pokemon.height), float(pokemon.weight)]
+        return features
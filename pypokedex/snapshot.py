@@ -0,0 +1,215 @@
+"""Offline snapshots of PokeAPI data.
+
+A snapshot is a single binary file holding the pokemon and (optionally)
+pokemon-species documents of many Pokemon, trimmed down to the data pypokedex
+uses. Once loaded with use_snapshot(), pypokedex.get() and
+Pokemon.get_descriptions() are served from it without touching the network.
+
+Snapshots are memory-mapped rather than read into memory, so worker processes
+loading the same file share its pages through the OS page cache. Documents are
+only decoded when they are requested.
+
+File layout (all integers little-endian):
+
+- Header: magic, format version, record count, names offset, names length
+- Records: one (dex, pokemon offset, pokemon length, species offset, species
+  length) entry per Pokemon, sorted by dex number
+- Documents: compact JSON for every pokemon and species document
+- Names: a JSON object mapping Pokemon names to dex numbers
+"""
+
+import mmap
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from pypokedex.client import fetch_json
+from pypokedex.constants import POKEAPI_BASE_URL, POKEAPI_SPECIES_URL
+from pypokedex.exceptions import PyPokedexError
+from pypokedex.parsing import dumps, loads, trim_pokemon, trim_species
+
+MAGIC = b"PYPKDEX\x00"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQQ")
+_RECORD = struct.Struct("<IQIQI")
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+def write_snapshot(
+    path: PathLike,
+    documents: Iterable[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]],
+) -> None:
+    """Writes (pokemon, species) document pairs to a snapshot file. species
+    may be None for Pokemon without descriptions."""
+    entries = sorted(
+        (
+            (
+                pokemon["id"],
+                pokemon["name"],
+                dumps(trim_pokemon(pokemon)),
+                dumps(trim_species(species)) if species is not None else b"",
+            )
+            for pokemon, species in documents
+        ),
+        key=lambda entry: entry[0],
+    )
+
+    offset = _HEADER.size + _RECORD.size * len(entries)
+    records = []
+    for dex, _, pokemon, species in entries:
+        records.append(
+            _RECORD.pack(dex, offset, len(pokemon), offset + len(pokemon), len(species))
+        )
+        offset += len(pokemon) + len(species)
+
+    names = dumps({name: dex for dex, name, _, _ in entries})
+    path = os.fspath(path)
+    temporary_path = f"{path}.tmp"
+
+    # Written to a temporary file first so a reader never sees a partial file
+    with open(temporary_path, "wb") as snapshot_file:
+        snapshot_file.write(
+            _HEADER.pack(MAGIC, VERSION, len(entries), offset, len(names))
+        )
+        snapshot_file.writelines(records)
+        for _, _, pokemon, species in entries:
+            snapshot_file.write(pokemon)
+            snapshot_file.write(species)
+        snapshot_file.write(names)
+
+    os.replace(temporary_path, path)
+
+
+def build_snapshot(
+    path: PathLike,
+    dex: Iterable[int] = range(1, 1026),
+    species: bool = True,
+    workers: int = 8,
+) -> None:
+    """Downloads the specified Pokemon (and their species documents, used for
+    descriptions) from PokeAPI and writes them to a snapshot file."""
+
+    def fetch(number: int) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        pokemon = fetch_json(f"{POKEAPI_BASE_URL}/{number}")
+        if not species:
+            return pokemon, None
+        return pokemon, fetch_json(f"{POKEAPI_SPECIES_URL}/{pokemon['id']}")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        write_snapshot(path, list(executor.map(fetch, dex)))
+
+
+class Snapshot:
+    """A read-only, memory-mapped view of a snapshot file."""
+
+    def __init__(self, path: PathLike) -> None:
+        self.path = os.fspath(path)
+
+        with open(self.path, "rb") as snapshot_file:
+            self._mmap = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, count, names_offset, names_length = _HEADER.unpack_from(
+                self._mmap
+            )
+        except struct.error as error:
+            self._mmap.close()
+            raise PyPokedexError(f"{self.path} is not a pypokedex snapshot!") from error
+
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise PyPokedexError(
+                f"{self.path} is not a pypokedex snapshot (version {VERSION})!"
+            )
+
+        self._count = count
+        self._names: Dict[str, int] = loads(
+            self._mmap[names_offset : names_offset + names_length]
+        )
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, subpage: Union[int, str]) -> bool:
+        return self._find(subpage) is not None
+
+    def dex_numbers(self) -> List[int]:
+        return [self._record(index)[0] for index in range(self._count)]
+
+    def names(self) -> Dict[str, int]:
+        """Returns the names of the Pokemon in the snapshot, mapped to their dex
+        numbers."""
+        return dict(self._names)
+
+    def pokemon_json(self, subpage: Union[int, str]) -> Optional[Dict[str, Any]]:
+        """Returns the pokemon document for a dex number or name, or None if it
+        isn't part of the snapshot."""
+        record = self._find(subpage)
+        if record is None:
+            return None
+        return self._document(record[1], record[2])
+
+    def species_json(self, dex: int) -> Optional[Dict[str, Any]]:
+        """Returns the pokemon-species document for a dex number, or None if it
+        isn't part of the snapshot."""
+        record = self._find(dex)
+        if record is None or record[4] == 0:
+            return None
+        return self._document(record[3], record[4])
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def _record(self, index: int) -> Tuple[int, int, int, int, int]:
+        return _RECORD.unpack_from(self._mmap, _HEADER.size + index * _RECORD.size)
+
+    def _find(
+        self, subpage: Union[int, str]
+    ) -> Optional[Tuple[int, int, int, int, int]]:
+        dex = self._names.get(subpage) if isinstance(subpage, str) else subpage
+        if dex is None:
+            return None
+
+        # Binary search over the records, which are sorted by dex number
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            record = self._record(middle)
+            if record[0] < dex:
+                low = middle + 1
+            elif record[0] > dex:
+                high = middle
+            else:
+                return record
+
+        return None
+
+    def _document(self, offset: int, length: int) -> Dict[str, Any]:
+        return loads(self._mmap[offset : offset + length])
+
+
+_snapshot: Optional[Snapshot] = None
+_snapshot_lock = Lock()
+
+
+def get_snapshot() -> Optional[Snapshot]:
+    """Returns the snapshot get() and get_descriptions() are served from, if
+    one is loaded."""
+    return _snapshot
+
+
+def use_snapshot(path: Optional[PathLike]) -> Optional[Snapshot]:
+    """Loads a snapshot file for get() and get_descriptions() to be served from
+    (or with None, unloads the current one). Pokemon missing from the snapshot
+    are still fetched from PokeAPI."""
+    global _snapshot  # pylint: disable=global-statement
+
+    with _snapshot_lock:
+        if _snapshot is not None:
+            _snapshot.close()
+        _snapshot = Snapshot(path) if path is not None else None
+        return _snapshot
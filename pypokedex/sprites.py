@@ -0,0 +1,210 @@
+"""Downloading sprite images into a content-addressed cache on disk.
+
+Images are stored under the SHA-256 digest of their content, so an image shared
+by several URLs (or Pokemon) is only stored once, and every URL that was
+downloaded is recorded so it is never fetched again. Images are streamed to
+disk in chunks, so downloading many at once never holds them all in memory.
+"""
+
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
+
+import requests
+
+from pypokedex import instrumentation
+from pypokedex.client import get_client, http_error
+from pypokedex.exceptions import PyPokedexError
+from pypokedex.pokemon import Pokemon, Sprites
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class SpriteDownload(NamedTuple):
+    url: str
+    path: Optional[str]
+    error: Optional[PyPokedexError]
+
+
+class SpriteCache:
+    """A directory of images named after the digest of their content.
+
+    Layout: objects/<first 2 digits>/<digest> for images, and
+    urls/<digest of the URL> files holding the digest of each URL's image.
+    """
+
+    def __init__(self, directory: PathLike) -> None:
+        self.directory = os.fspath(directory)
+        os.makedirs(os.path.join(self.directory, "objects"), exist_ok=True)
+        os.makedirs(os.path.join(self.directory, "urls"), exist_ok=True)
+
+    def __contains__(self, url: str) -> bool:
+        return self.path_for(url) is not None
+
+    def path_for(self, url: str) -> Optional[str]:
+        """Returns the path of the image downloaded from url, or None if it
+        wasn't downloaded."""
+        try:
+            with open(self._url_path(url), encoding="ascii") as url_file:
+                digest = url_file.read()
+        except FileNotFoundError:
+            return None
+
+        path = self._object_path(digest)
+        return path if os.path.exists(path) else None
+
+    def store(self, url: str, chunks: Iterable[bytes]) -> str:
+        """Writes an image to the cache as its chunks arrive, and returns its
+        path."""
+        digest = hashlib.sha256()
+        objects = os.path.join(self.directory, "objects")
+
+        # The image is written to a temporary file while its digest (and so
+        # its final name) is computed
+        descriptor, temporary_path = tempfile.mkstemp(dir=objects)
+        try:
+            with os.fdopen(descriptor, "wb") as image_file:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    image_file.write(chunk)
+
+            path = self._object_path(digest.hexdigest())
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+        self._write_atomically(self._url_path(url), digest.hexdigest())
+        return path
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "objects", digest[:2], digest)
+
+    def _url_path(self, url: str) -> str:
+        url_digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, "urls", url_digest)
+
+    @staticmethod
+    def _write_atomically(path: str, text: str) -> None:
+        descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(descriptor, "w", encoding="ascii") as text_file:
+                text_file.write(text)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+
+def _urls(sprites: Sprites) -> Iterator[str]:
+    for url in [*sprites.front.values(), *sprites.back.values()]:
+        if url is not None:
+            yield url
+
+
+def sprite_urls(pokemon: Pokemon, groups: Optional[Iterable[str]] = None) -> List[str]:
+    """Returns the URLs of a Pokemon's sprites, without duplicates.
+
+    groups selects which sprites are included, by name: "default" for
+    Pokemon.sprites, the keys of Pokemon.other_sprites (e.g. "official-artwork")
+    and those of Pokemon.version_sprites (e.g. "generation-v"). By default,
+    every sprite is included.
+    """
+    selected = None if groups is None else set(groups)
+    urls: List[str] = []
+
+    if selected is None or "default" in selected:
+        urls.extend(_urls(pokemon.sprites))
+
+    for group, sprites in pokemon.other_sprites.items():
+        if selected is None or group in selected:
+            urls.extend(_urls(sprites))
+
+    for generation, games in pokemon.version_sprites.items():
+        if selected is None or generation in selected:
+            for sprites in games.values():
+                urls.extend(_urls(sprites))
+
+    return list(dict.fromkeys(urls))
+
+
+def _download(url: str, cache: SpriteCache) -> SpriteDownload:
+    path = cache.path_for(url)
+    instrumentation.cache_lookup("sprites", "sprites", path is not None)
+    if path is not None:
+        return SpriteDownload(url, path, None)
+
+    try:
+        with instrumentation.timed("request", endpoint="sprites", url=url) as request:
+            response = get_client().get(url, stream=True)
+            request["status_code"] = response.status_code
+
+        with response:
+            if not response.ok:
+                instrumentation.emit(
+                    "error",
+                    attributes={
+                        "endpoint": "sprites",
+                        "status_code": response.status_code,
+                    },
+                )
+                return SpriteDownload(
+                    url, None, http_error(response.status_code, "Sprite not found!")
+                )
+
+            path = cache.store(url, response.iter_content(_CHUNK_SIZE))
+
+    except requests.exceptions.RequestException as error:
+        instrumentation.emit(
+            "error", attributes={"endpoint": "sprites", "error": type(error).__name__}
+        )
+        failure = PyPokedexError("An internal requests exception occurred!")
+        failure.__cause__ = error
+        return SpriteDownload(url, None, failure)
+
+    return SpriteDownload(url, path, None)
+
+
+def download_sprites(
+    sprites: Union[Pokemon, Sequence[str]],
+    cache: SpriteCache,
+    groups: Optional[Iterable[str]] = None,
+    workers: int = 8,
+) -> List[SpriteDownload]:
+    """Downloads the sprites of a Pokemon (optionally only some groups, see
+    sprite_urls) or a sequence of sprite URLs concurrently into cache, and
+    returns where each was stored, in order.
+
+    Images already in the cache aren't downloaded again, and failed downloads
+    are reported through SpriteDownload.error instead of aborting the batch.
+    """
+    if isinstance(sprites, Pokemon):
+        urls = sprite_urls(sprites, groups)
+    else:
+        urls = list(sprites)
+
+    # A URL listed more than once is only downloaded once, but still gets a
+    # result at each of its positions
+    unique_urls = list(dict.fromkeys(urls))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        downloads = dict(
+            zip(
+                unique_urls,
+                executor.map(lambda url: _download(url, cache), unique_urls),
+            )
+        )
+
+    return [downloads[url] for url in urls]
@@ -0,0 +1,267 @@
+"""Type effectiveness, for many Pokemon and teams at once.
+
+The 18x18 chart is bundled (as of generation 6) and can also be fetched from
+PokeAPI's type endpoint. Like pypokedex.pokedex, batched computations use NumPy
+when it is installed, and plain lists otherwise.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Union
+
+from pypokedex import resources
+from pypokedex._numpy import numpy, resolve_use_numpy
+from pypokedex.pokemon import Pokemon
+
+# In PokeAPI's order (by type id)
+TYPES = (
+    "normal",
+    "fighting",
+    "flying",
+    "poison",
+    "ground",
+    "rock",
+    "bug",
+    "ghost",
+    "steel",
+    "fire",
+    "water",
+    "grass",
+    "electric",
+    "psychic",
+    "ice",
+    "dragon",
+    "dark",
+    "fairy",
+)
+
+# Attacking type -> (super effective against, not very effective against, no
+# effect against)
+_BUNDLED = {
+    "normal": ((), ("rock", "steel"), ("ghost",)),
+    "fighting": (
+        ("normal", "rock", "steel", "ice", "dark"),
+        ("flying", "poison", "bug", "psychic", "fairy"),
+        ("ghost",),
+    ),
+    "flying": (("fighting", "bug", "grass"), ("rock", "steel", "electric"), ()),
+    "poison": (("grass", "fairy"), ("poison", "ground", "rock", "ghost"), ("steel",)),
+    "ground": (
+        ("poison", "rock", "steel", "fire", "electric"),
+        ("bug", "grass"),
+        ("flying",),
+    ),
+    "rock": (("flying", "bug", "fire", "ice"), ("fighting", "ground", "steel"), ()),
+    "bug": (
+        ("grass", "psychic", "dark"),
+        ("fighting", "flying", "poison", "ghost", "steel", "fire", "fairy"),
+        (),
+    ),
+    "ghost": (("ghost", "psychic"), ("dark",), ("normal",)),
+    "steel": (("rock", "ice", "fairy"), ("steel", "fire", "water", "electric"), ()),
+    "fire": (
+        ("bug", "steel", "grass", "ice"),
+        ("rock", "fire", "water", "dragon"),
+        (),
+    ),
+    "water": (("ground", "rock", "fire"), ("water", "grass", "dragon"), ()),
+    "grass": (
+        ("ground", "rock", "water"),
+        ("flying", "poison", "bug", "steel", "fire", "grass", "dragon"),
+        (),
+    ),
+    "electric": (("flying", "water"), ("grass", "electric", "dragon"), ("ground",)),
+    "psychic": (("fighting", "poison"), ("steel", "psychic"), ("dark",)),
+    "ice": (
+        ("flying", "ground", "grass", "dragon"),
+        ("steel", "fire", "water", "ice"),
+        (),
+    ),
+    "dragon": (("dragon",), ("steel",), ("fairy",)),
+    "dark": (("ghost", "psychic"), ("fighting", "dark", "fairy"), ()),
+    "fairy": (("fighting", "dragon", "dark"), ("poison", "steel", "fire"), ()),
+}
+
+# Either a Pokemon, or the names of its types
+Typed = Union[Pokemon, Sequence[str]]
+
+
+class TeamCoverage(NamedTuple):
+    # Per team and type: the best multiplier any member's own types deal to a
+    # Pokemon of that type
+    offense: Any
+    # Per team and type: how many members are weak to, and resist, that type
+    weaknesses: Any
+    resistances: Any
+    # Per team: how many types are hit super effectively, and how many types
+    # more members are weak to than resist
+    super_effective: Any
+    uncovered_weaknesses: Any
+
+
+class TypeChart:
+    """An 18x18 matrix of damage multipliers, indexed by attacking then
+    defending type (in TYPES order)."""
+
+    def __init__(
+        self, multipliers: Sequence[Sequence[float]], use_numpy: Optional[bool] = None
+    ) -> None:
+        use_numpy = resolve_use_numpy(use_numpy)
+
+        if len(multipliers) != len(TYPES) or any(
+            len(row) != len(TYPES) for row in multipliers
+        ):
+            raise ValueError(f"The chart must be {len(TYPES)}x{len(TYPES)}!")
+
+        self.use_numpy = use_numpy
+        self._rows = [[float(value) for value in row] for row in multipliers]
+        self._index = {type_: index for index, type_ in enumerate(TYPES)}
+
+        # An extra column of ones stands for the missing second type of
+        # single-typed Pokemon
+        self._extended = [row + [1.0] for row in self._rows]
+        if use_numpy:
+            self._extended_array = numpy.array(self._extended)
+
+    @classmethod
+    def bundled(cls, use_numpy: Optional[bool] = None) -> "TypeChart":
+        return cls(cls._from_relations(_BUNDLED), use_numpy)
+
+    @classmethod
+    def fetch(cls, use_numpy: Optional[bool] = None) -> "TypeChart":
+        """Builds the chart from PokeAPI's type endpoint (one request per type,
+        cached like other resources)."""
+        details = resources.get_many(resources.TYPE, TYPES)
+        return cls(
+            cls._from_relations(
+                {
+                    type_.name: (
+                        type_.double_damage_to,
+                        type_.half_damage_to,
+                        type_.no_damage_to,
+                    )
+                    for type_ in details
+                }
+            ),
+            use_numpy,
+        )
+
+    @staticmethod
+    def _from_relations(relations: Dict[str, Any]) -> List[List[float]]:
+        multipliers = [[1.0] * len(TYPES) for _ in TYPES]
+        for attacking, row in zip(TYPES, multipliers):
+            for value, defending_types in zip((2.0, 0.5, 0.0), relations[attacking]):
+                for defending in defending_types:
+                    if defending in TYPES:
+                        row[TYPES.index(defending)] = value
+        return multipliers
+
+    def multiplier(self, attacking: str, defending: Typed) -> float:
+        """Returns the damage multiplier of an attacking type against a Pokemon
+        (or a list of types)."""
+        row = self._rows[self._type_index(attacking)]
+        result = 1.0
+        for type_ in self._types_of(defending):
+            result *= row[self._type_index(type_)]
+        return result
+
+    def defensive(self, pokemon: Sequence[Typed]) -> Any:
+        """Returns the multiplier of every attacking type against each of the
+        Pokemon, as a (Pokemon x 18) array (or list of lists)."""
+        first, second = self._type_columns(pokemon)
+
+        if self.use_numpy:
+            extended = self._extended_array
+            return (extended[:, first] * extended[:, second]).T
+
+        return [
+            [row[first_type] * row[second_type] for row in self._extended]
+            for first_type, second_type in zip(first, second)
+        ]
+
+    def offensive(self, pokemon: Sequence[Typed]) -> Any:
+        """Returns the best multiplier each of the Pokemon deals to every
+        (single) defending type with moves of its own types, as a
+        (Pokemon x 18) array (or list of lists)."""
+        first, second = self._type_columns(pokemon)
+        # Single-typed Pokemon repeat their first type
+        second = [
+            first_type if second_type == len(TYPES) else second_type
+            for first_type, second_type in zip(first, second)
+        ]
+
+        if self.use_numpy:
+            rows = self._extended_array[:, : len(TYPES)]
+            return numpy.maximum(rows[first], rows[second])
+
+        return [
+            [max(pair) for pair in zip(self._rows[first_type], self._rows[second_type])]
+            for first_type, second_type in zip(first, second)
+        ]
+
+    def team_coverage(
+        self, roster: Sequence[Typed], teams: Sequence[Sequence[int]]
+    ) -> TeamCoverage:
+        """Scores candidate teams, each given as the indices of its members in
+        roster, all at once. All teams must have the same size."""
+        offensive = self.offensive(roster)
+        defensive = self.defensive(roster)
+
+        if self.use_numpy:
+            members = numpy.asarray(teams, dtype=numpy.intp)
+            offense = offensive[members].max(axis=1)
+            matchups = defensive[members]
+            weaknesses = (matchups > 1).sum(axis=1)
+            resistances = (matchups < 1).sum(axis=1)
+            return TeamCoverage(
+                offense,
+                weaknesses,
+                resistances,
+                (offense >= 2).sum(axis=1),
+                (weaknesses > resistances).sum(axis=1),
+            )
+
+        offense_rows = []
+        weakness_rows = []
+        resistance_rows = []
+        for team in teams:
+            offense_rows.append(
+                [max(column) for column in zip(*map(offensive.__getitem__, team))]
+            )
+            columns = list(zip(*map(defensive.__getitem__, team)))
+            weakness_rows.append(
+                [sum(value > 1 for value in column) for column in columns]
+            )
+            resistance_rows.append(
+                [sum(value < 1 for value in column) for column in columns]
+            )
+
+        return TeamCoverage(
+            offense_rows,
+            weakness_rows,
+            resistance_rows,
+            [sum(value >= 2 for value in row) for row in offense_rows],
+            [
+                sum(weak > resist for weak, resist in zip(weak_row, resist_row))
+                for weak_row, resist_row in zip(weakness_rows, resistance_rows)
+            ],
+        )
+
+    def _type_index(self, type_: str) -> int:
+        try:
+            return self._index[type_]
+        except KeyError:
+            raise ValueError(f"Unknown type {type_}!") from None
+
+    @staticmethod
+    def _types_of(pokemon: Typed) -> Sequence[str]:
+        return pokemon.types if isinstance(pokemon, Pokemon) else pokemon
+
+    def _type_columns(self, pokemon: Sequence[Typed]) -> Any:
+        first = []
+        second = []
+        for current in pokemon:
+            types = self._types_of(current)
+            if not 1 <= len(types) <= 2:
+                raise ValueError("Pokemon must have one or two types!")
+            first.append(self._type_index(types[0]))
+            second.append(self._type_index(types[1]) if len(types) == 2 else len(TYPES))
+        return first, second
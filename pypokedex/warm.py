@@ -0,0 +1,135 @@
+"""Prefetching (warming) the caches with many Pokemon at once.
+
+Completed dex numbers can be recorded in a checkpoint file, so that a run that
+is interrupted (or that had failures) resumes where it left off instead of
+starting over.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set
+
+from pypokedex import api
+from pypokedex.exceptions import PyPokedexError
+
+# Called with the number of completed, failed and total dex numbers
+Progress = Callable[[int, int, int], None]
+
+
+class WarmSummary(NamedTuple):
+    requested: int
+    skipped: int
+    succeeded: int
+    failed: Dict[int, str]
+    elapsed: float
+
+    @property
+    def per_second(self) -> float:
+        fetched = self.succeeded + len(self.failed)
+        return fetched / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def parse_range(text: str) -> List[int]:
+    """Parses dex numbers like "1-151,251,386-493" into a sorted list."""
+    numbers: Set[int] = set()
+
+    try:
+        for part in text.split(","):
+            start, _, end = part.strip().partition("-")
+            first = int(start)
+            last = int(end) if end else first
+            if first < 1 or last < first:
+                raise ValueError(part)
+            numbers.update(range(first, last + 1))
+    except ValueError as error:
+        raise ValueError(f"Invalid dex range {text!r}!") from error
+
+    return sorted(numbers)
+
+
+class Checkpoint:
+    """The set of dex numbers already warmed, stored as a JSON file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.completed: Set[int] = set()
+
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as checkpoint_file:
+                    self.completed = set(json.load(checkpoint_file)["completed"])
+            except (ValueError, KeyError, TypeError) as error:
+                raise PyPokedexError(f"{path} is not a warm checkpoint!") from error
+
+    def save(self) -> None:
+        # Written to a temporary file first so an interrupted write never
+        # corrupts the previous checkpoint
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as checkpoint_file:
+            json.dump({"completed": sorted(self.completed)}, checkpoint_file)
+        os.replace(temporary_path, self.path)
+
+
+def _warm_one(dex: int, species: bool) -> None:
+    pokemon = api.get(dex=dex)
+    if species:
+        pokemon.get_all_descriptions()
+
+
+def warm(
+    dex: Iterable[int],
+    species: bool = True,
+    workers: int = 8,
+    checkpoint: Optional[Checkpoint] = None,
+    checkpoint_every: int = 50,
+    progress: Optional[Progress] = None,
+) -> WarmSummary:
+    """Fetches the specified Pokemon (and their species data, used for
+    descriptions) concurrently, so they are served from the configured caches
+    afterwards. Dex numbers already completed in checkpoint are skipped."""
+    requested = list(dex)
+    remaining = [
+        number
+        for number in requested
+        if checkpoint is None or number not in checkpoint.completed
+    ]
+    skipped = len(requested) - len(remaining)
+
+    succeeded = 0
+    failed: Dict[int, str] = {}
+    start = time.perf_counter()
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures: "Dict[Future[None], int]" = {
+        executor.submit(_warm_one, number, species): number for number in remaining
+    }
+
+    try:
+        for future in as_completed(futures):
+            number = futures[future]
+            try:
+                future.result()
+            except PyPokedexError as error:
+                failed[number] = str(error)
+            else:
+                succeeded += 1
+                if checkpoint is not None:
+                    checkpoint.completed.add(number)
+                    if succeeded % checkpoint_every == 0:
+                        checkpoint.save()
+
+            if progress is not None:
+                progress(succeeded, len(failed), len(remaining))
+    finally:
+        # On interruption, requests that haven't started are abandoned
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+        if checkpoint is not None:
+            checkpoint.save()
+
+    return WarmSummary(
+        len(requested), skipped, succeeded, failed, time.perf_counter() - start
+    )
@@ -1,7 +1,29 @@
+from copy import deepcopy
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
 import pytest
 import responses as rsps
 
 import pypokedex
+from pypokedex import Pokemon
+
+from tests.sample_pokemon import SAMPLE_POKEMON
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Runs a test with the standard library backend, and with NumPy if installed
+BACKENDS = [
+    False,
+    pytest.param(
+        True, marks=pytest.mark.skipif(numpy is None, reason="NumPy not installed")
+    ),
+]
+
+# (game, learn method, level) for each way a move is learned
+MoveDetails = Sequence[Tuple[str, str, int]]
 
 
 @pytest.fixture
@@ -9,3 +31,54 @@ def responses():
     pypokedex.get.cache_clear()
     with rsps.RequestsMock() as requests_mock:
         yield requests_mock
+
+
+@pytest.fixture(params=BACKENDS)
+def use_numpy(request):
+    return request.param
+
+
+def sample_document(
+    dex: Optional[int] = None,
+    stats: Optional[Mapping[str, int]] = None,
+    types: Optional[Iterable[str]] = None,
+    moves: Optional[Mapping[str, MoveDetails]] = None,
+    **fields: Any,
+) -> Dict[str, Any]:
+    """Returns a copy of SAMPLE_POKEMON with the specified changes. With dex,
+    the Pokemon is named sample-<dex>. stats are keyed by PokeAPI stat name,
+    and other fields (name, height, sprites, ...) replace the sample's."""
+    document = deepcopy(SAMPLE_POKEMON)
+
+    if dex is not None:
+        document.update(id=dex, name=f"sample-{dex}")
+
+    for stat in document["stats"]:
+        stat["base_stat"] = (stats or {}).get(stat["stat"]["name"], stat["base_stat"])
+
+    if types is not None:
+        document["types"] = [{"type": {"name": type_}} for type_ in types]
+
+    if moves is not None:
+        document["moves"] = [
+            {
+                "move": {"name": name},
+                "version_group_details": [
+                    {
+                        "level_learned_at": level,
+                        "move_learn_method": {"name": method},
+                        "version_group": {"name": game},
+                    }
+                    for game, method, level in details
+                ],
+            }
+            for name, details in moves.items()
+        ]
+
+    document.update(fields)
+    return document
+
+
+def sample_pokemon(*args: Any, **kwargs: Any) -> Pokemon:
+    """Builds a Pokemon from sample_document(*args, **kwargs)."""
+    return Pokemon(sample_document(*args, **kwargs))
@@ -0,0 +1,174 @@
+import asyncio
+
+import pytest
+
+import pypokedex
+from pypokedex.client import get_disk_cache, set_disk_cache
+from pypokedex.disk_cache import DiskCache
+from pypokedex.exceptions import PyPokedexError, PyPokedexHTTPError
+
+from tests.sample_pokemon import SAMPLE_POKEMON, SAMPLE_DESCRIPTIONS
+from tests.fixtures import responses  # noqa: F401
+
+httpx = pytest.importorskip("httpx")
+aio = pytest.importorskip("pypokedex.aio")
+
+
+@pytest.fixture
+def mock_api(responses):
+    calls = []
+    routes = {
+        "/api/v2/pokemon/sample": (200, SAMPLE_POKEMON),
+        "/api/v2/pokemon/999": (200, SAMPLE_POKEMON),
+        "/api/v2/pokemon-species/999": (200, SAMPLE_DESCRIPTIONS),
+    }
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(0.01)
+        status, body = routes.get(request.url.path, (404, {}))
+        return httpx.Response(status, json=body)
+
+    previous_client = aio._client
+    aio.set_client(
+        aio.AsyncClient(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    )
+    yield calls
+    aio._client = previous_client
+
+
+def test_async_get(mock_api):
+    pokemon = asyncio.run(aio.get(name="Sample"))
+
+    assert pokemon.dex == 999
+    assert mock_api == ["/api/v2/pokemon/sample"]
+
+
+def test_concurrent_async_gets_are_deduplicated(mock_api):
+    async def get_many():
+        return await asyncio.gather(*(aio.get(dex=999) for _ in range(100)))
+
+    results = asyncio.run(get_many())
+
+    assert all(pokemon is results[0] for pokemon in results)
+    assert mock_api == ["/api/v2/pokemon/999"]
+
+
+def test_async_get_descriptions(mock_api):
+    async def get_descriptions():
+        pokemon = await aio.get(dex=999)
+        return await aio.get_descriptions(pokemon, language="other")
+
+    assert asyncio.run(get_descriptions()) == {"game a": "text c"}
+
+
+def test_async_get_not_found(mock_api):
+    with pytest.raises(PyPokedexHTTPError) as not_found:
+        asyncio.run(aio.get(name="missing"))
+
+    assert not_found.value.http_code == 404
+
+
+def test_async_transport_errors():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        raise httpx.ConnectError("Some error", request=request)
+
+    previous_client = aio._client
+    aio.set_client(
+        aio.AsyncClient(
+            httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            retries=1,
+            backoff_factor=0,
+        )
+    )
+    try:
+        with pytest.raises(PyPokedexError):
+            asyncio.run(aio.fetch_json("https://pokeapi.co/api/v2/pokemon/1"))
+    finally:
+        aio._client = previous_client
+
+    assert len(calls) == 2
+
+
+def test_async_retries_honor_retry_after(monkeypatch):
+    statuses = [429, 503, 200]
+    delays = []
+
+    def handler(request):
+        return httpx.Response(
+            statuses.pop(0), headers={"Retry-After": "0"}, json=SAMPLE_POKEMON
+        )
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(aio.asyncio, "sleep", sleep)
+    previous_client = aio._client
+    aio.set_client(
+        aio.AsyncClient(
+            httpx.AsyncClient(transport=httpx.MockTransport(handler)), retries=2
+        )
+    )
+    try:
+        document = asyncio.run(aio.fetch_json("https://pokeapi.co/api/v2/pokemon/1"))
+    finally:
+        aio._client = previous_client
+
+    assert document["id"] == 999
+    assert delays == [0, 0]
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    previous_disk_cache = get_disk_cache()
+    disk_cache = DiskCache(tmp_path / "responses.sqlite3")
+    set_disk_cache(disk_cache)
+    yield disk_cache
+    disk_cache.close()
+    set_disk_cache(previous_disk_cache)
+
+
+def test_async_requests_use_the_disk_cache(mock_api, disk_cache):
+    async def get_with_descriptions():
+        pokemon = await aio.get(dex=999)
+        return await aio.get_descriptions(pokemon)
+
+    asyncio.run(get_with_descriptions())
+    assert "https://pokeapi.co/api/v2/pokemon/999" in disk_cache
+    assert "https://pokeapi.co/api/v2/pokemon-species/999" in disk_cache
+
+    pypokedex.get.cache_clear()
+    descriptions = asyncio.run(get_with_descriptions())
+
+    assert descriptions["game a"] == "text a"
+    assert mock_api == ["/api/v2/pokemon/999", "/api/v2/pokemon-species/999"]
+
+
+def test_async_stale_response_is_revalidated(tmp_path):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if len(requests) == 1:
+            return httpx.Response(200, headers={"ETag": '"v1"'}, json=SAMPLE_POKEMON)
+        return httpx.Response(304)
+
+    previous_client, previous_disk_cache = aio._client, get_disk_cache()
+    aio.set_client(
+        aio.AsyncClient(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    )
+    set_disk_cache(DiskCache(tmp_path / "responses.sqlite3", max_age=0))
+    try:
+        url = "https://pokeapi.co/api/v2/pokemon/999"
+        asyncio.run(aio.fetch_json(url))
+        document = asyncio.run(aio.fetch_json(url))
+    finally:
+        get_disk_cache().close()  # type: ignore[union-attr]
+        aio._client = previous_client
+        set_disk_cache(previous_disk_cache)
+
+    assert document["id"] == 999
+    assert requests[1].headers["If-None-Match"] == '"v1"'
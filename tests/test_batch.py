@@ -0,0 +1,73 @@
+import pytest
+
+import pypokedex
+from pypokedex.exceptions import PyPokedexHTTPError
+
+from tests.fixtures import responses, sample_document  # noqa: F401
+
+
+def _add_pokemon(responses, dex, subpage=None):
+    responses.add(
+        responses.GET,
+        f"https://pokeapi.co/api/v2/pokemon/{subpage or dex}",
+        json=sample_document(dex),
+        status=200,
+    )
+
+
+def test_get_many_preserves_order(responses):
+    for dex in range(1, 11):
+        _add_pokemon(responses, dex)
+
+    results = pypokedex.get_many(dex=list(range(10, 0, -1)), workers=4)
+
+    assert [result.query for result in results] == list(range(10, 0, -1))
+    dex = [result.pokemon.dex for result in results if result.pokemon]
+    assert dex == list(range(10, 0, -1))
+    assert all(result.error is None for result in results)
+
+
+def test_get_many_reports_errors_without_aborting(responses):
+    _add_pokemon(responses, 1, "sample-1")
+    responses.add(
+        responses.GET, "https://pokeapi.co/api/v2/pokemon/missing", status=404
+    )
+
+    results = pypokedex.get_many(names=["sample-1", "missing"])
+
+    assert results[0].pokemon is not None
+    assert results[0].pokemon.dex == 1
+    assert results[1].pokemon is None
+    assert isinstance(results[1].error, PyPokedexHTTPError)
+    assert results[1].error.http_code == 404
+
+
+def test_get_many_populates_get_cache(responses):
+    _add_pokemon(responses, 1)
+
+    pypokedex.get_many(dex=[1], rate_limit=100)
+    pokemon = pypokedex.get(name="sample-1")
+
+    assert pokemon.dex == 1
+    assert len(responses.calls) == 1
+
+
+def test_iter_many_yields_every_result(responses):
+    for dex in range(1, 6):
+        _add_pokemon(responses, dex)
+
+    results = list(pypokedex.iter_many(dex=[1, 2, 3, 4, 5], workers=3))
+
+    dex = [result.pokemon.dex for result in results if result.pokemon]
+    assert sorted(dex) == [1, 2, 3, 4, 5]
+
+
+def test_get_many_invalid_arguments():
+    with pytest.raises(TypeError):
+        pypokedex.get_many()
+
+    with pytest.raises(TypeError):
+        pypokedex.get_many(dex=[1], names=["a"])
+
+    with pytest.raises(TypeError):
+        pypokedex.get_many(dex=["a"])  # type: ignore[list-item]
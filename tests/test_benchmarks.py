@@ -0,0 +1,64 @@
+import time
+
+import pypokedex
+from pypokedex import Pokemon
+from pypokedex.cache import deep_getsizeof
+from pypokedex.client import Client, get_client, set_client
+from pypokedex.parsing import prune_pokemon
+
+from benchmarks.payloads import pokemon_payload, species_payload
+from benchmarks.server import MockPokeAPI
+
+
+def test_benchmark_payloads_are_valid():
+    pokemon = Pokemon(pokemon_payload(25))
+
+    assert pokemon.dex == 25
+    assert len(pokemon.moves) > 10
+    assert "animated" not in str(pokemon.version_sprites)
+
+    pokemon._load_descriptions(species_payload(25))
+    assert "Description of pokemon 25" in pokemon.get_descriptions("fr")["x-y"]
+
+
+def test_benchmark_server_stands_in_for_pokeapi():
+    previous_client = get_client()
+
+    with MockPokeAPI() as server:
+        set_client(Client(session=server.session()))
+        try:
+            pypokedex.get.cache_clear()
+            assert pypokedex.get(dex=7).name == "pokemon-7"
+        finally:
+            set_client(previous_client)
+            pypokedex.get.cache_clear()
+
+
+def _best_time(function, repeat=5, number=20):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_unparsed_pokemon_are_cheap():
+    document = prune_pokemon(pokemon_payload(25))
+
+    def construct_and_parse():
+        pokemon = Pokemon(document)
+        pokemon.moves  # pylint: disable=pointless-statement
+        pokemon.version_sprites  # pylint: disable=pointless-statement
+
+    # Reading only name/types skips parsing moves and sprites entirely, which
+    # the eager parse of earlier versions always paid for
+    assert _best_time(lambda: Pokemon(document)) < _best_time(construct_and_parse) / 2
+
+    # Once parsed, the raw moves and sprites are dropped
+    pokemon = Pokemon(document)
+    unparsed_size = deep_getsizeof(pokemon)
+    pokemon.moves  # pylint: disable=pointless-statement
+    pokemon.sprites  # pylint: disable=pointless-statement
+    assert deep_getsizeof(pokemon) < unparsed_size
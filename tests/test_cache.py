@@ -0,0 +1,97 @@
+import pytest
+
+from pypokedex.cache import Cache, deep_getsizeof
+
+
+def test_cache_hits_and_misses():
+    cache = Cache()
+    assert cache.get("missing") is None
+
+    cache.set(1, "value")
+    assert cache.get(1) == "value"
+
+    info = cache.info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.currsize == 1
+
+
+def test_cache_aliases_share_entry():
+    cache = Cache()
+    cache.set(25, "pikachu data", aliases=["pikachu"])
+
+    assert cache.get("pikachu") == "pikachu data"
+    assert len(cache) == 1
+
+    cache.remove("pikachu")
+    assert 25 not in cache
+    assert "pikachu" not in cache
+
+
+def test_cache_lru_eviction():
+    cache = Cache(maxsize=2)
+    cache.set(1, "a", aliases=["one"])
+    cache.set(2, "b")
+    cache.get(1)
+    cache.set(3, "c")
+
+    assert 1 in cache
+    assert 2 not in cache
+    assert 3 in cache
+    assert cache.info().evictions == 1
+
+    cache.set(4, "d")
+    assert "one" not in cache
+
+
+def test_cache_memory_eviction():
+    cache = Cache(maxsize=None, max_bytes=100, sizeof=len)
+    cache.set(1, "x" * 60)
+    cache.set(2, "x" * 60)
+
+    assert 1 not in cache
+    assert 2 in cache
+    assert cache.info().currbytes == 60
+
+
+def test_cache_resize_after_value_changes():
+    cache = Cache(maxsize=None, max_bytes=100, sizeof=len)
+    cache.set(1, ["x"] * 30)
+    cache.set(2, ["x"] * 30, aliases=["two"])
+
+    cache.get(2).extend(["x"] * 20)
+    cache.resize("two")
+    assert cache.info().currbytes == 80
+
+    cache.get(2).extend(["x"] * 30)
+    cache.resize(2)
+    assert 1 not in cache
+    assert cache.info().currbytes == 80
+
+    cache.resize(3)
+    assert cache.info().currbytes == 80
+
+
+def test_cache_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("pypokedex.cache.time.monotonic", lambda: now[0])
+
+    cache = Cache(ttl=10)
+    cache.set(1, "a")
+    cache.set(2, "b", ttl=100)
+
+    now[0] += 11
+    assert cache.get(1) is None
+    assert cache.get(2) == "b"
+
+
+def test_cache_invalid_limits():
+    with pytest.raises(ValueError):
+        Cache(maxsize=-1)
+
+    with pytest.raises(ValueError):
+        Cache(max_bytes=-1)
+
+
+def test_deep_getsizeof_counts_nested_data():
+    assert deep_getsizeof({"a": ["x" * 1000]}) > deep_getsizeof({"a": []})
@@ -0,0 +1,143 @@
+import pytest
+import requests
+
+import pypokedex
+import pypokedex.client
+from pypokedex.client import Client, get_client, set_client
+from pypokedex.exceptions import PyPokedexHTTPError
+from pypokedex.ratelimit import TokenBucket
+from pypokedex.retry import RetryPolicy
+
+from tests.sample_pokemon import SAMPLE_POKEMON
+from tests.fixtures import responses  # noqa: F401
+
+
+@pytest.fixture
+def client():
+    previous_client = get_client()
+    yield
+    set_client(previous_client)
+
+
+def test_default_client_reuses_one_session(responses, client):
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/sample",
+        json=SAMPLE_POKEMON,
+        status=200,
+    )
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon-species/999",
+        json={"flavor_text_entries": []},
+        status=200,
+    )
+
+    session = get_client().session
+    pypokedex.get(name="sample").get_descriptions()
+
+    assert get_client().session is session
+
+
+def test_injected_session_is_used(responses, client):
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/sample",
+        json=SAMPLE_POKEMON,
+        status=200,
+    )
+
+    session = requests.Session()
+    session.headers["User-Agent"] = "my-service"
+    set_client(Client(session=session, timeout=10))
+
+    pypokedex.get(name="sample")
+
+    assert responses.calls[0].request.headers["User-Agent"] == "my-service"
+
+
+def test_transient_errors_are_retried(responses, client):
+    responses.add(responses.GET, "https://pokeapi.co/api/v2/pokemon/sample", status=503)
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/sample",
+        json=SAMPLE_POKEMON,
+        status=200,
+    )
+
+    set_client(Client(retries=1, backoff_factor=0))
+
+    assert pypokedex.get(name="sample").dex == 999
+    assert len(responses.calls) == 2
+
+
+def test_retries_exhausted(responses, client):
+    responses.add(responses.GET, "https://pokeapi.co/api/v2/pokemon/sample", status=503)
+
+    set_client(Client(retries=0))
+
+    with pytest.raises(PyPokedexHTTPError) as http_error:
+        pypokedex.get(name="sample")
+
+    assert http_error.value.http_code == 503
+
+
+def test_retry_after_is_honored(responses, client, monkeypatch):
+    delays = []
+    monkeypatch.setattr(pypokedex.client.time, "sleep", delays.append)
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/sample",
+        status=429,
+        headers={"Retry-After": "3"},
+    )
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/sample",
+        json=SAMPLE_POKEMON,
+        status=200,
+    )
+
+    set_client(Client(retry_policy=RetryPolicy(retries=1)))
+
+    assert pypokedex.get(name="sample").dex == 999
+    assert delays == [3]
+
+
+def test_unbounded_retry_after_is_capped(responses, client, monkeypatch):
+    delays = []
+    monkeypatch.setattr(pypokedex.client.time, "sleep", delays.append)
+    for retry_after in ["inf", "86400"]:
+        responses.add(
+            responses.GET,
+            "https://pokeapi.co/api/v2/pokemon/sample",
+            status=503,
+            headers={"Retry-After": retry_after},
+        )
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/sample",
+        json=SAMPLE_POKEMON,
+        status=200,
+    )
+
+    set_client(Client(retry_policy=RetryPolicy(backoff_factor=1, jitter=0)))
+
+    assert pypokedex.get(name="sample").dex == 999
+    assert delays == [1, 60]
+
+
+def test_requests_are_rate_limited(responses, client):
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/sample",
+        json=SAMPLE_POKEMON,
+        status=200,
+    )
+
+    bucket = TokenBucket(rate=1)
+    set_client(Client(rate_limiter=bucket))
+    pypokedex.get(name="sample")
+
+    # The request took the only token
+    assert bucket.reserve() > 0.9
@@ -0,0 +1,130 @@
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import ANY
+
+import pytest
+
+import pypokedex
+from pypokedex.client import get_disk_cache, set_disk_cache
+from pypokedex.disk_cache import DiskCache
+
+from tests.sample_pokemon import SAMPLE_POKEMON, SAMPLE_DESCRIPTIONS
+from tests.fixtures import responses  # noqa: F401
+
+
+@pytest.fixture
+def disk_cache_path(tmp_path):
+    previous_disk_cache = get_disk_cache()
+    yield tmp_path / "cache" / "responses.sqlite3"
+    disk_cache = get_disk_cache()
+    if disk_cache is not None:
+        disk_cache.close()
+    set_disk_cache(previous_disk_cache)
+
+
+def test_warm_restart_is_served_from_disk(responses, disk_cache_path):
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/sample",
+        json=SAMPLE_POKEMON,
+        status=200,
+    )
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon-species/999",
+        json=SAMPLE_DESCRIPTIONS,
+        status=200,
+    )
+
+    set_disk_cache(DiskCache(disk_cache_path))
+    pypokedex.get(name="sample").get_descriptions()
+    get_disk_cache().close()  # type: ignore[union-attr]
+
+    # Simulate a restart: fresh memory cache and a new connection to the file
+    pypokedex.get.cache_clear()
+    set_disk_cache(DiskCache(disk_cache_path))
+
+    pokemon = pypokedex.get(name="sample")
+    descriptions = pokemon.get_descriptions()
+
+    assert pokemon.dex == 999
+    assert descriptions["game a"] == "text a"
+    assert len(responses.calls) == 2
+
+
+def test_stale_response_is_revalidated(responses, disk_cache_path):
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/sample",
+        json=SAMPLE_POKEMON,
+        status=200,
+        headers={"ETag": '"v1"'},
+    )
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/sample",
+        status=304,
+    )
+
+    set_disk_cache(DiskCache(disk_cache_path, max_age=0))
+    pypokedex.get(name="sample")
+    pypokedex.get.cache_clear()
+    pokemon = pypokedex.get(name="sample")
+
+    assert pokemon.dex == 999
+    assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    disk_cache = DiskCache(tmp_path / "responses.sqlite3", max_size=10)
+
+    disk_cache.set("a", b"12345")
+    disk_cache.set("b", b"12345")
+    disk_cache.get("a")
+    disk_cache.set("c", b"12345")
+
+    assert "a" in disk_cache
+    assert "b" not in disk_cache
+    assert "c" in disk_cache
+    assert disk_cache.size() == 10
+
+    disk_cache.clear()
+    assert disk_cache.size() == 0
+    disk_cache.close()
+
+
+def test_disk_cache_reads_do_not_write(tmp_path):
+    path = tmp_path / "responses.sqlite3"
+    disk_cache = DiskCache(path)
+    disk_cache.set("a", b"12345")
+
+    # Another connection holding the write lock doesn't block cache hits
+    writer = sqlite3.connect(path)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        assert disk_cache.get("a") == (b"12345", None, None, ANY)
+    finally:
+        writer.rollback()
+        writer.close()
+    disk_cache.close()
+
+
+def test_disk_cache_concurrent_readers(tmp_path):
+    path = tmp_path / "responses.sqlite3"
+    writer = DiskCache(path)
+    for index in range(50):
+        writer.set(f"url-{index}", b"body")
+
+    readers = [DiskCache(path) for _ in range(4)]
+
+    def read(disk_cache):
+        for _ in range(20):
+            for index in range(50):
+                assert disk_cache.get(f"url-{index}") is not None
+            writer.set("url-0", b"body")
+
+    with ThreadPoolExecutor(len(readers)) as executor:
+        list(executor.map(read, readers))
+
+    for disk_cache in readers + [writer]:
+        disk_cache.close()
@@ -0,0 +1,54 @@
+import subprocess
+import sys
+
+import pytest
+
+import pypokedex
+
+# Modules that are slow to import, and only needed once pypokedex is used
+HEAVY_MODULES = ["requests", "urllib3", "asyncio", "sqlite3", "numpy", "httpx"]
+
+
+def _imported_after(code: str):
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys\n{code}\n"
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    return output.split(",") if output else []
+
+
+def test_import_is_lazy():
+    assert _imported_after("import pypokedex") == []
+
+
+def test_network_stack_is_loaded_on_first_use():
+    assert (
+        _imported_after(
+            "import pypokedex\n"
+            "from pypokedex import Pokemon, get, get_many\n"
+            "pypokedex.get.cache_info()"
+        )
+        == []
+    )
+
+
+def test_public_api_is_available():
+    from pypokedex.api import get
+    from pypokedex.pokemon import Pokemon
+
+    assert pypokedex.get is get
+    assert pypokedex.Pokemon is Pokemon
+    assert pypokedex.client.Client is not None
+    assert set(pypokedex.__all__) <= set(dir(pypokedex))
+
+    with pytest.raises(AttributeError):
+        pypokedex.nothing  # pylint: disable=pointless-statement
+    with pytest.raises(AttributeError):
+        pypokedex._nothing  # pylint: disable=pointless-statement
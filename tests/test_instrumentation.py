@@ -0,0 +1,103 @@
+import pytest
+import requests
+
+import pypokedex
+from pypokedex import instrumentation
+from pypokedex.client import Client, get_client, set_client
+from pypokedex.exceptions import PyPokedexError, PyPokedexHTTPError
+from pypokedex.instrumentation import Metrics, PrometheusExporter
+
+from tests.sample_pokemon import SAMPLE_POKEMON, SAMPLE_DESCRIPTIONS
+from tests.fixtures import responses  # noqa: F401
+
+
+@pytest.fixture
+def metrics():
+    metrics = Metrics()
+    instrumentation.add_hook(metrics)
+    yield metrics
+    instrumentation.remove_hook(metrics)
+
+
+def test_get_emits_phase_timings_and_cache_counts(responses, metrics):
+    events = []
+    instrumentation.add_hook(events.append)
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/sample",
+        json=SAMPLE_POKEMON,
+        status=200,
+    )
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon-species/999",
+        json=SAMPLE_DESCRIPTIONS,
+        status=200,
+    )
+
+    try:
+        pypokedex.get(name="sample").get_descriptions()
+        pypokedex.get(dex=999)
+    finally:
+        instrumentation.remove_hook(events.append)
+
+    assert [event.name for event in events] == [
+        "cache_miss",
+        "request",
+        "decode",
+        "parse",
+        "request",
+        "decode",
+        "parse",
+        "cache_hit",
+    ]
+    assert events[1].attributes["url"] == "https://pokeapi.co/api/v2/pokemon/sample"
+    assert all(event.duration >= 0 for event in events if event.duration is not None)
+
+    assert metrics.count("request", endpoint="pokemon", status_code=200) == 1
+    assert metrics.count("request", endpoint="pokemon-species") == 1
+    assert metrics.count("cache_hit", cache="memory") == 1
+    assert metrics.count("cache_miss", cache="memory") == 1
+
+
+def test_errors_and_retries_are_counted(responses, metrics):
+    previous_client = get_client()
+    set_client(Client(retries=1, backoff_factor=0))
+    responses.add(responses.GET, "https://pokeapi.co/api/v2/pokemon/sample", status=503)
+    responses.add(responses.GET, "https://pokeapi.co/api/v2/pokemon/sample", status=404)
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/other",
+        body=requests.exceptions.ConnectionError("Some error"),
+    )
+
+    try:
+        with pytest.raises(PyPokedexHTTPError):
+            pypokedex.get(name="sample")
+        with pytest.raises(PyPokedexError):
+            pypokedex.get(name="other")
+    finally:
+        set_client(previous_client)
+
+    assert metrics.count("retry", status_code=503) == 1
+    assert metrics.count("retry", error="ConnectionError") == 1
+    assert metrics.count("error", status_code=404) == 1
+    assert metrics.count("error", error="ConnectionError") == 1
+
+
+def test_prometheus_exporter():
+    metrics = Metrics()
+    metrics(instrumentation.Event("request", 0.5, {"endpoint": "pokemon"}))
+    metrics(instrumentation.Event("request", 0.25, {"endpoint": "pokemon"}))
+    metrics(instrumentation.Event("cache_hit", None, {"cache": "memory"}))
+
+    assert PrometheusExporter(metrics).render() == (
+        "# TYPE pypokedex_cache_hit_total counter\n"
+        'pypokedex_cache_hit_total{cache="memory"} 1\n'
+        "# TYPE pypokedex_request_seconds summary\n"
+        'pypokedex_request_seconds_count{endpoint="pokemon"} 2\n'
+        'pypokedex_request_seconds_sum{endpoint="pokemon"} 0.75\n'
+    )
+
+    metrics.reset()
+    assert PrometheusExporter(metrics).render() == "\n"
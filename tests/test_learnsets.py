@@ -0,0 +1,83 @@
+from pypokedex.learnsets import LearnsetIndex
+
+from tests.fixtures import sample_pokemon
+
+
+def _pokemon(dex, moves):
+    return sample_pokemon(dex, moves=moves)
+
+
+def _index():
+    return LearnsetIndex.from_pokemon(
+        [
+            _pokemon(
+                25,
+                {
+                    "thunderbolt": [("red-blue", "machine", 0)],
+                    "quick-attack": [("red-blue", "level-up", 16)],
+                },
+            ),
+            _pokemon(
+                6,
+                {
+                    "fly": [("red-blue", "machine", 0)],
+                    "quick-attack": [("red-blue", "level-up", 40)],
+                },
+            ),
+            _pokemon(
+                16,
+                {
+                    "fly": [("red-blue", "machine", 0), ("x-y", "machine", 0)],
+                    "quick-attack": [
+                        ("red-blue", "level-up", 5),
+                        ("x-y", "level-up", 1),
+                    ],
+                },
+            ),
+        ]
+    )
+
+
+def test_learners():
+    index = _index()
+
+    assert len(index) == 3
+    assert index.learners("quick-attack", "red-blue").dex_numbers() == [6, 16, 25]
+    assert index.learners("fly", "x-y").dex_numbers() == [16]
+    assert index.learners("fly", "red-blue", method="machine").dex_numbers() == [6, 16]
+    assert not index.learners("fly", "red-blue", method="tutor")
+    assert not index.learners("surf", "red-blue")
+
+
+def test_learners_by_level():
+    index = _index()
+
+    assert index.learners("quick-attack", "red-blue", max_level=4).dex_numbers() == []
+    assert index.learners("quick-attack", "red-blue", max_level=16).dex_numbers() == [
+        16,
+        25,
+    ]
+    assert len(index.learners("quick-attack", "red-blue", max_level=100)) == 3
+    assert not index.learners("fly", "red-blue", max_level=100)
+    assert not index.learners(
+        "quick-attack", "red-blue", method="machine", max_level=100
+    )
+
+
+def test_set_operations():
+    index = _index()
+    fly = index.learners("fly", "red-blue")
+    quick_attack = index.learners("quick-attack", "red-blue", max_level=30)
+
+    assert (fly & quick_attack).dex_numbers() == [16]
+    assert (fly | quick_attack).dex_numbers() == [6, 16, 25]
+    assert (quick_attack - fly).dex_numbers() == [25]
+    assert 16 in list(fly)
+    assert fly == index.learners("fly", "red-blue", method="machine")
+
+    assert index.learners_of_all(["fly", "quick-attack"], "red-blue").dex_numbers() == [
+        6,
+        16,
+    ]
+    assert index.learners_of_any(["fly", "thunderbolt"], "red-blue") == index.all()
+    assert not index.learners_of_all(["fly", "surf"], "red-blue")
@@ -0,0 +1,132 @@
+import pytest
+
+import pypokedex
+from pypokedex import api
+from pypokedex.exceptions import PyPokedexHTTPError
+from pypokedex.names import (
+    NameIndex,
+    enable_name_index,
+    get_name_index,
+    set_name_index,
+)
+from pypokedex.snapshot import use_snapshot, write_snapshot
+
+from tests.sample_pokemon import SAMPLE_POKEMON
+from tests.fixtures import responses  # noqa: F401
+
+NAMES = {
+    "bulbasaur": 1,
+    "ivysaur": 2,
+    "venusaur": 3,
+    "pikachu": 25,
+    "pichu": 172,
+    "sample": 999,
+}
+
+
+@pytest.fixture
+def name_index():
+    index = NameIndex(NAMES)
+    set_name_index(index)
+    yield index
+    set_name_index(None)
+
+
+def test_lookups():
+    index = NameIndex(NAMES)
+
+    assert len(index) == 6
+    assert "Pikachu" in index
+    assert index.dex_of("PIKACHU") == 25
+    assert index.dex_of("pikachuu") is None
+    assert index.name_of(3) == "venusaur"
+
+
+def test_prefix_search():
+    index = NameIndex(NAMES)
+
+    assert index.prefix("pi") == ["pichu", "pikachu"]
+    assert index.prefix("pi", limit=1) == ["pichu"]
+    assert index.prefix("") == sorted(NAMES)
+    assert index.prefix("z") == []
+
+
+def test_fuzzy_search():
+    index = NameIndex(NAMES)
+
+    assert index.fuzzy("pikachuu")[0] == "pikachu"
+    assert index.fuzzy("bulbsaur")[0] == "bulbasaur"
+    assert index.fuzzy("xyz") == []
+
+
+def test_get_resolves_names_locally(responses, name_index):
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/999",
+        json=SAMPLE_POKEMON,
+        status=200,
+    )
+
+    assert pypokedex.get(name="Sample") is pypokedex.get(dex=999)
+
+    with pytest.raises(PyPokedexHTTPError) as not_found:
+        pypokedex.get(name="pikachuu")
+
+    assert not_found.value.http_code == 404
+    assert "Did you mean pikachu, pichu?" in str(not_found.value)
+    assert len(responses.calls) == 1
+
+
+def test_index_is_fetched_once(responses):
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon?limit=100000",
+        json={
+            "count": 2,
+            "results": [
+                {"name": "bulbasaur", "url": "https://pokeapi.co/api/v2/pokemon/1/"},
+                {
+                    "name": "venusaur-mega",
+                    "url": "https://pokeapi.co/api/v2/pokemon/10033/",
+                },
+            ],
+        },
+    )
+
+    try:
+        index = enable_name_index()
+        assert enable_name_index() is index
+        assert get_name_index() is index
+    finally:
+        set_name_index(None)
+
+    assert index.dex_of("venusaur-mega") == 10033
+    assert len(responses.calls) == 1
+
+
+def test_index_with_partial_snapshot(responses, tmp_path):
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon?limit=100000",
+        json={
+            "count": 2,
+            "results": [
+                {"name": "bulbasaur", "url": "https://pokeapi.co/api/v2/pokemon/1/"},
+                {"name": "sample", "url": "https://pokeapi.co/api/v2/pokemon/999/"},
+            ],
+        },
+    )
+    path = tmp_path / "dex.snapshot"
+    write_snapshot(path, [(SAMPLE_POKEMON, None)])
+
+    use_snapshot(path)
+    try:
+        index = enable_name_index()
+        assert pypokedex.get(name="sample").dex == 999
+        assert api.subpage_for({"name": "Bulbasaur"}) == 1
+    finally:
+        set_name_index(None)
+        use_snapshot(None)
+
+    assert index.dex_of("sample") == 999
+    assert len(responses.calls) == 1
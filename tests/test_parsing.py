@@ -0,0 +1,47 @@
+import pytest
+
+from pypokedex import Pokemon, parsing
+
+from tests.sample_pokemon import SAMPLE_POKEMON, SAMPLE_DESCRIPTIONS
+
+
+@pytest.fixture(params=["default", "json"])
+def backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(parsing, "orjson", None)
+
+
+def test_loads_and_dumps_round_trip(backend):
+    encoded = parsing.dumps(SAMPLE_POKEMON)
+
+    assert b" " not in encoded
+    assert parsing.loads(encoded) == SAMPLE_POKEMON
+    assert parsing.loads(memoryview(encoded)) == SAMPLE_POKEMON
+
+
+def test_prune_pokemon_drops_unused_keys():
+    document = dict(SAMPLE_POKEMON, game_indices=[{"game_index": 1}], order=1)
+    pruned = parsing.prune_pokemon(document)
+
+    assert set(pruned) == set(SAMPLE_POKEMON)
+    assert pruned["moves"] is document["moves"]
+
+
+def test_trimmed_documents_build_identical_pokemon():
+    document = dict(SAMPLE_POKEMON, held_items=[])
+    document["types"] = [
+        {"slot": 1, "type": {"name": "type_1", "url": "type_1_url"}},
+        {"slot": 2, "type": {"name": "type_2", "url": "type_2_url"}},
+    ]
+    trimmed = parsing.trim_pokemon(document)
+
+    assert "held_items" not in trimmed
+    assert trimmed["types"] == [
+        {"type": {"name": "type_1"}},
+        {"type": {"name": "type_2"}},
+    ]
+
+    pokemon, trimmed_pokemon = Pokemon(document), Pokemon(trimmed)
+    assert trimmed_pokemon.types == pokemon.types
+    assert trimmed_pokemon.moves == pokemon.moves
+    assert parsing.trim_species(SAMPLE_DESCRIPTIONS) == SAMPLE_DESCRIPTIONS
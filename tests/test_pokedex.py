@@ -0,0 +1,99 @@
+from typing import Optional
+
+import pytest
+
+from pypokedex.pokedex import Pokedex
+
+from tests.sample_pokemon import SAMPLE_POKEMON
+from tests.fixtures import responses, sample_pokemon, use_numpy  # noqa: F401
+
+
+def _pokemon(dex, speed, types, base_experience: Optional[int] = 100):
+    return sample_pokemon(dex, {"speed": speed}, types, base_experience=base_experience)
+
+
+@pytest.fixture
+def pokedex(use_numpy):
+    return Pokedex.from_pokemon(
+        [
+            _pokemon(1, 45, ["grass", "poison"]),
+            _pokemon(4, 65, ["fire"]),
+            _pokemon(6, 100, ["fire", "flying"]),
+            _pokemon(101, 150, ["electric"], base_experience=None),
+            _pokemon(78, 105, ["fire"]),
+        ],
+        use_numpy=use_numpy,
+    )
+
+
+def test_pokedex_columns(pokedex):
+    assert len(pokedex) == 5
+    assert pokedex.dex_numbers() == [1, 4, 6, 101, 78]
+    assert pokedex.names()[0] == "sample-1"
+    assert list(pokedex.column("speed")) == [45, 65, 100, 150, 105]
+
+
+def test_pokedex_where_and_with_type(pokedex):
+    fast_fire = pokedex.where("speed", ">", 99).with_type("fire")
+    assert fast_fire.dex_numbers() == [6, 78]
+
+    assert pokedex.with_type("fire", "flying").dex_numbers() == [6]
+    assert pokedex.with_type("dragon").dex_numbers() == []
+    assert pokedex.where("base_experience", "==", 100).dex_numbers() == [1, 4, 6, 78]
+
+
+def test_pokedex_sort_and_top(pokedex):
+    assert pokedex.sort_by("speed").dex_numbers() == [1, 4, 6, 78, 101]
+    assert pokedex.sort_by("speed", descending=True).dex_numbers() == [
+        101,
+        78,
+        6,
+        4,
+        1,
+    ]
+    assert pokedex.top("speed", 2).dex_numbers() == [101, 78]
+    assert pokedex.with_type("fire").top("speed", 10).dex_numbers() == [78, 6, 4]
+
+
+def test_pokedex_sorts_missing_values_last(use_numpy):
+    pokedex = Pokedex.from_pokemon(
+        [
+            _pokemon(dex, 50, ["normal"], base_experience=base_experience)
+            for dex, base_experience in enumerate([50, None, 10, 30, None, 5], 1)
+        ],
+        use_numpy=use_numpy,
+    )
+
+    assert pokedex.sort_by("base_experience").dex_numbers() == [6, 3, 4, 1, 2, 5]
+    assert pokedex.sort_by("base_experience", descending=True).dex_numbers() == [
+        1,
+        4,
+        3,
+        6,
+        2,
+        5,
+    ]
+    assert pokedex.top("base_experience", 3).dex_numbers() == [1, 4, 3]
+    assert pokedex.top("base_experience", 10).dex_numbers() == [1, 4, 3, 6]
+
+
+def test_pokedex_invalid_queries(pokedex):
+    with pytest.raises(ValueError):
+        pokedex.where("speed", "~", 1)
+
+    with pytest.raises(ValueError):
+        pokedex.where("unknown", ">", 1)
+
+
+def test_pokedex_fetch_and_iterate(responses):
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/999",
+        json=SAMPLE_POKEMON,
+        status=200,
+    )
+
+    pokedex = Pokedex.fetch(dex=[999])
+
+    assert [pokemon.name for pokemon in pokedex] == ["sample"]
+    assert len(responses.calls) == 1
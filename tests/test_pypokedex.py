@@ -1,3 +1,8 @@
+import json
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 
 import pytest
@@ -5,6 +10,8 @@ import requests
 
 import pypokedex
 from pypokedex import Ability, BaseStats, Move, Pokemon, Sprites
+from pypokedex.api import set_not_found_ttl
+from pypokedex.cache import Cache, deep_getsizeof
 from pypokedex.exceptions import PyPokedexError, PyPokedexHTTPError
 
 from tests.sample_pokemon import SAMPLE_POKEMON, SAMPLE_DESCRIPTIONS
@@ -247,15 +254,9 @@ def test_pokemon_equality(responses):
         json=SAMPLE_POKEMON,
         status=200,
     )
-    responses.add(
-        responses.GET,
-        "https://pokeapi.co/api/v2/pokemon/999",
-        json=SAMPLE_POKEMON,
-        status=200,
-    )
 
     first_pokemon = pypokedex.get(name="sample")
-    second_pokemon = pypokedex.get(dex=999)
+    second_pokemon = Pokemon(deepcopy(SAMPLE_POKEMON))
     assert first_pokemon == second_pokemon
 
 
@@ -385,6 +386,83 @@ def test_404_pokemon_not_found(responses):
     assert not_found.value.http_code == 404
 
 
+def test_404s_are_remembered(responses):
+    responses.add(
+        responses.GET, "https://pokeapi.co/api/v2/pokemon/sample", json={}, status=404
+    )
+
+    for _ in range(3):
+        with pytest.raises(PyPokedexHTTPError) as not_found:
+            pypokedex.get(name="Sample")
+        assert not_found.value.http_code == 404
+
+    assert len(responses.calls) == 1
+
+    set_not_found_ttl(0)
+    try:
+        with pytest.raises(PyPokedexHTTPError):
+            pypokedex.get(name="sample")
+        assert len(responses.calls) == 2
+    finally:
+        set_not_found_ttl(60)
+
+
+def test_concurrent_gets_share_one_request(responses):
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_response(request):
+        started.set()
+        release.wait(5)
+        return 200, {}, json.dumps(SAMPLE_POKEMON)
+
+    responses.add_callback(
+        responses.GET, "https://pokeapi.co/api/v2/pokemon/sample", slow_response
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        leader = executor.submit(pypokedex.get, name="sample")
+        started.wait(5)
+        followers = [executor.submit(pypokedex.get, name="sample") for _ in range(7)]
+        time.sleep(0.05)
+        release.set()
+
+        results = [leader.result()] + [future.result() for future in followers]
+
+    assert all(pokemon is results[0] for pokemon in results)
+    assert len(responses.calls) == 1
+
+
+def test_concurrent_descriptions_share_one_request(responses):
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_response(request):
+        started.set()
+        release.wait(5)
+        return 200, {}, json.dumps(SAMPLE_DESCRIPTIONS)
+
+    responses.add_callback(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon-species/999",
+        slow_response,
+    )
+    pokemon = Pokemon(deepcopy(SAMPLE_POKEMON))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        leader = executor.submit(pokemon.get_descriptions)
+        started.wait(5)
+        followers = [executor.submit(pokemon.get_descriptions) for _ in range(7)]
+        time.sleep(0.05)
+        release.set()
+
+        results = [leader.result()] + [future.result() for future in followers]
+
+    assert all(result == results[0] for result in results)
+    assert results[0]["game a"] == "text a"
+    assert len(responses.calls) == 1
+
+
 def test_other_HTTP_errors(responses):
     responses.add(
         responses.GET, "https://pokeapi.co/api/v2/pokemon/sample", json={}, status=408
@@ -460,3 +538,229 @@ def test_missing_data_keys_for_pokemon(responses):
 
     with pytest.raises(PyPokedexError):
         pypokedex.get(name="sample")
+
+
+def test_name_and_dex_share_cache_entry(responses):
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/sample",
+        json=SAMPLE_POKEMON,
+        status=200,
+    )
+
+    first_pokemon = pypokedex.get(name="Sample")
+    second_pokemon = pypokedex.get(dex=999)
+    third_pokemon = pypokedex.get(name="sample")
+
+    assert first_pokemon is second_pokemon is third_pokemon
+    assert len(responses.calls) == 1
+
+    info = pypokedex.get.cache_info()
+    assert info.hits == 2
+    assert info.misses == 1
+    assert info.currsize == 1
+    # Same order as functools.lru_cache's CacheInfo
+    assert info[:4] == (2, 1, 256, 1)
+
+
+def test_custom_cache_eviction(responses):
+    cloned_sample_pokemon = deepcopy(SAMPLE_POKEMON)
+    cloned_sample_pokemon["id"] = 998
+    for dex, data in [(998, cloned_sample_pokemon), (999, SAMPLE_POKEMON)]:
+        responses.add(
+            responses.GET,
+            f"https://pokeapi.co/api/v2/pokemon/{dex}",
+            json=data,
+            status=200,
+        )
+
+    previous_cache = pypokedex.api.get_cache()
+    pypokedex.api.set_cache(Cache(maxsize=1))
+    try:
+        pypokedex.get(dex=998)
+        pypokedex.get(dex=999)
+        pypokedex.get(dex=998)
+
+        assert len(responses.calls) == 3
+        assert pypokedex.get.cache_info().evictions == 2
+    finally:
+        pypokedex.api.set_cache(previous_cache)
+
+
+def test_cache_accounts_for_parsed_pokemon(responses):
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/999",
+        json=SAMPLE_POKEMON,
+        status=200,
+    )
+
+    previous_cache = pypokedex.api.get_cache()
+    pypokedex.api.set_cache(Cache(max_bytes=10 * 1024 * 1024))
+    try:
+        pokemon = pypokedex.get(dex=999)
+        unparsed_bytes = pypokedex.get.cache_info().currbytes
+
+        pokemon.moves
+        pokemon.sprites
+        assert pypokedex.get.cache_info().currbytes == deep_getsizeof(pokemon)
+        assert pypokedex.get.cache_info().currbytes != unparsed_bytes
+    finally:
+        pypokedex.api.set_cache(previous_cache)
+
+
+def test_moves_and_sprites_are_parsed_lazily():
+    cloned_sample_pokemon = deepcopy(SAMPLE_POKEMON)
+    cloned_sample_pokemon["moves"] = [{"move": {"name": "move_1"}}]
+    cloned_sample_pokemon["sprites"] = {"not a sprite key": "url"}
+
+    pokemon = Pokemon(cloned_sample_pokemon)
+    assert pokemon.types == ["type_1", "type_2"]
+
+    with pytest.raises(PyPokedexError):
+        pokemon.moves
+
+    with pytest.raises(PyPokedexError):
+        pokemon.sprites
+
+
+def test_version_sprites_ignore_gen_5_animated_sprites():
+    cloned_sample_pokemon = deepcopy(SAMPLE_POKEMON)
+    black_white = {"front_default": "front_url", "animated": {"front_default": "gif"}}
+    cloned_sample_pokemon["sprites"]["versions"] = {
+        "generation-v": {"black-white": black_white}
+    }
+    cloned_sample_pokemon["sprites"]["other"] = {"home": {"front_default": "home"}}
+
+    pokemon = Pokemon(cloned_sample_pokemon)
+
+    assert pokemon.version_sprites == {
+        "generation-v": {
+            "black-white": Sprites(front={"default": "front_url"}, back={})
+        }
+    }
+    assert pokemon.other_sprites == {
+        "home": Sprites(front={"default": "home"}, back={})
+    }
+    assert "animated" in black_white
+
+
+def test_pokemon_data_is_shared_between_instances():
+    first_pokemon = Pokemon(deepcopy(SAMPLE_POKEMON))
+    second_pokemon = Pokemon(deepcopy(SAMPLE_POKEMON))
+
+    assert not hasattr(first_pokemon, "__dict__")
+    assert first_pokemon.types[0] is second_pokemon.types[0]
+    assert first_pokemon.moves["game_1"][0] is second_pokemon.moves["game_1"][0]
+
+
+def test_pokemon_learnable_in():
+    pokemon = Pokemon(deepcopy(SAMPLE_POKEMON))
+
+    assert pokemon.learnable_in("move_1") == {
+        "game_1": [Move("move_1", "tutor", None)],
+        "game_2": [Move("move_1", "level-up", 5)],
+    }
+    assert pokemon.learnable_in("random move") == {}
+
+    pokemon.learnable_in("move_1")["game_1"].append(Move("move_1", "egg", None))
+    assert pokemon.learnable_in("move_1")["game_1"] == [Move("move_1", "tutor", None)]
+
+
+def test_move_queries_after_reading_an_unknown_game():
+    pokemon = Pokemon(deepcopy(SAMPLE_POKEMON))
+    pokemon.learns("move_1", "game_1")
+
+    # moves is a defaultdict, so reading a game it doesn't have adds it
+    assert pokemon.moves["game_3"] == []
+    assert not pokemon.learns("move_1", "game_3")
+    assert pokemon.moves_learned_by_level("game_3", 100) == []
+
+
+def test_pokemon_moves_learned_by_level():
+    cloned_sample_pokemon = deepcopy(SAMPLE_POKEMON)
+    cloned_sample_pokemon["moves"].append(
+        {
+            "move": {"name": "move_2"},
+            "version_group_details": [
+                {
+                    "level_learned_at": 1,
+                    "move_learn_method": {"name": "level-up"},
+                    "version_group": {"name": "game_2"},
+                }
+            ],
+        }
+    )
+    pokemon = Pokemon(cloned_sample_pokemon)
+
+    assert pokemon.moves_learned_by_level("game_2", 4) == [
+        Move("move_2", "level-up", 1)
+    ]
+    assert pokemon.moves_learned_by_level("game_2", 5) == [
+        Move("move_2", "level-up", 1),
+        Move("move_1", "level-up", 5),
+    ]
+    assert pokemon.moves_learned_by_level("game_1", 100) == []
+
+    with pytest.raises(PyPokedexError):
+        pokemon.moves_learned_by_level("random game", 100)
+
+
+def test_pokemon_species_is_fetched_once(responses):
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon-species/999",
+        json=SAMPLE_DESCRIPTIONS,
+        status=200,
+    )
+
+    pokemon = Pokemon(deepcopy(SAMPLE_POKEMON))
+
+    assert pokemon.get_descriptions("en") == {"game a": "text a", "game b": "text b"}
+    assert pokemon.get_descriptions("other") == {"game a": "text c"}
+    assert pokemon.get_all_descriptions(["en", "other", "unknown"]) == {
+        "en": {"game a": "text a", "game b": "text b"},
+        "other": {"game a": "text c"},
+        "unknown": {},
+    }
+    assert set(pokemon.get_all_descriptions()) == {"en", "other"}
+    assert len(responses.calls) == 1
+
+
+def test_pokemon_serialization_round_trip():
+    pokemon = Pokemon(deepcopy(SAMPLE_POKEMON))
+    pokemon._load_descriptions(SAMPLE_DESCRIPTIONS)
+
+    serialized = pokemon.to_bytes()
+    copies = [Pokemon.from_bytes(serialized), pickle.loads(pickle.dumps(pokemon))]
+
+    for copy in copies:
+        assert _is_properly_initialized_pokemon(copy)
+        assert copy.other_sprites == pokemon.other_sprites
+        assert copy.version_sprites == pokemon.version_sprites
+        assert copy.get_all_descriptions() == pokemon.get_all_descriptions()
+        assert copy.learns("move_1", "game_2")
+        assert copy.moves["game_1"][0] is pokemon.moves["game_1"][0]
+
+    assert len(serialized) < len(json.dumps(SAMPLE_POKEMON))
+
+
+def test_pokemon_serialization_without_descriptions(responses):
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon-species/999",
+        json=SAMPLE_DESCRIPTIONS,
+        status=200,
+    )
+
+    pokemon = Pokemon.from_bytes(Pokemon(deepcopy(SAMPLE_POKEMON)).to_bytes())
+
+    assert pokemon.get_descriptions("other") == {"game a": "text c"}
+
+
+def test_malformed_serialized_pokemon():
+    serialized = Pokemon(deepcopy(SAMPLE_POKEMON)).to_bytes()
+
+    for data in [b"", b"XXXX\x01" + serialized[5:], serialized[:-10]]:
+        with pytest.raises(PyPokedexError):
+            Pokemon.from_bytes(data)
@@ -0,0 +1,46 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pypokedex.ratelimit import TokenBucket
+
+
+def test_bursts_are_allowed_up_to_the_limit():
+    bucket = TokenBucket(rate=10, burst=3)
+
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_tokens_are_refilled_over_time():
+    bucket = TokenBucket(rate=100)
+    bucket.reserve()
+    time.sleep(0.02)
+
+    assert bucket.reserve() == 0
+
+
+def test_bucket_is_shared_by_threads_and_tasks():
+    bucket = TokenBucket(rate=200, burst=1)
+    start = time.monotonic()
+
+    async def acquire_many():
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(10)))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for _ in range(10):
+            executor.submit(bucket.acquire)
+        asyncio.run(acquire_many())
+
+    # 20 requests at 200 per second, the first of which is immediate
+    assert time.monotonic() - start >= 19 / 200
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0)
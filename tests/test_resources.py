@@ -0,0 +1,126 @@
+import pytest
+
+from pypokedex import resources
+from pypokedex.exceptions import PyPokedexHTTPError
+from pypokedex.pokemon import Ability, Move, Pokemon
+
+from tests.sample_pokemon import SAMPLE_POKEMON
+from tests.fixtures import responses  # noqa: F401
+
+SAMPLE_MOVE = {
+    "id": 33,
+    "name": "tackle",
+    "type": {"name": "normal", "url": ""},
+    "damage_class": {"name": "physical", "url": ""},
+    "power": 40,
+    "accuracy": 100,
+    "pp": 35,
+    "priority": 0,
+    "effect_entries": [
+        {
+            "effect": "Inflicts regular damage.",
+            "short_effect": "Inflicts regular damage with no additional effect.",
+            "language": {"name": "en", "url": ""},
+        }
+    ],
+}
+
+SAMPLE_TYPE = {
+    "id": 10,
+    "name": "fire",
+    "damage_relations": {
+        "double_damage_to": [{"name": "grass", "url": ""}],
+        "half_damage_to": [{"name": "water", "url": ""}],
+        "no_damage_to": [],
+        "double_damage_from": [{"name": "water", "url": ""}],
+        "half_damage_from": [{"name": "grass", "url": ""}],
+        "no_damage_from": [],
+    },
+}
+
+
+@pytest.fixture
+def resource_cache():
+    resources.get_cache().clear()
+    yield
+    resources.get_cache().clear()
+
+
+def test_get_move(responses, resource_cache):
+    responses.add(
+        responses.GET, "https://pokeapi.co/api/v2/move/tackle", json=SAMPLE_MOVE
+    )
+
+    move = resources.get_move("Tackle")
+
+    assert move.id == 33
+    assert move.type == "normal"
+    assert move.damage_class == "physical"
+    assert move.power == 40
+    assert move.short_effect == "Inflicts regular damage with no additional effect."
+
+    # Name and id lookups share one entry
+    assert resources.get_move(33) is move
+    assert len(responses.calls) == 1
+
+
+def test_entries_resolve_through_the_cache(responses, resource_cache):
+    responses.add(
+        responses.GET, "https://pokeapi.co/api/v2/move/tackle", json=SAMPLE_MOVE
+    )
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/ability/ability_1",
+        json={
+            "id": 1,
+            "name": "ability_1",
+            "is_main_series": True,
+            "effect_entries": [],
+        },
+    )
+    responses.add(
+        responses.GET, "https://pokeapi.co/api/v2/type/type_1", json=SAMPLE_TYPE
+    )
+    responses.add(
+        responses.GET, "https://pokeapi.co/api/v2/type/type_2", json=SAMPLE_TYPE
+    )
+
+    assert Move("tackle", "level-up", 1).details().power == 40
+    assert Move("tackle", "machine", None).details().power == 40
+    assert Ability("ability_1", True).details().effect is None
+
+    types = Pokemon(SAMPLE_POKEMON).type_details()
+    assert [type_.double_damage_to for type_ in types] == [("grass",), ("grass",)]
+
+    assert len(responses.calls) == 4
+
+
+def test_get_many_fetches_each_resource_once(responses, resource_cache):
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/version-group/red-blue",
+        json={
+            "id": 1,
+            "name": "red-blue",
+            "order": 1,
+            "generation": {"name": "generation-i", "url": ""},
+            "versions": [{"name": "red", "url": ""}, {"name": "blue", "url": ""}],
+        },
+    )
+
+    groups = resources.get_many(resources.VERSION_GROUP, ["red-blue"] * 20, workers=8)
+
+    assert all(group is groups[0] for group in groups)
+    assert groups[0].versions == ("red", "blue")
+    assert len(responses.calls) == 1
+
+
+def test_resource_errors(responses, resource_cache):
+    responses.add(responses.GET, "https://pokeapi.co/api/v2/move/nothing", status=404)
+
+    with pytest.raises(PyPokedexHTTPError) as not_found:
+        resources.get_move("nothing")
+    assert str(not_found.value) == "The requested move was not found!"
+
+    with pytest.raises(ValueError):
+        resources.get_resource("berry", 1)
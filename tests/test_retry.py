@@ -0,0 +1,57 @@
+import time
+from email.utils import formatdate
+
+import pytest
+
+from pypokedex.retry import RetryPolicy, parse_retry_after
+
+
+def test_should_retry():
+    policy = RetryPolicy(retries=2)
+
+    assert policy.should_retry(0, 503)
+    assert policy.should_retry(1, None)
+    assert not policy.should_retry(2, 503)
+    assert not policy.should_retry(0, 404)
+
+
+def test_exponential_backoff_with_jitter():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=0.5)
+
+    for attempt, backoff in enumerate([1, 2, 4, 5, 5]):
+        delay = policy.delay(attempt)
+        assert backoff / 2 <= delay <= backoff
+
+    assert RetryPolicy(backoff_factor=1, jitter=0).delay(2) == 4
+
+
+def test_retry_after_takes_precedence():
+    policy = RetryPolicy(backoff_factor=1)
+
+    assert policy.delay(0, "7") == 7
+    assert policy.delay(0, "soon") <= 1
+    assert RetryPolicy(respect_retry_after=False, jitter=0).delay(0, "7") == 0.5
+
+
+def test_retry_after_is_capped():
+    assert RetryPolicy().delay(0, "86400") == 60
+    assert RetryPolicy(max_retry_after=5).delay(0, "7") == 5
+    assert RetryPolicy(backoff_factor=1, jitter=0).delay(0, "inf") == 1
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("-1") == 0
+    assert parse_retry_after("not a date") is None
+    assert parse_retry_after("inf") is None
+    assert parse_retry_after("nan") is None
+    assert parse_retry_after(formatdate(time.time() + 60, usegmt=True)) == (
+        pytest.approx(60, abs=2)
+    )
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        RetryPolicy(retries=-1)
+    with pytest.raises(ValueError):
+        RetryPolicy(jitter=2)
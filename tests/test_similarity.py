@@ -0,0 +1,94 @@
+import pytest
+
+from pypokedex import BaseStats
+from pypokedex.pokedex import Pokedex
+from pypokedex.similarity import METRICS, Neighbor, StatIndex
+
+from tests.fixtures import numpy, sample_pokemon, use_numpy  # noqa: F401
+
+STAT_NAMES = ["hp", "attack", "defense", "special-attack", "special-defense", "speed"]
+
+
+def _pokemon(dex, stats, height, weight):
+    return sample_pokemon(
+        dex, dict(zip(STAT_NAMES, stats)), height=height, weight=weight
+    )
+
+
+POKEMON = [
+    _pokemon(1, [45, 49, 49, 65, 65, 45], 7, 69),
+    _pokemon(4, [39, 52, 43, 60, 50, 65], 6, 85),
+    _pokemon(7, [44, 48, 65, 50, 64, 43], 5, 90),
+    _pokemon(150, [106, 110, 90, 154, 90, 130], 20, 1220),
+    _pokemon(151, [100, 100, 100, 100, 100, 100], 4, 40),
+]
+
+
+def test_nearest_to_pokemon(use_numpy):
+    index = StatIndex.from_pokemon(POKEMON, use_numpy=use_numpy)
+    neighbors = index.nearest(POKEMON[0], k=2)
+
+    assert len(index) == 5
+    assert [neighbor.dex for neighbor in neighbors] == [7, 4]
+    assert neighbors[0][:2] == (7, "sample-7")
+    assert neighbors[0].distance == pytest.approx(488**0.5)
+
+
+def test_nearest_to_target_spread(use_numpy):
+    index = StatIndex.from_pokemon(POKEMON, use_numpy=use_numpy)
+
+    neighbors = index.nearest(BaseStats(100, 100, 100, 100, 100, 100), k=1)
+    assert neighbors == [Neighbor(151, "sample-151", 0.0)]
+
+    assert [n.dex for n in index.nearest([110] * 6, k=10)] == [151, 150, 1, 7, 4]
+
+    with pytest.raises(ValueError):
+        index.nearest([100] * 8)
+    with pytest.raises(ValueError):
+        index.nearest(POKEMON[0], metric="hamming")
+
+
+@pytest.mark.parametrize("metric", METRICS)
+def test_metrics_agree_between_backends(metric):
+    results = [
+        StatIndex.from_pokemon(POKEMON, use_numpy=backend).nearest(
+            POKEMON[1], k=4, metric=metric
+        )
+        for backend in ([False, True] if numpy is not None else [False])
+    ]
+
+    for neighbors in results:
+        assert [n.dex for n in neighbors] == [n.dex for n in results[0]]
+        assert [n.distance for n in neighbors] == pytest.approx(
+            [n.distance for n in results[0]]
+        )
+
+
+def test_cosine_ignores_magnitude(use_numpy):
+    index = StatIndex.from_pokemon(POKEMON, use_numpy=use_numpy)
+
+    assert index.nearest([50] * 6, k=1, metric="cosine")[0].dex == 151
+    assert index.nearest([50] * 6, k=1, metric="euclidean")[0].dex != 151
+
+
+def test_size_features_are_standardized(use_numpy):
+    index = StatIndex.from_pokemon(POKEMON, include_size=True, use_numpy=use_numpy)
+
+    assert index.features[-2:] == ("height", "weight")
+    # Without standardization, Mewtwo's weight would dwarf every stat
+    assert index.nearest(POKEMON[3], k=1)[0].dex == 151
+    assert len(index.nearest(BaseStats(*[100] * 6) + (4, 40), k=5)) == 5
+
+
+def test_from_pokedex(use_numpy):
+    pokedex = Pokedex.from_pokemon(POKEMON, use_numpy=use_numpy)
+    from_pokedex = StatIndex.from_pokedex(pokedex, include_size=True)
+    from_pokemon = StatIndex.from_pokemon(POKEMON, include_size=True)
+
+    assert from_pokedex.nearest(POKEMON[2]) == from_pokemon.nearest(POKEMON[2])
+    assert (
+        StatIndex.from_pokedex(pokedex.where("speed", ">", 60))
+        .nearest(POKEMON[0])[0]
+        .dex
+        == 4
+    )
@@ -0,0 +1,88 @@
+from copy import deepcopy
+
+import pytest
+
+import pypokedex
+from pypokedex.exceptions import PyPokedexError
+from pypokedex.snapshot import Snapshot, build_snapshot, use_snapshot, write_snapshot
+
+from tests.sample_pokemon import SAMPLE_POKEMON, SAMPLE_DESCRIPTIONS
+from tests.fixtures import responses  # noqa: F401
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    yield tmp_path / "dex.snapshot"
+    use_snapshot(None)
+
+
+def test_snapshot_serves_get_without_network(responses, snapshot_path):
+    other_pokemon = deepcopy(SAMPLE_POKEMON)
+    other_pokemon.update(id=1, name="other")
+    write_snapshot(
+        snapshot_path,
+        [(SAMPLE_POKEMON, SAMPLE_DESCRIPTIONS), (other_pokemon, None)],
+    )
+
+    snapshot = use_snapshot(snapshot_path)
+
+    assert snapshot is not None
+    assert len(snapshot) == 2
+    assert snapshot.dex_numbers() == [1, 999]
+    assert "other" in snapshot
+    assert 2 not in snapshot
+
+    pokemon = pypokedex.get(name="sample")
+    assert pokemon.dex == 999
+    assert pokemon.moves["game_2"] == [pypokedex.Move("move_1", "level-up", 5)]
+    assert pokemon.get_descriptions(language="other") == {"game a": "text c"}
+    assert pypokedex.get(dex=1).name == "other"
+    assert len(responses.calls) == 0
+
+
+def test_pokemon_missing_from_snapshot_are_fetched(responses, snapshot_path):
+    other_pokemon = deepcopy(SAMPLE_POKEMON)
+    other_pokemon.update(id=1, name="other")
+    write_snapshot(snapshot_path, [(other_pokemon, None)])
+    use_snapshot(snapshot_path)
+
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/999",
+        json=SAMPLE_POKEMON,
+        status=200,
+    )
+
+    assert pypokedex.get(dex=999).name == "sample"
+
+
+def test_build_snapshot(responses, snapshot_path):
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon/999",
+        json=SAMPLE_POKEMON,
+        status=200,
+    )
+    responses.add(
+        responses.GET,
+        "https://pokeapi.co/api/v2/pokemon-species/999",
+        json=SAMPLE_DESCRIPTIONS,
+        status=200,
+    )
+
+    build_snapshot(snapshot_path, dex=[999])
+    snapshot = Snapshot(snapshot_path)
+
+    pokemon_json = snapshot.pokemon_json("sample")
+    assert pokemon_json is not None
+    assert pokemon_json["name"] == "sample"
+    assert snapshot.species_json(999) == SAMPLE_DESCRIPTIONS
+    snapshot.close()
+
+
+def test_invalid_snapshot_file(tmp_path):
+    path = tmp_path / "invalid.snapshot"
+    path.write_bytes(b"definitely not a snapshot, but long enough to have a header")
+
+    with pytest.raises(PyPokedexError):
+        Snapshot(path)
@@ -0,0 +1,117 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import requests
+
+from pypokedex import Pokemon
+from pypokedex.client import Client, get_client, set_client
+from pypokedex.exceptions import PyPokedexHTTPError
+from pypokedex.sprites import SpriteCache, download_sprites, sprite_urls
+
+from tests.fixtures import responses, sample_pokemon  # noqa: F401
+
+SPRITES_URL = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites"
+
+
+def _pokemon() -> Pokemon:
+    sprites = {
+        "front_default": f"{SPRITES_URL}/pokemon/999.png",
+        "back_default": f"{SPRITES_URL}/pokemon/back/999.png",
+        "front_shiny": None,
+        "other": {
+            "official-artwork": {"front_default": f"{SPRITES_URL}/artwork/999.png"}
+        },
+        "versions": {
+            "generation-i": {
+                "red-blue": {"front_default": f"{SPRITES_URL}/pokemon/999.png"}
+            }
+        },
+    }
+    return sample_pokemon(sprites=sprites)
+
+
+def test_sprite_urls():
+    pokemon = _pokemon()
+
+    assert sprite_urls(pokemon) == [
+        f"{SPRITES_URL}/pokemon/999.png",
+        f"{SPRITES_URL}/pokemon/back/999.png",
+        f"{SPRITES_URL}/artwork/999.png",
+    ]
+    assert sprite_urls(pokemon, groups=["official-artwork"]) == [
+        f"{SPRITES_URL}/artwork/999.png"
+    ]
+    assert sprite_urls(pokemon, groups=["generation-i"]) == [
+        f"{SPRITES_URL}/pokemon/999.png"
+    ]
+
+
+def test_download_sprites(responses, tmp_path):
+    for path in ["pokemon/999.png", "pokemon/back/999.png"]:
+        responses.add(responses.GET, f"{SPRITES_URL}/{path}", body=b"image data")
+    responses.add(responses.GET, f"{SPRITES_URL}/artwork/999.png", body=b"artwork")
+
+    cache = SpriteCache(tmp_path)
+    downloads = download_sprites(_pokemon(), cache, workers=4)
+
+    assert [download.error for download in downloads] == [None] * 3
+    # Identical images are only stored once
+    assert downloads[0].path == downloads[1].path != downloads[2].path
+    assert downloads[2].path is not None
+    with open(downloads[2].path, "rb") as image:
+        assert image.read() == b"artwork"
+    assert len(os.listdir(tmp_path / "objects")) == 2
+
+    # Images in the cache aren't downloaded again
+    assert download_sprites(_pokemon(), SpriteCache(tmp_path)) == downloads
+    assert len(responses.calls) == 3
+
+
+def test_download_errors(responses, tmp_path):
+    previous_client = get_client()
+    set_client(Client(retries=1, backoff_factor=0))
+    responses.add(responses.GET, f"{SPRITES_URL}/missing.png", status=404)
+    responses.add(
+        responses.GET,
+        f"{SPRITES_URL}/broken.png",
+        body=requests.exceptions.ConnectionError("Some error"),
+    )
+
+    cache = SpriteCache(tmp_path)
+    try:
+        missing, broken = download_sprites(
+            [f"{SPRITES_URL}/missing.png", f"{SPRITES_URL}/broken.png"], cache
+        )
+    finally:
+        set_client(previous_client)
+
+    assert isinstance(missing.error, PyPokedexHTTPError)
+    assert missing.error.http_code == 404
+    assert broken.error is not None and broken.path is None
+    assert f"{SPRITES_URL}/missing.png" not in cache
+    assert os.listdir(tmp_path / "objects") == []
+
+
+def test_download_duplicate_urls(responses, tmp_path):
+    urls = [f"{SPRITES_URL}/{name}.png" for name in ["a", "b", "a", "c", "b"]]
+    for url in set(urls):
+        responses.add(responses.GET, url, body=url.encode("utf-8"))
+
+    downloads = download_sprites(urls, SpriteCache(tmp_path))
+
+    assert [download.url for download in downloads] == urls
+    assert downloads[0] == downloads[2] and downloads[1] == downloads[4]
+    assert len(responses.calls) == 3
+
+
+def test_concurrent_stores_of_one_url(tmp_path):
+    cache = SpriteCache(tmp_path)
+    url = f"{SPRITES_URL}/pokemon/999.png"
+
+    with ThreadPoolExecutor(8) as executor:
+        paths = set(
+            executor.map(lambda _: cache.store(url, [b"image data"]), range(50))
+        )
+
+    assert len(paths) == 1
+    assert cache.path_for(url) in paths
+    assert len(os.listdir(tmp_path / "urls")) == 1
@@ -0,0 +1,101 @@
+import pytest
+
+from pypokedex import resources
+from pypokedex.type_chart import TYPES, TypeChart
+
+from tests.fixtures import responses, use_numpy  # noqa: F401
+
+ROSTER = [["fire", "flying"], ["water"], ["grass", "poison"], ["electric"]]
+
+
+def _rows(values):
+    return [[float(value) for value in row] for row in values]
+
+
+@pytest.fixture
+def chart(use_numpy):
+    return TypeChart.bundled(use_numpy=use_numpy)
+
+
+def test_multiplier(chart):
+    assert chart.multiplier("ground", ["fire", "flying"]) == 0
+    assert chart.multiplier("ice", ["grass", "dragon"]) == 4
+    assert chart.multiplier("fire", ["water"]) == 0.5
+    assert chart.multiplier("normal", ["psychic"]) == 1
+
+    with pytest.raises(ValueError):
+        chart.multiplier("shadow", ["normal"])
+
+
+def test_defensive(chart):
+    multipliers = _rows(chart.defensive(ROSTER))
+
+    assert len(multipliers) == 4
+    for pokemon, row in zip(ROSTER, multipliers):
+        assert row == [chart.multiplier(type_, pokemon) for type_ in TYPES]
+
+
+def test_offensive(chart):
+    multipliers = _rows(chart.offensive([["fire", "flying"], ["electric"]]))
+
+    assert multipliers[0][TYPES.index("grass")] == 2
+    assert multipliers[0][TYPES.index("fighting")] == 2
+    assert multipliers[0][TYPES.index("water")] == 1
+    assert multipliers[1][TYPES.index("ground")] == 0
+
+
+def test_team_coverage(chart):
+    coverage = chart.team_coverage(ROSTER, [[0, 1, 2], [1, 3, 0], [1, 3, 2]])
+
+    assert list(coverage.super_effective) == [10, 10, 7]
+    assert list(coverage.uncovered_weaknesses) == [4, 2, 2]
+    assert _rows(coverage.weaknesses)[0][TYPES.index("rock")] == 1
+    assert _rows(coverage.resistances)[0][TYPES.index("fire")] == 2
+    assert _rows(coverage.offense)[1][TYPES.index("water")] == 2
+
+
+def test_invalid_charts():
+    with pytest.raises(ValueError):
+        TypeChart([[1.0] * 18] * 17)
+    with pytest.raises(ValueError):
+        TypeChart.bundled().defensive([["fire", "flying", "water"]])
+
+
+def test_fetched_chart_matches_bundled_chart(responses):
+    resources.get_cache().clear()
+    bundled = TypeChart.bundled(use_numpy=False)
+
+    for type_id, type_ in enumerate(TYPES, 1):
+        responses.add(
+            responses.GET,
+            f"https://pokeapi.co/api/v2/type/{type_}",
+            json={
+                "id": type_id,
+                "name": type_,
+                "damage_relations": {
+                    f"{relation}_{direction}": [
+                        {"name": other, "url": ""}
+                        for other in TYPES
+                        if (
+                            bundled.multiplier(type_, [other])
+                            if direction == "to"
+                            else bundled.multiplier(other, [type_])
+                        )
+                        == value
+                    ]
+                    for relation, value in [
+                        ("double_damage", 2),
+                        ("half_damage", 0.5),
+                        ("no_damage", 0),
+                    ]
+                    for direction in ["to", "from"]
+                },
+            },
+        )
+
+    try:
+        fetched = TypeChart.fetch(use_numpy=False)
+    finally:
+        resources.get_cache().clear()
+
+    assert _rows(fetched.defensive(ROSTER)) == _rows(bundled.defensive(ROSTER))
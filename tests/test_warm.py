@@ -0,0 +1,92 @@
+import json
+import re
+
+import pytest
+
+from pypokedex.cli import main
+from pypokedex.client import get_disk_cache, set_disk_cache
+from pypokedex.exceptions import PyPokedexError
+from pypokedex.warm import Checkpoint, parse_range, warm
+
+from tests.sample_pokemon import SAMPLE_DESCRIPTIONS
+from tests.fixtures import responses, sample_document  # noqa: F401
+
+
+def _add_dex(responses, missing=()):
+    def pokemon(request):
+        dex = int(request.url.rsplit("/", 1)[-1])
+        if dex in missing:
+            return 404, {}, "{}"
+        return 200, {}, json.dumps(sample_document(dex))
+
+    responses.add_callback(
+        responses.GET, re.compile(r"https://pokeapi.co/api/v2/pokemon/\d+"), pokemon
+    )
+    responses.add(
+        responses.GET,
+        re.compile(r"https://pokeapi.co/api/v2/pokemon-species/\d+"),
+        json=SAMPLE_DESCRIPTIONS,
+    )
+
+
+def test_parse_range():
+    assert parse_range("1-3,7, 2") == [1, 2, 3, 7]
+
+    for text in ["", "0-3", "5-1", "a-b"]:
+        with pytest.raises(ValueError):
+            parse_range(text)
+
+
+def test_warm_resumes_from_checkpoint(responses, tmp_path):
+    _add_dex(responses, missing={4})
+    checkpoint = Checkpoint(str(tmp_path / "checkpoint"))
+    progress = []
+
+    summary = warm(
+        range(1, 6),
+        workers=3,
+        checkpoint=checkpoint,
+        progress=lambda *counts: progress.append(counts),
+    )
+
+    assert summary.requested == 5
+    assert summary.succeeded == 4
+    assert list(summary.failed) == [4]
+    assert progress[-1] == (4, 1, 5)
+    assert len(responses.calls) == 9
+
+    # Only the failed dex number is tried again (and its 404 was remembered)
+    summary = warm(range(1, 6), checkpoint=Checkpoint(checkpoint.path))
+
+    assert summary.skipped == 4
+    assert list(summary.failed) == [4]
+    assert len(responses.calls) == 9
+
+
+def test_invalid_checkpoint(tmp_path):
+    path = tmp_path / "checkpoint"
+    path.write_text("[]")
+
+    with pytest.raises(PyPokedexError):
+        Checkpoint(str(path))
+
+
+def test_warm_command(responses, tmp_path, capsys):
+    _add_dex(responses)
+    disk_cache = str(tmp_path / "cache.sqlite3")
+
+    try:
+        assert main(["warm", "--range", "1-3", "--disk-cache", disk_cache]) == 0
+        cache = get_disk_cache()
+        assert cache is not None
+        for dex in range(1, 4):
+            assert f"https://pokeapi.co/api/v2/pokemon/{dex}" in cache
+            assert f"https://pokeapi.co/api/v2/pokemon-species/{dex}" in cache
+    finally:
+        cache = get_disk_cache()
+        if cache is not None:
+            cache.close()
+        set_disk_cache(None)
+
+    assert "Warmed 3 Pokemon" in capsys.readouterr().out
+    assert Checkpoint(f"{disk_cache}.checkpoint").completed == {1, 2, 3}